@@ -15,6 +15,39 @@ test.describe('API Proxy', () => {
     });
   });
 
+  test('should pass sparse fieldset parameters through to the backend', async ({ request }) => {
+    await test.step('Fetch only titles via proxy', async () => {
+      const response = await request.get('/api/games?fields=title');
+      expect(response.status()).toBe(200);
+
+      const data = await response.json();
+      expect(Object.keys(data.games[0]).sort()).toEqual(['id', 'title']);
+    });
+  });
+
+  test('should pass compressed responses through with their encoding', async ({ request }) => {
+    await test.step('Fetch a listing that accepts gzip via proxy', async () => {
+      const response = await request.get('/api/games', { headers: { 'Accept-Encoding': 'gzip' } });
+      expect(response.status()).toBe(200);
+      expect(response.headers()['content-encoding']).toBe('gzip');
+      expect(response.headers()['vary']).toContain('Accept-Encoding');
+
+      const data = await response.json();
+      expect(data.games.length).toBeGreaterThan(0);
+    });
+  });
+
+  test('should resolve several games by id in one request', async ({ request }) => {
+    await test.step('Fetch a batch of games via proxy', async () => {
+      const response = await request.get('/api/games?ids=2,1,99999');
+      expect(response.status()).toBe(200);
+
+      const data = await response.json();
+      expect(data.games.map((game: { id: number }) => game.id)).toEqual([2, 1]);
+      expect(data.missing).toEqual([99999]);
+    });
+  });
+
   test('should proxy GET /api/games/:id and return a single game', async ({ request }) => {
     await test.step('Fetch a specific game via proxy', async () => {
       const response = await request.get('/api/games/1');
@@ -66,4 +99,24 @@ test.describe('API Proxy', () => {
       }
     });
   });
+
+  test('should forward conditional requests and return 304 when unchanged', async ({ request }) => {
+    const etag = await test.step('Fetch games list and read its ETag', async () => {
+      const response = await request.get('/api/games');
+      expect(response.status()).toBe(200);
+
+      const etag = response.headers()['etag'];
+      expect(etag).toBeTruthy();
+      expect(response.headers()['last-modified']).toBeTruthy();
+      return etag;
+    });
+
+    await test.step('Revalidate with If-None-Match', async () => {
+      const response = await request.get('/api/games', {
+        headers: { 'If-None-Match': etag },
+      });
+      expect(response.status()).toBe(304);
+      expect(response.headers()['etag']).toBe(etag);
+    });
+  });
 });
@@ -1,26 +1,83 @@
 import type { APIRoute } from 'astro';
+import http from 'node:http';
+import https from 'node:https';
+import { Readable } from 'node:stream';
 
 const API_SERVER_URL = process.env.API_SERVER_URL || 'http://localhost:5100';
 
+// Statuses that must not carry a response body
+const NULL_BODY_STATUSES = new Set([204, 304]);
+
+// Connection-level headers that apply to a single hop only
+const HOP_BY_HOP_HEADERS = new Set([
+  'connection', 'keep-alive', 'proxy-connection', 'transfer-encoding', 'upgrade', 'host',
+]);
+
+function forwardableHeaders(headers: Iterable<[string, string]>): http.OutgoingHttpHeaders {
+  const forwarded: http.OutgoingHttpHeaders = {};
+  for (const [name, value] of headers) {
+    if (!HOP_BY_HOP_HEADERS.has(name.toLowerCase())) {
+      forwarded[name] = value;
+    }
+  }
+  return forwarded;
+}
+
+function responseHeaders(incoming: http.IncomingHttpHeaders): Headers {
+  const headers = new Headers();
+  for (const [name, value] of Object.entries(incoming)) {
+    if (value === undefined || HOP_BY_HOP_HEADERS.has(name)) {
+      continue;
+    }
+    for (const item of Array.isArray(value) ? value : [value]) {
+      headers.append(name, item);
+    }
+  }
+  return headers;
+}
+
+function sendToBackend(request: Request, targetUrl: URL): Promise<http.IncomingMessage> {
+  const transport = targetUrl.protocol === 'https:' ? https : http;
+  return new Promise((resolve, reject) => {
+    const backendRequest = transport.request(targetUrl, {
+      method: request.method,
+      headers: forwardableHeaders(request.headers),
+    }, resolve);
+    backendRequest.on('error', reject);
+
+    if (request.body && request.method !== 'GET' && request.method !== 'HEAD') {
+      Readable.fromWeb(request.body as import('node:stream/web').ReadableStream).pipe(backendRequest);
+    } else {
+      backendRequest.end();
+    }
+  });
+}
+
 // Catch-all proxy for /api/* requests to the Flask backend.
-// Streams request and response bodies to avoid buffering.
+// Streams request and response bodies to avoid buffering. Conditional request
+// headers (If-None-Match, If-Modified-Since) are forwarded with the rest, and
+// the backend's validators (ETag, Last-Modified, Cache-Control) are passed
+// back, so repeat requests can be answered with a header-only 304.
+// node:http is used rather than fetch because fetch always decodes gzip and
+// brotli bodies: this way the backend's compressed bytes reach the browser
+// as they are, with their Content-Encoding, and are never decoded here.
 export const ALL: APIRoute = async ({ params, request }) => {
   const url = new URL(request.url);
-  const targetUrl = `${API_SERVER_URL}/api/${params.path}${url.search}`;
+  const targetUrl = new URL(`${API_SERVER_URL}/api/${params.path}${url.search}`);
 
   try {
-    const response = await fetch(targetUrl, {
-      method: request.method,
-      headers: request.headers,
-      body: request.method !== 'GET' && request.method !== 'HEAD'
-        ? request.body
-        : undefined,
-    });
+    const response = await sendToBackend(request, targetUrl);
+    const status = response.statusCode ?? 502;
+    const headers = responseHeaders(response.headers);
 
-    return new Response(response.body, {
-      status: response.status,
-      statusText: response.statusText,
-      headers: response.headers,
+    if (NULL_BODY_STATUSES.has(status) || request.method === 'HEAD') {
+      response.resume();
+      return new Response(null, { status, statusText: response.statusMessage, headers });
+    }
+    return new Response(Readable.toWeb(response) as ReadableStream<Uint8Array>, {
+      status,
+      statusText: response.statusMessage,
+      headers,
     });
   } catch (error) {
     console.error('Error forwarding request to API:', error);
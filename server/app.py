@@ -1,29 +1,79 @@
 import os
+from typing import Any
+import click
 from flask import Flask
 from routes.games import games_bp
+from routes.categories import categories_bp
+from routes.publishers import publishers_bp
 from routes.auth import auth_bp
+from routes.cache import cache_bp
+from routes.leaderboards import leaderboards_bp
 from models import db
-from utils.database import get_connection_string
-from utils.seed_database import seed_database
+from utils.cache_backends import get_cache_url
+from utils.database import (
+    configure_sqlite_engine,
+    get_binds,
+    get_catalog_snapshot_enabled,
+    get_connection_string,
+    get_engine_options,
+    get_replica_connection_string,
+    get_sqlite_pragmas,
+)
+from utils.compression import init_compression
+from utils.rating_queue import init_rating_queue
+from utils.response_cache import init_response_cache
+from utils.seed_database import DEFAULT_CHUNK_SIZE, DEFAULT_CSV_PATH, init_database
 
 # Get the server directory path
 base_dir: str = os.path.abspath(os.path.dirname(__file__))
 
-app: Flask = Flask(__name__)
+def create_app(test_config: dict[str, Any] | None = None) -> Flask:
+    """
+    Application factory. Performs no database work: schema creation and
+    seeding are a separate one-shot step (`flask --app app init-db`), so
+    worker start-up time does not depend on the size of the catalog.
+    """
+    app = Flask(__name__)
 
-# Configure and initialize the database
-app.config['SQLALCHEMY_DATABASE_URI'] = get_connection_string()
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-db.init_app(app)
+    # Configure and initialize the database
+    app.config['SQLALCHEMY_DATABASE_URI'] = get_connection_string()
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    if test_config:
+        app.config.update(test_config)
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', get_engine_options(app.config['SQLALCHEMY_DATABASE_URI']))
+    app.config.setdefault('SQLALCHEMY_BINDS', get_binds(get_replica_connection_string()))
+    app.config.setdefault('SQLITE_PRAGMAS', get_sqlite_pragmas())
+    app.config.setdefault('CACHE_URL', get_cache_url())
+    app.config.setdefault('CATALOG_SNAPSHOT', get_catalog_snapshot_enabled())
+    db.init_app(app)
+    init_response_cache(app)
+    init_compression(app)
+    init_rating_queue(app)
 
-# Create tables and seed data (idempotent — skips existing records)
-with app.app_context():
-    db.create_all()
-    seed_database()
+    # Registers connect-time PRAGMAs; no connection is opened here
+    with app.app_context():
+        for engine in db.engines.values():
+            configure_sqlite_engine(engine, app.config['SQLITE_PRAGMAS'])
 
-# Register blueprints
-app.register_blueprint(games_bp)
-app.register_blueprint(auth_bp)
+    # Register blueprints
+    app.register_blueprint(games_bp)
+    app.register_blueprint(categories_bp)
+    app.register_blueprint(publishers_bp)
+    app.register_blueprint(auth_bp)
+    app.register_blueprint(cache_bp)
+    app.register_blueprint(leaderboards_bp)
+
+    @app.cli.command('init-db')
+    @click.option('--csv', 'csv_path', default=DEFAULT_CSV_PATH, help='CSV file to import games from.')
+    @click.option('--chunk-size', default=DEFAULT_CHUNK_SIZE, help='Rows inserted per batch.')
+    def init_db_command(csv_path: str, chunk_size: int) -> None:
+        """Create missing tables and seed the catalog (idempotent)."""
+        init_database(csv_path, chunk_size)
+
+    return app
+
+# Module-level app for `gunicorn app:app` and `flask --app app`
+app: Flask = create_app()
 
 def _env_flag(name: str, default: bool = False) -> bool:
     value: str = os.environ.get(name, "").strip().lower()
@@ -33,6 +83,11 @@ def _env_flag(name: str, default: bool = False) -> bool:
 
 
 if __name__ == '__main__':
+    # The dev server initializes the database itself so a fresh checkout
+    # works with a single command
+    with app.app_context():
+        init_database()
+
     # Hot-reload is on by default; the interactive Werkzeug debugger is opt-in
     # via FLASK_INTERACTIVE_DEBUGGER because it requires POSIX semaphores that
     # are blocked under some sandboxed environments.
@@ -43,4 +98,4 @@ if __name__ == '__main__':
         port=5100,  # Port 5100 to avoid macOS conflicts
         use_reloader=use_reloader,
         use_debugger=use_debugger,
-    )
\ No newline at end of file
+    )
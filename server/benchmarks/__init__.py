@@ -0,0 +1,2 @@
+# Standalone performance benchmarks. Run from the server directory, e.g.
+# `python -m benchmarks.pagination`. They are not part of the unit test suite.
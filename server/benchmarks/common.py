@@ -0,0 +1,83 @@
+import csv
+import os
+import random
+import statistics
+import tempfile
+import time
+from typing import Any, Callable
+from flask import Flask
+from sqlalchemy import insert
+from models import db, Category, Game, Publisher
+from app import create_app
+
+CATEGORY_COUNT = 20
+PUBLISHER_COUNT = 200
+
+def create_benchmark_app(database_uri: str | None = None, **config: Any) -> Flask:
+    """Create the production app on a throwaway SQLite file, with config overrides."""
+    if database_uri is None:
+        database_uri = f'sqlite:///{os.path.join(tempfile.mkdtemp(prefix="tailspin-bench-"), "bench.db")}'
+
+    app = create_app({'SQLALCHEMY_DATABASE_URI': database_uri, **config})
+
+    with app.app_context():
+        db.create_all()
+
+    return app
+
+def populate_catalog(app: Flask, game_count: int, batch_size: int = 10_000) -> None:
+    """Insert a synthetic catalog of `game_count` games with core executemany."""
+    rng = random.Random(42)
+    with app.app_context():
+        db.session.execute(insert(Category), [
+            {'id': i, 'name': f'Category {i}', 'description': f'Synthetic category number {i}'}
+            for i in range(1, CATEGORY_COUNT + 1)
+        ])
+        db.session.execute(insert(Publisher), [
+            {'id': i, 'name': f'Publisher {i}', 'description': f'Synthetic publisher number {i}'}
+            for i in range(1, PUBLISHER_COUNT + 1)
+        ])
+
+        for start in range(0, game_count, batch_size):
+            stop = min(start + batch_size, game_count)
+            db.session.execute(insert(Game), [
+                {
+                    'title': f'Game {rng.random():.12f} {i}',
+                    'description': f'Synthetic description for benchmark game number {i}.',
+                    'category_id': rng.randint(1, CATEGORY_COUNT),
+                    'publisher_id': rng.randint(1, PUBLISHER_COUNT),
+                    'star_rating': round(rng.uniform(1.0, 5.0), 1),
+                }
+                for i in range(start, stop)
+            ])
+        db.session.commit()
+
+def write_catalog_csv(path: str, rows: int) -> None:
+    with open(path, 'w', newline='', encoding='utf-8') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(['Title', 'Category', 'Publisher', 'Description'])
+        for i in range(rows):
+            writer.writerow([
+                f'Benchmark Game {i}',
+                f'Category {i % 20}',
+                f'Publisher {i % 200}',
+                f'Synthetic description for benchmark game number {i}.',
+            ])
+
+def time_call(func: Callable[[], object], repeat: int = 20) -> list[float]:
+    """Run `func` repeatedly and return each call's wall time in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def percentile(timings: list[float], pct: float) -> float:
+    ordered = sorted(timings)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def summarize(timings: list[float]) -> str:
+    return (f'p50 {statistics.median(timings):8.3f} ms  '
+            f'p99 {percentile(timings, 99):8.3f} ms')
@@ -0,0 +1,41 @@
+"""
+Compares response size and latency on GET /api/games per content coding,
+with the response cache on (each coding compressed once, then served from
+the cache) and off (compressed on every request).
+
+    python -m benchmarks.compression [--games 10000] [--repeat 200]
+
+Brotli is measured only when the optional `brotli` package is installed.
+"""
+import argparse
+from utils import compression
+from .common import create_benchmark_app, populate_catalog, summarize, time_call
+
+URLS = ('/api/games', '/api/games?pageSize=100', '/api/games?view=summary&pageSize=100')
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    app = create_benchmark_app()
+    populate_catalog(app, args.games)
+    client = app.test_client()
+    codings = ['identity', 'gzip'] + (['br'] if compression.brotli is not None else [])
+
+    print(f'{args.games} games')
+    for url in URLS:
+        print(url)
+        for coding in codings:
+            headers = {'Accept-Encoding': coding}
+            size = len(client.get(url, headers=headers).data)
+            results = []
+            for cached in (True, False):
+                app.config['RESPONSE_CACHE_ENABLED'] = cached
+                client.get(url, headers=headers)  # fill the cache entry for this coding
+                results.append(summarize(time_call(lambda: client.get(url, headers=headers), args.repeat)))
+            print(f'  {coding:<9} {size:>7} bytes   cached: {results[0]}   uncached: {results[1]}')
+
+if __name__ == '__main__':
+    main()
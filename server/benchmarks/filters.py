@@ -0,0 +1,66 @@
+"""
+Measures GET /api/games latency for every combination of the category,
+publisher and minRating filters with each sort, without the composite filter
+indexes and again with them created.
+
+    python -m benchmarks.filters [--games 100000] [--repeat 20]
+
+The response cache is disabled and totals are skipped (includeTotal=false),
+so the timings are of the page query alone.
+"""
+import argparse
+import itertools
+from sqlalchemy import text
+from models import db
+from routes.games import GAME_SORTS
+from utils.migrations import create_missing_indexes
+from .common import create_benchmark_app, populate_catalog, summarize, time_call
+
+FILTER_INDEXES = (
+    'ix_games_category_id_title_id',
+    'ix_games_publisher_id_title_id',
+    'ix_games_category_id_id',
+    'ix_games_publisher_id_id',
+)
+
+def filter_urls() -> list[str]:
+    urls = []
+    combinations = itertools.product(('', 'category=3'), ('', 'publisher=7'), ('', 'minRating=3.5'), GAME_SORTS)
+    for *filters, sort in combinations:
+        query = '&'.join([part for part in filters if part] + [f'sort={sort}', 'includeTotal=false'])
+        urls.append(f'/api/games?{query}')
+    return urls
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_benchmark_app(RESPONSE_CACHE_ENABLED=False)
+    populate_catalog(app, args.games)
+    client = app.test_client()
+    urls = filter_urls()
+
+    def measure() -> dict[str, list[float]]:
+        for url in urls:
+            client.get(url)  # warm up the page cache and statement compilation
+        return {url: time_call(lambda: client.get(url), args.repeat) for url in urls}
+
+    with app.app_context():
+        for name in FILTER_INDEXES:
+            db.session.execute(text(f'DROP INDEX {name}'))
+        db.session.commit()
+    without_indexes = measure()
+    with app.app_context():
+        create_missing_indexes()
+    with_indexes = measure()
+
+    print(f'{args.games} games')
+    for url in urls:
+        label = url[len('/api/games?'):-len('&includeTotal=false')]
+        print(f'{label:<48} without: {summarize(without_indexes[url])}   '
+              f'indexed: {summarize(with_indexes[url])}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Measures GET /api/leaderboards latency as the catalog grows, without the
+score indexes (every request sorts the matching games) and again with them
+(every request reads `limit` index entries).
+
+    python -m benchmarks.leaderboards [--sizes 10000 100000] [--repeat 50]
+
+The response cache is disabled, so every request runs its query.
+"""
+import argparse
+from sqlalchemy import text
+from models import db
+from utils.migrations import create_missing_indexes
+from .common import create_benchmark_app, populate_catalog, summarize, time_call
+
+SCORE_INDEXES = ('ix_games_star_rating', 'ix_games_category_id_star_rating')
+
+URLS = ('/api/leaderboards/top-rated', '/api/leaderboards/top-rated?category=3')
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        app = create_benchmark_app(RESPONSE_CACHE_ENABLED=False)
+        populate_catalog(app, size)
+        client = app.test_client()
+
+        def measure() -> dict[str, list[float]]:
+            for url in URLS:
+                client.get(url)  # warm up the page cache and statement compilation
+            return {url: time_call(lambda: client.get(url), args.repeat) for url in URLS}
+
+        with app.app_context():
+            for name in SCORE_INDEXES:
+                db.session.execute(text(f'DROP INDEX {name}'))
+            db.session.commit()
+        without_indexes = measure()
+        with app.app_context():
+            create_missing_indexes()
+        with_indexes = measure()
+
+        print(f'{size} games')
+        for url in URLS:
+            print(f'  {url:<42} without: {summarize(without_indexes[url])}   '
+                  f'indexed: {summarize(with_indexes[url])}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Compares per-page latency of OFFSET pagination against keyset (cursor)
+pagination on GET /api/games as the client pages deeper into the catalog.
+
+    python -m benchmarks.pagination [--games 100000] [--page-size 10]
+
+Keyset latency should stay flat from page 1 to page 10,000, while OFFSET
+latency grows linearly with the page number.
+"""
+import argparse
+from sqlalchemy import select
+from models import db, Game
+from utils.pagination import encode_cursor
+from .common import create_benchmark_app, populate_catalog, summarize, time_call
+
+PAGES = [1, 10, 100, 1_000, 10_000]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=100_000)
+    parser.add_argument('--page-size', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_benchmark_app(RESPONSE_CACHE_ENABLED=False)
+    populate_catalog(app, args.games)
+    client = app.test_client()
+
+    print(f'{args.games} games, pageSize={args.page_size}')
+    for page in PAGES:
+        offset = (page - 1) * args.page_size
+        if offset >= args.games:
+            break
+
+        # The cursor for page N is the key of the last row on page N - 1
+        cursor = ''
+        if offset:
+            with app.app_context():
+                last = db.session.execute(
+                    select(Game.title, Game.id)
+                    .order_by(Game.title, Game.id)
+                    .offset(offset - 1)
+                    .limit(1)
+                ).one()
+            cursor = encode_cursor([last.title, last.id])
+
+        offset_url = f'/api/games?page={page}&pageSize={args.page_size}'
+        keyset_url = f'/api/games?cursor={cursor}&pageSize={args.page_size}'
+        offset_timings = time_call(lambda: client.get(offset_url), args.repeat)
+        keyset_timings = time_call(lambda: client.get(keyset_url), args.repeat)
+
+        print(f'page {page:>6}  offset: {summarize(offset_timings)}   keyset: {summarize(keyset_timings)}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+Compares rating vote ingest throughput (votes/sec): one UPDATE and commit per
+vote against the write-behind rating queue, with votes skewed towards a few
+hot games as real traffic is.
+
+    python -m benchmarks.ratings [--votes 50000] [--games 10000] [--threads 4]
+
+The queue is measured from the first submit until every vote is written.
+
+Then measures `GET /api/games` latency over the first LISTING_PAGES pages
+while votes keep flowing, with the response cache on and then also the
+catalog snapshot, bumping the catalog version on every flush against
+coalescing the bumps to one per `DEFAULT_BUMP_INTERVAL` seconds.
+"""
+import argparse
+import itertools
+import random
+import statistics
+import threading
+import time
+from typing import Callable
+from flask import Flask
+from sqlalchemy import bindparam, update
+from models import db, Game
+from utils.leaderboards import trending_weight
+from utils.response_cache import get_response_cache
+from utils.rating_queue import DEFAULT_BUMP_INTERVAL, RatingQueue
+from .common import create_benchmark_app, populate_catalog, summarize
+
+TARGET_VOTES_PER_SECOND = 10_000
+
+LISTING_PAGES = 100
+
+def generate_votes(count: int, game_count: int) -> list[tuple[int, float]]:
+    rng = random.Random(7)
+    return [(min(int(rng.paretovariate(1.2)), game_count), float(rng.randint(1, 5))) for _ in range(count)]
+
+def run_threads(votes: list[tuple[int, float]], threads: int, func: Callable[[list[tuple[int, float]]], None]) -> float:
+    """Splits the votes across threads and returns the wall time in seconds."""
+    workers = [threading.Thread(target=func, args=(votes[i::threads],)) for i in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+def listing_while_voting(app: Flask, votes: list[tuple[int, float]], seconds: float,
+                         bump_interval: float) -> tuple[list[float], RatingQueue]:
+    """
+    Reads the listing for `seconds` while a thread keeps submitting votes to
+    a queue flushing every second; returns each read's time in milliseconds.
+    """
+    queue = RatingQueue(app, bump_interval=bump_interval)
+    client = app.test_client()
+    urls = itertools.cycle([f'/api/games?page={page}&pageSize=9' for page in range(1, LISTING_PAGES + 1)])
+    for _ in range(LISTING_PAGES):
+        client.get(next(urls))
+    done = threading.Event()
+
+    def vote() -> None:
+        for game_id, rating in votes:
+            if done.is_set():
+                return
+            queue.submit(game_id, rating)
+            time.sleep(0.001)
+
+    voter = threading.Thread(target=vote)
+    voter.start()
+    timings = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        client.get(next(urls))
+        timings.append((time.perf_counter() - start) * 1000)
+    done.set()
+    voter.join()
+    queue.stop()
+    return timings, queue
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--votes', type=int, default=50_000)
+    parser.add_argument('--games', type=int, default=10_000)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=10.0, help='time spent reading the listing per mode')
+    args = parser.parse_args()
+
+    app = create_benchmark_app()
+    populate_catalog(app, args.games)
+    votes = generate_votes(args.votes, args.games)
+    table = Game.__table__
+    row_update = (
+        update(table)
+        .where(table.c.id == bindparam('game_id'))
+        .values(
+            rating_sum=table.c.rating_sum + bindparam('rating'),
+            rating_count=table.c.rating_count + 1,
+            star_rating=(table.c.rating_sum + bindparam('rating')) / (table.c.rating_count + 1),
+            trending_score=table.c.trending_score + bindparam('trending_weight'),
+            version=table.c.version + 1,
+        )
+    )
+
+    def row_at_a_time(chunk: list[tuple[int, float]]) -> None:
+        with app.app_context():
+            for game_id, rating in chunk:
+                db.session.execute(row_update, {'game_id': game_id, 'rating': rating, 'trending_weight': trending_weight()})
+                db.session.commit()
+
+    queue = RatingQueue(app)
+
+    def submit_all(chunk: list[tuple[int, float]]) -> None:
+        for game_id, rating in chunk:
+            queue.submit(game_id, rating)
+
+    row_seconds = run_threads(votes, args.threads, row_at_a_time)
+    start = time.perf_counter()
+    submit_seconds = run_threads(votes, args.threads, submit_all)
+    queue.stop()
+    queue_seconds = time.perf_counter() - start
+    stats = queue.stats()
+
+    print(f'{args.votes} votes over {args.games} games, {args.threads} threads '
+          f'(target {TARGET_VOTES_PER_SECOND:,} votes/sec)')
+    print(f'{"row-at-a-time UPDATEs":<26}{args.votes / row_seconds:>12,.0f} votes/sec')
+    print(f'{"queue, submit only":<26}{args.votes / submit_seconds:>12,.0f} votes/sec')
+    print(f'{"queue, until written":<26}{args.votes / queue_seconds:>12,.0f} votes/sec   '
+          f'{stats["flushes"]} flushes')
+
+    print(f'\nGET /api/games, first {LISTING_PAGES} pages, while voting, {args.seconds:.0f}s each')
+    for snapshot in (False, True):
+        app = create_benchmark_app(CATALOG_SNAPSHOT=snapshot)
+        populate_catalog(app, args.games)
+        for bump_interval in (0.0, DEFAULT_BUMP_INTERVAL):
+            with app.app_context():
+                misses = get_response_cache().stats()['misses']
+            timings, queue = listing_while_voting(app, votes, args.seconds, bump_interval)
+            with app.app_context():
+                misses = get_response_cache().stats()['misses'] - misses
+            label = f'{"snapshot" if snapshot else "database"}, bump every {f"{bump_interval:.0f}s" if bump_interval else "flush"}'
+            print(f'{label:<30}{summarize(timings)}  mean {statistics.fmean(timings):6.3f} ms   '
+                  f'{queue.stats()["bumps"]} bumps, {misses} cache misses')
+
+if __name__ == '__main__':
+    main()
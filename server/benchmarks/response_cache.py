@@ -0,0 +1,43 @@
+"""
+Compares latency of the hot catalog endpoints with the in-process response
+cache enabled and disabled.
+
+    python -m benchmarks.response_cache [--games 10000] [--repeat 200]
+
+With the cache enabled every request after the first is served from memory,
+so p50 and p99 should drop to the cost of routing and header handling.
+"""
+import argparse
+from utils.response_cache import get_response_cache
+from .common import create_benchmark_app, populate_catalog, summarize, time_call
+
+URLS = [
+    '/api/games?page=1&pageSize=9',
+    '/api/games/1',
+    '/api/categories',
+    '/api/publishers',
+]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    clients = {}
+    for enabled in (False, True):
+        app = create_benchmark_app(RESPONSE_CACHE_ENABLED=enabled)
+        populate_catalog(app, args.games)
+        clients[enabled] = app.test_client()
+
+    print(f'{args.games} games, {args.repeat} requests per endpoint')
+    for url in URLS:
+        uncached = time_call(lambda: clients[False].get(url), args.repeat)
+        cached = time_call(lambda: clients[True].get(url), args.repeat)
+        print(f'{url:<32} uncached: {summarize(uncached)}   cached: {summarize(cached)}')
+
+    with clients[True].application.app_context():
+        print(f'cache stats: {get_response_cache().stats()}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Measures full-text search latency on GET /api/games?q=... over a synthetic
+catalog whose titles and descriptions are drawn from a fixed vocabulary, so
+common, rare and prefix terms all occur.
+
+    python -m benchmarks.search [--games 1000000] [--repeat 50]
+
+The response cache is disabled so every request runs the FTS5 query.
+"""
+import argparse
+import random
+import time
+from sqlalchemy import insert
+from models import db, Category, Game, Publisher
+from .common import CATEGORY_COUNT, PUBLISHER_COUNT, create_benchmark_app, summarize, time_call
+
+VOCABULARY = (
+    'agile pipeline deploy merge conflict sprint kanban release rollback cluster container kernel '
+    'cache latency incident outage pager refactor legacy monolith service queue shard replica '
+    'backlog standup retro velocity burndown hotfix canary feature flag branch rebase commit '
+    'review patch build artifact registry secret vault token gateway proxy balancer scheduler'
+).split()
+
+QUERIES = ('pipeline', 'pipe', 'merge conflict', 'canary rollback', 'sh', 'kernel outage pager', 'zzz')
+
+def populate_search_catalog(app, game_count: int, batch_size: int = 10_000) -> None:
+    """Insert `game_count` games with vocabulary text; the FTS triggers index each row."""
+    rng = random.Random(42)
+    with app.app_context():
+        db.session.execute(insert(Category), [{'id': i, 'name': f'Category {i}'} for i in range(1, CATEGORY_COUNT + 1)])
+        db.session.execute(insert(Publisher), [{'id': i, 'name': f'Publisher {i}'} for i in range(1, PUBLISHER_COUNT + 1)])
+        for start in range(0, game_count, batch_size):
+            stop = min(start + batch_size, game_count)
+            db.session.execute(insert(Game), [
+                {
+                    'title': f'{" ".join(rng.choices(VOCABULARY, k=3)).title()} {i}',
+                    'description': ' '.join(rng.choices(VOCABULARY, k=24)).capitalize() + '.',
+                    'category_id': rng.randint(1, CATEGORY_COUNT),
+                    'publisher_id': rng.randint(1, PUBLISHER_COUNT),
+                    'star_rating': round(rng.uniform(1.0, 5.0), 1),
+                }
+                for i in range(start, stop)
+            ])
+        db.session.commit()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    app = create_benchmark_app(RESPONSE_CACHE_ENABLED=False)
+    start = time.perf_counter()
+    populate_search_catalog(app, args.games)
+    print(f'{args.games} games indexed in {time.perf_counter() - start:.1f} s')
+    client = app.test_client()
+
+    for query in QUERIES:
+        first = client.get('/api/games', query_string={'q': query}).get_json()
+        cursor = first['pagination']['nextCursor'] or ''
+        first_page = time_call(lambda: client.get('/api/games', query_string={'q': query}), args.repeat)
+        next_page = time_call(lambda: client.get('/api/games', query_string={'q': query, 'cursor': cursor}), args.repeat)
+        print(f'{query!r:<24} first page {summarize(first_page)}   next page {summarize(next_page)}')
+
+if __name__ == '__main__':
+    main()
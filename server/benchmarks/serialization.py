@@ -0,0 +1,62 @@
+"""
+Micro-benchmark of game serialization: ORM entities + Game.to_dict + jsonify
+against column rows + GameRecord + dumps_json (with orjson, if installed, and
+with the stdlib encoder), for a 100-row page and for the full catalog.
+
+    python -m benchmarks.serialization [--games 20000] [--repeat 20]
+
+Query time is included: the row path also skips ORM hydration.
+"""
+import argparse
+from unittest import mock
+from flask import jsonify
+from sqlalchemy import Select, select
+from sqlalchemy.orm import contains_eager
+from models import db, Category, Game, GameRecord, Publisher, get_game_rows_stmt
+from utils import serialization
+from .common import create_benchmark_app, populate_catalog, summarize, time_call
+
+def orm_stmt() -> Select:
+    return (
+        select(Game)
+        .join(Publisher, Game.publisher_id == Publisher.id, isouter=True)
+        .join(Category, Game.category_id == Category.id, isouter=True)
+        .options(contains_eager(Game.publisher), contains_eager(Game.category))
+        .order_by(Game.title, Game.id)
+    )
+
+def serialize_orm(limit: int | None) -> bytes:
+    games = db.session.scalars(orm_stmt().limit(limit)).unique().all()
+    body = jsonify([game.to_dict() for game in games]).get_data()
+    # Drop the entities so each run hydrates afresh, as a new request would
+    db.session.expunge_all()
+    return body
+
+def serialize_rows(limit: int | None) -> bytes:
+    rows = db.session.execute(get_game_rows_stmt().order_by(Game.title, Game.id).limit(limit))
+    games = [GameRecord.from_row(row) for row in rows]
+    return serialization.json_response(
+        [game.to_dict() for game in games], floats=[game.star_rating for game in games]
+    ).get_data()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=20_000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_benchmark_app()
+    populate_catalog(app, args.games)
+
+    with app.app_context():
+        for label, limit, repeat in (('100-row page', 100, args.repeat * 10), ('full catalog', None, args.repeat)):
+            assert serialize_orm(limit) == serialize_rows(limit)
+            print(f'{label} ({args.games} games)')
+            print(f'  orm + jsonify      {summarize(time_call(lambda: serialize_orm(limit), repeat))}')
+            if serialization.orjson is not None:
+                print(f'  rows + orjson      {summarize(time_call(lambda: serialize_rows(limit), repeat))}')
+            with mock.patch.object(serialization, 'orjson', None):
+                print(f'  rows + stdlib json {summarize(time_call(lambda: serialize_rows(limit), repeat))}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Compares the response cache hit rate of per-process and shared cache
+backends as requests are spread over more workers.
+
+    python -m benchmarks.shared_cache [--workers 4] [--requests 2000]
+
+Each worker is a separate app on the same SQLite file, requests are sent
+round-robin, and every --write-every requests one worker commits a write.
+With the memory backend each worker warms its own cache (and misses other
+workers' writes until its TTL expires); with the shm backend they share one.
+"""
+import argparse
+import os
+import random
+import tempfile
+from models import db, Game
+from utils.response_cache import get_response_cache
+from .common import create_benchmark_app, populate_catalog, summarize, time_call
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=10_000)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=2_000)
+    parser.add_argument('--write-every', type=int, default=500)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix='tailspin-bench-')
+    database_uri = f'sqlite:///{os.path.join(directory, "bench.db")}'
+    populate_catalog(create_benchmark_app(database_uri), args.games)
+
+    urls = [f'/api/games?page={page}' for page in range(1, 21)] + [f'/api/games/{id}' for id in range(1, 81)]
+    for cache_url in ('memory://', f'shm://{os.path.join(directory, "cache")}'):
+        workers = [create_benchmark_app(database_uri, CACHE_URL=cache_url) for _ in range(args.workers)]
+        clients = [worker.test_client() for worker in workers]
+        rng = random.Random(42)
+        counter = iter(range(args.requests))
+
+        def request() -> None:
+            index = next(counter)
+            if index and index % args.write_every == 0:
+                with workers[index % args.workers].app_context():
+                    db.session.get(Game, 1).star_rating = rng.uniform(1.0, 5.0)
+                    db.session.commit()
+            clients[index % args.workers].get(rng.choice(urls))
+
+        timings = time_call(request, args.requests)
+
+        hits = misses = 0
+        for worker in workers:
+            with worker.app_context():
+                stats = get_response_cache().stats()
+            hits += stats['hits']
+            misses += stats['misses']
+        scheme = cache_url.split(':', 1)[0]
+        print(f'{scheme:<7} {args.workers} workers  hit rate {hits / (hits + misses):6.1%}  {summarize(timings)}')
+
+if __name__ == '__main__':
+    main()
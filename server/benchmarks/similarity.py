@@ -0,0 +1,79 @@
+"""
+Measures the similar games index: a full build, an incremental rebuild after
+a few games change, and GET /api/games/<id>/similar latency, against scoring
+the same TF-IDF vectors with a Python loop over every game.
+
+    python -m benchmarks.similarity [--games 100000] [--repeat 50]
+
+Descriptions are random draws from a Zipf-distributed vocabulary, so common
+words have long postings lists as in real text. The response cache is off.
+"""
+import argparse
+import random
+import time
+from sqlalchemy import bindparam, update
+from models import db, Game, get_catalog_version
+from utils.similarity import SimilarityIndex, get_similarity_index
+from .common import create_benchmark_app, populate_catalog, summarize, time_call
+
+VOCABULARY_SIZE = 5_000
+WORDS_PER_DESCRIPTION = 30
+
+def random_descriptions(count: int) -> list[str]:
+    rng = random.Random(3)
+    weights = [1 / rank for rank in range(1, VOCABULARY_SIZE + 1)]
+    words = [f'word{rank}' for rank in range(VOCABULARY_SIZE)]
+    return [' '.join(rng.choices(words, weights, k=WORDS_PER_DESCRIPTION)) for _ in range(count)]
+
+def python_loop_scores(index: SimilarityIndex, vectors: list[dict[int, float]], position: int) -> list[float]:
+    """The text part of the score, one game at a time."""
+    query = vectors[position]
+    return [sum(weight * query.get(term, 0.0) for term, weight in vector.items()) for vector in vectors]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    app = create_benchmark_app(RESPONSE_CACHE_ENABLED=False)
+    populate_catalog(app, args.games)
+    with app.app_context():
+        stmt = update(Game.__table__).where(Game.__table__.c.id == bindparam('game_id')).values(description=bindparam('text'))
+        db.session.execute(stmt, [
+            {'game_id': game_id, 'text': text}
+            for game_id, text in enumerate(random_descriptions(args.games), start=1)
+        ])
+        db.session.commit()
+
+        start = time.perf_counter()
+        index = get_similarity_index()
+        full_build = time.perf_counter() - start
+
+        for game_id in range(1, 11):
+            db.session.get(Game, game_id).description = f'Rewritten description number {game_id}'
+        db.session.commit()
+        start = time.perf_counter()
+        index = SimilarityIndex.load(get_catalog_version(), previous=index)
+        incremental = time.perf_counter() - start
+
+        vectors = []
+        for position in range(len(index)):
+            begin, end = index.row_indptr[position], index.row_indptr[position + 1]
+            vectors.append(dict(zip(index.term_ids[begin:end].tolist(), index.weights[begin:end].tolist())))
+        loop = time_call(lambda: python_loop_scores(index, vectors, 42), max(1, args.repeat // 10))
+        vectorized = time_call(lambda: index.similar(43, 6), args.repeat)
+
+    client = app.test_client()
+    client.get('/api/games/43/similar')
+    endpoint = time_call(lambda: client.get('/api/games/43/similar'), args.repeat)
+
+    print(f'{args.games} games, {len(index.vocabulary)} terms')
+    print(f'{"full index build":<28} {full_build * 1000:10.1f} ms')
+    print(f'{"rebuild after 10 changes":<28} {incremental * 1000:10.1f} ms')
+    print(f'{"Python loop (text only)":<28} {summarize(loop)}')
+    print(f'{"NumPy scoring":<28} {summarize(vectorized)}')
+    print(f'{"GET /api/games/<id>/similar":<28} {summarize(endpoint)}')
+
+if __name__ == '__main__':
+    main()
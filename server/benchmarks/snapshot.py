@@ -0,0 +1,64 @@
+"""
+Compares requests per second on GET /api/games and GET /api/games/<id>
+served through the ORM against the in-memory catalog snapshot, and reports
+the resident memory the snapshot costs.
+
+    python -m benchmarks.snapshot [--games 100000] [--requests 2000]
+
+The response cache is disabled so every request reaches the read path.
+"""
+import argparse
+import random
+import time
+from typing import Callable
+from flask.testing import FlaskClient
+from .common import create_benchmark_app, populate_catalog
+
+def rss_mib() -> float:
+    """Current resident set size of this process (Linux)."""
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+def requests_per_second(client: FlaskClient, urls: Callable[[], str], count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        client.get(urls())
+    return count / (time.perf_counter() - start)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=100_000)
+    parser.add_argument('--requests', type=int, default=2_000)
+    args = parser.parse_args()
+
+    app = create_benchmark_app(RESPONSE_CACHE_ENABLED=False)
+    populate_catalog(app, args.games)
+    client = app.test_client()
+    rng = random.Random(42)
+    last_page = max(1, args.games // 9)
+    workloads = {
+        'list': lambda: f'/api/games?page={rng.randint(1, min(last_page, 100))}',
+        'detail': lambda: f'/api/games/{rng.randint(1, args.games)}',
+    }
+
+    print(f'{args.games} games, {args.requests} requests per workload')
+    results = {}
+    for mode in (False, True):
+        app.config['CATALOG_SNAPSHOT'] = mode
+        before = rss_mib()
+        # Warm up (builds the snapshot on the first snapshot request)
+        client.get('/api/games')
+        grown = rss_mib() - before
+        results[mode] = {name: requests_per_second(client, urls, args.requests) for name, urls in workloads.items()}
+        label = 'snapshot' if mode else 'orm'
+        rates = '  '.join(f'{name}: {rate:8.0f} req/s' for name, rate in results[mode].items())
+        print(f'{label:<9} {rates}   RSS +{grown:.1f} MiB on first request')
+
+    for name in workloads:
+        print(f'{name}: {results[True][name] / results[False][name]:.1f}x')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Measures read and write throughput with several reader processes and one
+writer process hitting the same SQLite file, as gunicorn workers would, with
+SQLite's default rollback journal and with the tuned WAL configuration.
+
+    python -m benchmarks.sqlite_concurrency [--readers 4] [--seconds 5]
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+from sqlalchemy import update
+from sqlalchemy.exc import OperationalError
+from models import db, Game
+from utils.database import get_sqlite_pragmas
+from .common import create_benchmark_app, populate_catalog
+
+# SQLite's own defaults, i.e. what a bare sqlite:/// URI gets
+DEFAULT_PRAGMAS = {'journal_mode': 'DELETE', 'synchronous': 'FULL'}
+
+def reader(database_uri: str, pragmas: dict, seconds: float, results: multiprocessing.Queue) -> None:
+    app = create_benchmark_app(database_uri, SQLITE_PRAGMAS=pragmas, RESPONSE_CACHE_ENABLED=False)
+    client = app.test_client()
+    operations = errors = 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        response = client.get(f'/api/games?page={random.randint(1, 100)}&includeTotal=false')
+        if response.status_code == 200:
+            operations += 1
+        else:
+            errors += 1
+    results.put(('read', operations, errors))
+
+def writer(database_uri: str, pragmas: dict, seconds: float, game_count: int, results: multiprocessing.Queue) -> None:
+    app = create_benchmark_app(database_uri, SQLITE_PRAGMAS=pragmas, RESPONSE_CACHE_ENABLED=False)
+    operations = errors = 0
+    deadline = time.monotonic() + seconds
+    with app.app_context():
+        while time.monotonic() < deadline:
+            try:
+                db.session.execute(
+                    update(Game)
+                    .where(Game.id == random.randint(1, game_count))
+                    .values(star_rating=round(random.uniform(1.0, 5.0), 1))
+                )
+                db.session.commit()
+                operations += 1
+            except OperationalError:
+                db.session.rollback()
+                errors += 1
+    results.put(('write', operations, errors))
+
+def run(label: str, pragmas: dict, readers: int, seconds: float, game_count: int) -> None:
+    database_uri = f'sqlite:///{os.path.join(tempfile.mkdtemp(prefix="tailspin-bench-"), "bench.db")}'
+    app = create_benchmark_app(database_uri, SQLITE_PRAGMAS=pragmas, RESPONSE_CACHE_ENABLED=False)
+    populate_catalog(app, game_count)
+    with app.app_context():
+        db.engine.dispose()
+
+    results: multiprocessing.Queue = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=reader, args=(database_uri, pragmas, seconds, results)) for _ in range(readers)]
+    processes.append(multiprocessing.Process(target=writer, args=(database_uri, pragmas, seconds, game_count, results)))
+    for process in processes:
+        process.start()
+
+    totals = {'read': [0, 0], 'write': [0, 0]}
+    for _ in processes:
+        kind, operations, errors = results.get()
+        totals[kind][0] += operations
+        totals[kind][1] += errors
+    for process in processes:
+        process.join()
+
+    print(f'{label:<10} reads/sec {totals["read"][0] / seconds:9.0f} (errors {totals["read"][1]})   '
+          f'writes/sec {totals["write"][0] / seconds:7.0f} (errors {totals["write"][1]})')
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--games', type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f'{args.readers} readers + 1 writer for {args.seconds:.0f}s on {args.games} games')
+    run('default', DEFAULT_PRAGMAS, args.readers, args.seconds, args.games)
+    run('tuned', get_sqlite_pragmas(), args.readers, args.seconds, args.games)
+
+if __name__ == '__main__':
+    main()
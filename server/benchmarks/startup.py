@@ -0,0 +1,64 @@
+"""
+Measures worker cold-start time as the catalog grows.
+
+    python -m benchmarks.startup [--sizes 1000 10000 100000]
+
+For each catalog size a fresh interpreter times `create_app()` plus the first
+request ("factory"), and the same start-up when the worker also runs
+create_all() and seeding from a CSV of that size, as app.py used to do at
+import ("import-time init"). Factory start-up should stay flat.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from app import create_app
+from utils.seed_database import init_database
+from .common import write_catalog_csv
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WORKER_SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+from app import create_app
+from utils.seed_database import init_database
+app = create_app({"SQLALCHEMY_DATABASE_URI": sys.argv[1]})
+if sys.argv[3] == "init":
+    with app.app_context():
+        init_database(sys.argv[2])
+app.test_client().get("/api/games/1")
+print(json.dumps((time.perf_counter() - start) * 1000))
+'''
+
+def time_worker_start(database_uri: str, csv_path: str, mode: str) -> float:
+    output = subprocess.run(
+        [sys.executable, '-c', WORKER_SCRIPT, database_uri, csv_path, mode],
+        cwd=SERVER_DIR, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        work_dir = tempfile.mkdtemp(prefix='tailspin-bench-')
+        csv_path = os.path.join(work_dir, 'games.csv')
+        database_uri = f'sqlite:///{os.path.join(work_dir, "bench.db")}'
+        write_catalog_csv(csv_path, size)
+
+        # One-shot initialization, as `flask init-db` does before workers start
+        app = create_app({'SQLALCHEMY_DATABASE_URI': database_uri})
+        with app.app_context():
+            init_database(csv_path)
+
+        factory_ms = time_worker_start(database_uri, csv_path, 'factory')
+        legacy_ms = time_worker_start(database_uri, csv_path, 'init')
+        print(f'{size:>8} games  factory: {factory_ms:9.1f} ms   import-time init: {legacy_ms:9.1f} ms')
+
+if __name__ == '__main__':
+    main()
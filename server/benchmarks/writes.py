@@ -0,0 +1,59 @@
+"""
+Compares write throughput (rows/sec) of creating games one POST /api/games
+request at a time against POST /api/games/bulk, for new titles and for
+updates of titles that already exist.
+
+    python -m benchmarks.writes [--rows 5000] [--games 10000]
+"""
+import argparse
+import time
+from typing import Callable
+from utils.game_writes import MAX_BULK_ROWS
+from .common import CATEGORY_COUNT, PUBLISHER_COUNT, create_benchmark_app, populate_catalog
+
+def game_rows(prefix: str, count: int, star_rating: float = 4.0) -> list[dict[str, object]]:
+    return [
+        {
+            'title': f'{prefix} {i}',
+            'description': f'Synthetic description for written game number {i}.',
+            'category': f'Category {i % CATEGORY_COUNT + 1}',
+            'publisher': f'Publisher {i % PUBLISHER_COUNT + 1}',
+            'starRating': star_rating,
+        }
+        for i in range(count)
+    ]
+
+def rows_per_second(count: int, func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return count / (time.perf_counter() - start)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=MAX_BULK_ROWS)
+    parser.add_argument('--games', type=int, default=10_000)
+    args = parser.parse_args()
+
+    app = create_benchmark_app(RESPONSE_CACHE_ENABLED=False)
+    populate_catalog(app, args.games)
+    client = app.test_client()
+
+    def post_each(rows: list[dict[str, object]]) -> None:
+        for row in rows:
+            assert client.post('/api/games', json=row).status_code == 201
+
+    def post_bulk(rows: list[dict[str, object]]) -> None:
+        for start in range(0, len(rows), MAX_BULK_ROWS):
+            assert client.post('/api/games/bulk', json=rows[start:start + MAX_BULK_ROWS]).status_code == 200
+
+    single = rows_per_second(args.rows, lambda: post_each(game_rows('Single', args.rows)))
+    bulk_insert = rows_per_second(args.rows, lambda: post_bulk(game_rows('Bulk', args.rows)))
+    bulk_update = rows_per_second(args.rows, lambda: post_bulk(game_rows('Bulk', args.rows, star_rating=2.5)))
+
+    print(f'{args.games} games, {args.rows} rows written per run')
+    print(f'{"single POSTs":<22}{single:>10,.0f} rows/sec')
+    print(f'{"bulk upsert (new)":<22}{bulk_insert:>10,.0f} rows/sec   {bulk_insert / single:6.1f}x')
+    print(f'{"bulk upsert (update)":<22}{bulk_update:>10,.0f} rows/sec   {bulk_update / single:6.1f}x')
+
+if __name__ == '__main__':
+    main()
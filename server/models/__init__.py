@@ -10,4 +10,17 @@ db = SQLAlchemy(model_class=Base)
 # Import models after db is defined to avoid circular imports
 from .category import Category
 from .game import Game
-from .publisher import Publisher
\ No newline at end of file
+from .publisher import Publisher
+from .catalog_version import (
+    DEFER_CATALOG_BUMP,
+    bump_catalog_version,
+    catalog_changed,
+    catalog_view_expired,
+    get_catalog_last_modified,
+    get_catalog_token,
+    get_catalog_version,
+    get_catalog_version_ttl,
+    use_shared_catalog_version,
+)
+from .snapshot import GAME_FIELDS, CatalogSnapshot, GameRecord, get_catalog_snapshot, get_game_rows_stmt
+from .search import GAMES_FTS_TABLE, create_search_index, games_fts, search_supported
@@ -0,0 +1,205 @@
+import secrets
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import chain
+from typing import Any, Protocol
+from blinker import Namespace
+from flask import Flask, current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+from .category import Category
+from .game import Game
+from .publisher import Publisher
+
+# Writes to any of these models change what the catalog endpoints return
+CATALOG_MODELS = (Game, Category, Publisher)
+CATALOG_TABLES = frozenset(model.__table__ for model in CATALOG_MODELS)
+
+# Sent with the app as sender after its catalog version has been bumped
+catalog_changed = Namespace().signal('catalog-changed')
+
+# Execution option marking a catalog write whose caller bumps the version
+# itself, later (e.g. coalescing frequent writes into one bump)
+DEFER_CATALOG_BUMP = 'defer_catalog_bump'
+
+# Seconds a per-process catalog version is trusted. Writes made by other
+# workers or processes never bump it, so whatever it validates must also
+# lapse by itself; a shared version sees every write and never lapses
+DEFAULT_LOCAL_VERSION_TTL = 30.0
+
+_EXTENSION_KEY = 'catalog_version'
+_DIRTY_KEY = 'catalog_dirty'
+
+def _now() -> datetime:
+    # HTTP dates have one-second resolution
+    return datetime.now(timezone.utc).replace(microsecond=0)
+
+class CatalogVersion:
+    """Monotonic counter bumped after every committed catalog write."""
+
+    def __init__(self) -> None:
+        self.version: int = 0
+        # Distinguishes this process's versions from those of earlier runs
+        self.epoch: str = secrets.token_hex(4)
+        self.last_modified: datetime = _now()
+        self._started = self.last_modified
+        self._started_at = time.monotonic()
+
+    def bump(self) -> None:
+        self.version += 1
+        self.last_modified = _now()
+
+    def period(self, ttl: float) -> tuple[int, datetime]:
+        """Index and start of the current `ttl`-second period since this version was created."""
+        index = int((time.monotonic() - self._started_at) // ttl)
+        return index, self._started + timedelta(seconds=int(index * ttl))
+
+class SharedStore(Protocol):
+    def get(self, key: str) -> bytes | None: ...
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None: ...
+    def add(self, key: str, value: bytes) -> bool: ...
+    def incr(self, key: str) -> int: ...
+
+class SharedCatalogVersion:
+    """
+    Catalog version kept in a store shared by every worker (see
+    utils.cache_backends), so a write in one worker invalidates the cached
+    views of all of them.
+    """
+
+    VERSION_KEY = 'catalog:version'
+    EPOCH_KEY = 'catalog:epoch'
+    MODIFIED_KEY = 'catalog:last-modified'
+
+    def __init__(self, store: SharedStore) -> None:
+        self.store = store
+        # Set when a bump could not reach the store; it is retried before the
+        # next read, so other workers still move on once the store is back
+        self._bump_pending = False
+
+    @property
+    def version(self) -> int:
+        if self._bump_pending:
+            self.bump()
+        return int(self.store.get(self.VERSION_KEY) or 0)
+
+    @property
+    def epoch(self) -> str:
+        epoch = self.store.get(self.EPOCH_KEY)
+        if epoch is None:
+            # First worker to start (or the store was flushed): whoever wins
+            # the add decides the epoch for everyone
+            self.store.add(self.EPOCH_KEY, secrets.token_hex(4).encode('ascii'))
+            epoch = self.store.get(self.EPOCH_KEY) or b''
+        return epoch.decode('ascii')
+
+    @property
+    def last_modified(self) -> datetime:
+        timestamp = self.store.get(self.MODIFIED_KEY)
+        if timestamp is None:
+            self.store.add(self.MODIFIED_KEY, str(int(time.time())).encode('ascii'))
+            timestamp = self.store.get(self.MODIFIED_KEY) or b'0'
+        return datetime.fromtimestamp(int(timestamp), timezone.utc)
+
+    def bump(self) -> None:
+        self._bump_pending = True
+        self.store.incr(self.VERSION_KEY)
+        self.store.set(self.MODIFIED_KEY, str(int(time.time())).encode('ascii'))
+        self._bump_pending = False
+
+def use_shared_catalog_version(app: Flask, store: SharedStore) -> None:
+    """Makes `app` read and bump its catalog version in `store`."""
+    app.extensions[_EXTENSION_KEY] = SharedCatalogVersion(store)
+
+def _get_state() -> CatalogVersion | SharedCatalogVersion:
+    return current_app.extensions.setdefault(_EXTENSION_KEY, CatalogVersion())
+
+def get_catalog_version() -> int:
+    """
+    Returns the catalog version for the current app.
+
+    Raises OSError if it is kept in a shared store that cannot be reached;
+    callers should then skip whatever the version would have validated.
+    """
+    return _get_state().version
+
+def get_catalog_version_ttl() -> float | None:
+    """
+    Returns the seconds for which views validated by the catalog version may
+    be reused without seeing a write (`CATALOG_VERSION_TTL`), or None if the
+    version is shared by every worker and so sees all writes.
+    """
+    if isinstance(_get_state(), SharedCatalogVersion):
+        return None
+    return current_app.config.get('CATALOG_VERSION_TTL', DEFAULT_LOCAL_VERSION_TTL)
+
+def catalog_view_expired(loaded_at: float) -> bool:
+    """
+    Whether a view of the catalog loaded at `loaded_at` (time.monotonic())
+    has outlived `CATALOG_VERSION_TTL`, and so may be missing other workers'
+    writes. Never true with a shared version.
+    """
+    ttl = get_catalog_version_ttl()
+    return ttl is not None and time.monotonic() - loaded_at >= ttl
+
+def get_catalog_token() -> str:
+    """
+    Returns a string that changes whenever the catalog may have changed: on
+    every write, and every `CATALOG_VERSION_TTL` seconds if the version is
+    per-process. Raises OSError like get_catalog_version.
+    """
+    state = _get_state()
+    token = f'{state.epoch}.{state.version}'
+    ttl = get_catalog_version_ttl()
+    if ttl is not None:
+        # The epoch already tells workers apart, so periods need not align
+        token += f'.{state.period(ttl)[0]}'
+    return token
+
+def get_catalog_last_modified() -> datetime:
+    """
+    Returns when the catalog was last written (or this process started). A
+    per-process version also counts the start of the current
+    `CATALOG_VERSION_TTL` period as a write. Raises OSError like
+    get_catalog_version.
+    """
+    state = _get_state()
+    ttl = get_catalog_version_ttl()
+    if ttl is None:
+        return state.last_modified
+    return max(state.last_modified, state.period(ttl)[1])
+
+def bump_catalog_version() -> None:
+    """Marks every cached view of the catalog for the current app as stale."""
+    _get_state().bump()
+    catalog_changed.send(current_app._get_current_object())
+
+@event.listens_for(Session, 'after_flush')
+def _track_flushed_writes(session: Session, flush_context: Any) -> None:
+    # new/dirty/deleted still hold their pre-flush contents at this point
+    if any(isinstance(obj, CATALOG_MODELS) for obj in chain(session.new, session.dirty, session.deleted)):
+        session.info[_DIRTY_KEY] = True
+
+@event.listens_for(Session, 'do_orm_execute')
+def _track_bulk_writes(orm_execute_state: ORMExecuteState) -> None:
+    # Bulk insert/update/delete statements bypass the unit of work
+    if orm_execute_state.execution_options.get(DEFER_CATALOG_BUMP):
+        return
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, 'table', None)
+        if table is None or table in CATALOG_TABLES:
+            orm_execute_state.session.info[_DIRTY_KEY] = True
+
+@event.listens_for(Session, 'after_commit')
+def _bump_on_commit(session: Session) -> None:
+    if session.info.pop(_DIRTY_KEY, False) and has_app_context():
+        try:
+            bump_catalog_version()
+        except OSError:
+            # The data is already committed, so the write must not fail; the
+            # shared version retries the bump on its next read
+            current_app.logger.exception("Bumping the catalog version failed; cached views may be stale")
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_on_rollback(session: Session) -> None:
+    session.info.pop(_DIRTY_KEY, None)
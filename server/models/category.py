@@ -28,12 +28,14 @@ class Category(BaseModel):
     def __repr__(self) -> str:
         return f'<Category {self.name}>'
         
-    def to_dict(self) -> dict[str, Any]:
-        from .game import Game
-        count_stmt = select(func.count(Game.id)).where(Game.category_id == self.id)
+    def to_dict(self, game_count: int | None = None) -> dict[str, Any]:
+        if game_count is None:
+            from .game import Game
+            count_stmt = select(func.count(Game.id)).where(Game.category_id == self.id)
+            game_count = db.session.scalar(count_stmt) or 0
         return {
             'id': self.id,
             'name': self.name,
             'description': self.description,
-            'game_count': db.session.scalar(count_stmt) or 0
-        }
\ No newline at end of file
+            'game_count': game_count
+        }
@@ -1,5 +1,5 @@
 from typing import Any, Optional, TYPE_CHECKING
-from sqlalchemy import ForeignKey, String, Text, Float
+from sqlalchemy import ForeignKey, Index, Integer, String, Text, Float
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from .base import BaseModel
 
@@ -9,11 +9,42 @@ if TYPE_CHECKING:
 
 class Game(BaseModel):
     __tablename__ = 'games'
+    __table_args__ = (
+        # Titles identify games for writes: the conflict target of bulk
+        # upserts. Also backs the (title, id) ordering of offset and keyset
+        # pagination, since SQLite index entries end with the rowid
+        Index('ux_games_title', 'title', unique=True),
+        # Foreign key joins and counts, plus per-entity "top rated" ordering
+        Index('ix_games_category_id_star_rating', 'category_id', 'star_rating'),
+        Index('ix_games_publisher_id_star_rating', 'publisher_id', 'star_rating'),
+        Index('ix_games_category_id_trending_score', 'category_id', 'trending_score'),
+        # Filtered listings: an equality filter followed by the sort key, so
+        # each filter and sort combination reads rows already in order
+        Index('ix_games_category_id_title_id', 'category_id', 'title', 'id'),
+        Index('ix_games_publisher_id_title_id', 'publisher_id', 'title', 'id'),
+        Index('ix_games_category_id_id', 'category_id', 'id'),
+        Index('ix_games_publisher_id_id', 'publisher_id', 'id'),
+        # Never hand a deleted game's id to a new one: (id, version) is the
+        # game's ETag and the similarity index's key, and queued rating votes
+        # name games by id. Databases created without it are rebuilt by
+        # utils.migrations.rebuild_autoincrement_tables
+        {'sqlite_autoincrement': True},
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
-    star_rating: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    star_rating: Mapped[Optional[float]] = mapped_column(Float, nullable=True, index=True)
+    # Totals of user rating votes; once a game has votes, star_rating is
+    # their running average. Written in batches by the rating queue.
+    rating_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0, server_default='0')
+    rating_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default='0')
+    # Time-weighted vote count ranking the trending leaderboard
+    trending_score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0, server_default='0', index=True)
+    # Row version for optimistic concurrency: every ORM update or delete
+    # checks it in its WHERE clause and increments it, and it is the game's
+    # ETag. The defaults cover Core inserts and rows that predate the column.
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default='1')
 
     # Foreign keys for one-to-many relationships
     category_id: Mapped[int] = mapped_column(ForeignKey('categories.id'), nullable=False)
@@ -22,6 +53,8 @@ class Game(BaseModel):
     # One-to-many relationships (many games belong to one category/publisher)
     category: Mapped["Category"] = relationship(back_populates="games")
     publisher: Mapped["Publisher"] = relationship(back_populates="games")
+
+    __mapper_args__ = {'version_id_col': version}
     
     @validates('title')
     def validate_name(self, key, name):
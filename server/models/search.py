@@ -0,0 +1,75 @@
+from typing import Any
+from sqlalchemy import Connection, Engine, Float, Integer, Text, column, event, table, text
+from .game import Game
+
+# External-content FTS5 index over games.title and games.description. The
+# index stores only the tokens; matching rows are read back from `games`.
+GAMES_FTS_TABLE = 'games_fts'
+
+# Queryable handle on the virtual table. The column named after the table is
+# FTS5's hidden column: `games_fts.c.games_fts.match(...)` compiles to
+# `games_fts MATCH ...`, and `rank` is the configured bm25 score.
+games_fts = table(
+    GAMES_FTS_TABLE,
+    column('rowid', Integer),
+    column('title', Text),
+    column('description', Text),
+    column('rank', Float),
+    column(GAMES_FTS_TABLE),
+)
+
+# Title matches weigh ten times as much as description matches; lower bm25
+# scores are better. `prefix` adds 2- and 3-character prefix indexes so short
+# prefix queries do not walk the whole term list.
+_SEARCH_SCHEMA = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {GAMES_FTS_TABLE} USING fts5(
+        title, description,
+        content='games', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    f"INSERT INTO {GAMES_FTS_TABLE}({GAMES_FTS_TABLE}, rank) VALUES ('rank', 'bm25(10.0, 1.0)')",
+    # Triggers keep the index in step with every write, ORM or bulk
+    f"""CREATE TRIGGER IF NOT EXISTS games_fts_after_insert AFTER INSERT ON games BEGIN
+        INSERT INTO {GAMES_FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS games_fts_after_delete AFTER DELETE ON games BEGIN
+        INSERT INTO {GAMES_FTS_TABLE}({GAMES_FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS games_fts_after_update AFTER UPDATE OF title, description ON games BEGIN
+        INSERT INTO {GAMES_FTS_TABLE}({GAMES_FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {GAMES_FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+]
+
+def search_supported(bind: Connection | Engine) -> bool:
+    """Full-text search needs SQLite's FTS5 extension."""
+    return bind.dialect.name == 'sqlite'
+
+def create_search_index(connection: Connection) -> bool:
+    """
+    Creates the games full-text index and its triggers if they are missing,
+    indexing any existing games. Does nothing on databases other than
+    SQLite. Returns whether the index was created.
+    """
+    if not search_supported(connection):
+        return False
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {'name': GAMES_FTS_TABLE}
+    ).first() is not None
+    for statement in _SEARCH_SCHEMA:
+        connection.exec_driver_sql(statement)
+    if not exists:
+        connection.exec_driver_sql(f"INSERT INTO {GAMES_FTS_TABLE}({GAMES_FTS_TABLE}) VALUES ('rebuild')")
+    return not exists
+
+@event.listens_for(Game.__table__, 'after_create')
+def _create_search_index(target: Any, connection: Connection, **kw: Any) -> None:
+    create_search_index(connection)
+
+@event.listens_for(Game.__table__, 'before_drop')
+def _drop_search_index(target: Any, connection: Connection, **kw: Any) -> None:
+    # The triggers go with the games table; the virtual table must be dropped
+    if search_supported(connection):
+        connection.exec_driver_sql(f'DROP TABLE IF EXISTS {GAMES_FTS_TABLE}')
@@ -0,0 +1,176 @@
+import threading
+import time
+from bisect import bisect_right
+from operator import attrgetter
+from typing import Any, Collection
+from flask import current_app
+from sqlalchemy import Row, Select, func, select
+from . import db
+from .catalog_version import catalog_view_expired, get_catalog_version
+from .category import Category
+from .game import Game
+from .publisher import Publisher
+
+_EXTENSION_KEY = 'catalog_snapshot'
+_BUILD_LOCK_KEY = 'catalog_snapshot_lock'
+
+# (id, name) of a category or publisher, shared by all of its games
+EntityRef = tuple[int, str]
+
+# Keys of a serialized game, in Game.to_dict order
+GAME_FIELDS = ('id', 'title', 'description', 'publisher', 'category', 'starRating')
+
+_sort_key = attrgetter('title', 'id')
+
+class GameRecord:
+    """Read-only game row with its category and publisher resolved."""
+
+    __slots__ = ('id', 'title', 'description', 'star_rating', 'category', 'publisher', 'version')
+
+    def __init__(self, id: int, title: str, description: str, star_rating: float | None,
+                 category: EntityRef | None, publisher: EntityRef | None, version: int | None = None) -> None:
+        self.id = id
+        self.title = title
+        self.description = description
+        self.star_rating = star_rating
+        self.category = category
+        self.publisher = publisher
+        # Row version (the game's ETag); not serialized, and None when not selected
+        self.version = version
+
+    @classmethod
+    def from_row(cls, row: Row) -> 'GameRecord':
+        """
+        Builds a record from a row of `get_game_rows_stmt`. Columns left out
+        of a sparse row are None.
+        """
+        category_id = getattr(row, 'category_id', None)
+        publisher_id = getattr(row, 'publisher_id', None)
+        return cls(
+            row.id, row.title, getattr(row, 'description', None), getattr(row, 'star_rating', None),
+            (category_id, row.category_name) if category_id is not None else None,
+            (publisher_id, row.publisher_name) if publisher_id is not None else None,
+            getattr(row, 'version', None),
+        )
+
+    def to_dict(self, fields: Collection[str] | None = None) -> dict[str, Any]:
+        """Same shape as Game.to_dict, limited to `fields` when given."""
+        data = {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'publisher': {'id': self.publisher[0], 'name': self.publisher[1]} if self.publisher else None,
+            'category': {'id': self.category[0], 'name': self.category[1]} if self.category else None,
+            'starRating': self.star_rating,
+        }
+        if fields is None:
+            return data
+        return {key: value for key, value in data.items() if key in fields}
+
+class CatalogSnapshot:
+    """
+    Immutable copy of every game at one catalog version (None if the
+    version could not be read), in (title, id) order, answering listing and
+    detail reads without a database session.
+    """
+
+    __slots__ = ('version', 'loaded_at', 'games', '_positions')
+
+    def __init__(self, version: int | None, games: list[GameRecord]) -> None:
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.games: tuple[GameRecord, ...] = tuple(sorted(games, key=_sort_key))
+        self._positions: dict[int, int] = {game.id: index for index, game in enumerate(self.games)}
+
+    @classmethod
+    def load(cls, version: int | None) -> 'CatalogSnapshot':
+        """Reads every game in one column query; no ORM objects are built."""
+        categories: dict[int, EntityRef] = {}
+        publishers: dict[int, EntityRef] = {}
+        games = []
+        for row in db.session.execute(get_game_rows_stmt().add_columns(Game.version)):
+            category = publisher = None
+            if row.category_id is not None:
+                category = categories.setdefault(row.category_id, (row.category_id, row.category_name))
+            if row.publisher_id is not None:
+                publisher = publishers.setdefault(row.publisher_id, (row.publisher_id, row.publisher_name))
+            games.append(GameRecord(row.id, row.title, row.description, row.star_rating, category, publisher, row.version))
+        return cls(version, games)
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    def get(self, id: int) -> GameRecord | None:
+        position = self._positions.get(id)
+        return self.games[position] if position is not None else None
+
+    def page(self, offset: int, limit: int) -> tuple[GameRecord, ...]:
+        return self.games[offset:offset + limit]
+
+    def after(self, key: tuple[str, int] | None, limit: int) -> tuple[GameRecord, ...]:
+        """Up to `limit` games following the (title, id) key, like a keyset query."""
+        start = bisect_right(self.games, key, key=_sort_key) if key is not None else 0
+        return self.games[start:start + limit]
+
+def get_game_rows_stmt(fields: Collection[str] = GAME_FIELDS, description_length: int | None = None) -> Select:
+    """
+    Just the columns a serialized game needs, as plain rows: no ORM objects
+    are built or tracked in the identity map.
+
+    `fields` limits the columns and joins to those serialized fields (id and
+    title are always selected, as the sort key); `description_length`
+    truncates the description in SQL.
+    """
+    columns: list[Any] = [Game.id, Game.title]
+    if 'description' in fields:
+        if description_length is None:
+            columns.append(Game.description)
+        else:
+            columns.append(func.substr(Game.description, 1, description_length).label('description'))
+    if 'starRating' in fields:
+        columns.append(Game.star_rating)
+    if 'category' in fields:
+        columns += [Category.id.label('category_id'), Category.name.label('category_name')]
+    if 'publisher' in fields:
+        columns += [Publisher.id.label('publisher_id'), Publisher.name.label('publisher_name')]
+
+    stmt = select(*columns)
+    if 'category' in fields:
+        stmt = stmt.join(Category, Game.category_id == Category.id, isouter=True)
+    if 'publisher' in fields:
+        stmt = stmt.join(Publisher, Game.publisher_id == Publisher.id, isouter=True)
+    return stmt
+
+def _is_current(snapshot: CatalogSnapshot | None, version: int | None) -> bool:
+    return snapshot is not None and version in (snapshot.version, None) and not catalog_view_expired(snapshot.loaded_at)
+
+def get_catalog_snapshot() -> CatalogSnapshot:
+    """
+    Returns the snapshot for the current catalog version, building it on
+    first use and again after each write. A per-process catalog version
+    misses other workers' writes, so the snapshot is then also rebuilt once
+    it is `CATALOG_VERSION_TTL` seconds old. The new snapshot replaces the
+    old one in a single assignment, so concurrent readers see one or the
+    other.
+    """
+    extensions = current_app.extensions
+    # Read the version before loading, so a write that lands mid-load leaves
+    # the new snapshot already stale
+    try:
+        version = get_catalog_version()
+    except OSError:
+        # The shared catalog version is unreachable: keep serving the current
+        # snapshot, or build one that the next readable version replaces
+        version = None
+    snapshot: CatalogSnapshot | None = extensions.get(_EXTENSION_KEY)
+    if _is_current(snapshot, version):
+        return snapshot
+
+    # One thread rebuilds; the others wait for it instead of loading in parallel
+    with extensions.setdefault(_BUILD_LOCK_KEY, threading.Lock()):
+        snapshot = extensions.get(_EXTENSION_KEY)
+        if not _is_current(snapshot, version):
+            # Always read from the primary: its version is the one being cached
+            snapshot = CatalogSnapshot.load(version)
+            extensions[_EXTENSION_KEY] = snapshot
+    return snapshot
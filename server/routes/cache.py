@@ -0,0 +1,10 @@
+from flask import jsonify, Response, Blueprint
+from utils.response_cache import get_response_cache
+
+# Create a Blueprint for cache instrumentation routes
+cache_bp = Blueprint('cache', __name__)
+
+@cache_bp.route('/api/cache/stats', methods=['GET'])
+def get_cache_stats() -> Response:
+    """This worker's hit/miss counters and the size of the response cache backend."""
+    return jsonify(get_response_cache().stats())
@@ -0,0 +1,26 @@
+from flask import jsonify, Response, Blueprint
+from models import Game, Category
+from utils.catalog_stats import get_entity_summaries
+from utils.conditional import catalog_conditional
+from utils.response_cache import cached_response
+
+# Create a Blueprint for categories routes
+categories_bp = Blueprint('categories', __name__)
+
+@categories_bp.route('/api/categories', methods=['GET'])
+@catalog_conditional
+@cached_response
+def get_categories() -> Response:
+    return jsonify(get_entity_summaries(Category, Game.category_id))
+
+@categories_bp.route('/api/categories/<int:id>', methods=['GET'])
+@catalog_conditional
+@cached_response
+def get_category(id: int) -> tuple[Response, int] | Response:
+    summaries = get_entity_summaries(Category, Game.category_id, entity_id=id)
+
+    # Return 404 if category not found
+    if not summaries:
+        return jsonify({"error": "Category not found"}), 404
+
+    return jsonify(summaries[0])
@@ -1,69 +1,757 @@
-from flask import jsonify, Response, Blueprint, request
-from sqlalchemy import Select, func, select
-from sqlalchemy.orm import contains_eager
-from models import db, Game, Publisher, Category
+import math
+from typing import Any, Iterator, NamedTuple, Sequence
+from flask import current_app, jsonify, Response, Blueprint, request, stream_with_context
+from sqlalchemy import ColumnElement, Select, and_, func, or_, select, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
+from models import (
+    db, Game, GameRecord, GAME_FIELDS, games_fts, get_catalog_snapshot, get_game_rows_stmt, search_supported,
+)
+from utils.conditional import catalog_conditional, game_conditional, game_etag, if_match_fails
+from utils.count_cache import get_cached_count
+from utils.database import get_read_bind_arguments
+from utils.compression import compress_chunks, negotiate_encoding
+from utils.export import EXPORT_FORMATS, csv_chunks, ndjson_chunks
+from utils.ids import MAX_INTEGER, in_integer_range, parse_id
+from utils.game_writes import (
+    MAX_BULK_ROWS, GameInput, get_rating_values, parse_game_input, resolve_game_inputs, upsert_games,
+    upsert_supported,
+)
+from utils.rating_queue import MAX_VOTE, MIN_VOTE, get_rating_queue
+from utils.similarity import DEFAULT_SIMILAR_GAMES, MAX_SIMILAR_GAMES, get_similarity_index, similarity_supported
+from utils.pagination import decode_cursor, encode_cursor
+from utils.response_cache import cached_response
+from utils.search import HIGHLIGHT_END, HIGHLIGHT_START, SNIPPET_TOKENS, build_match_query, render_highlight
+from utils.serialization import json_response
 
 # Create a Blueprint for games routes
 games_bp = Blueprint('games', __name__)
 
-# TODO: Add Create, Update, Delete endpoints to complete CRUD functionality
-# - POST /api/games - Create a new game
-# - PUT /api/games/<id> - Update an existing game
-# - DELETE /api/games/<id> - Delete a game
-
 DEFAULT_PAGE_SIZE = 9
 
-def get_games_base_stmt() -> Select:
+# Most games one `ids=` lookup may ask for
+MAX_BATCH_IDS = 100
+
+# Rows fetched from the database cursor, and written out, at a time
+EXPORT_BATCH_SIZE = 1000
+
+# Description characters returned by view=summary: a game card shows two lines
+SUMMARY_DESCRIPTION_LENGTH = 150
+
+class FieldSelection(NamedTuple):
+    """Which game fields a listing returns, and how much of the description."""
+    fields: frozenset[str] = frozenset(GAME_FIELDS)
+    description_length: int | None = None
+
+FULL_SELECTION = FieldSelection()
+
+class GameFilters(NamedTuple):
+    """Listing filters: games of one category and/or publisher, rated at least `min_rating`."""
+    category_id: int | None = None
+    publisher_id: int | None = None
+    min_rating: float | None = None
+
+NO_FILTERS = GameFilters()
+
+# Listing orders: title A-Z, best rated first (unrated last), most recently added first
+GAME_SORTS = ('title', 'rating', 'newest')
+DEFAULT_SORT = 'title'
+
+_SORT_ORDERS = {
+    'title': (Game.title.asc(), Game.id.asc()),
+    'rating': (Game.star_rating.desc().nulls_last(), Game.id.desc()),
+    'newest': (Game.id.desc(),),
+}
+
+# Types of the values in a cursor for each sort (bools are rejected)
+_CURSOR_TYPES: dict[str, tuple[tuple[type, ...], ...]] = {
+    'title': ((str,), (int,)),
+    'rating': ((int, float, type(None)), (int,)),
+    'newest': ((int,),),
+}
+
+def _arg_flag(name: str, default: bool) -> bool:
+    value = request.args.get(name, '').strip().lower()
+    if not value:
+        return default
+    return value not in {'0', 'false', 'no', 'off'}
+
+def _parse_field_selection() -> FieldSelection:
+    """
+    Reads `fields` (comma-separated game keys; id is always included) and
+    `view` (`full` or `summary`, which truncates the description).
+
+    Raises ValueError naming the offending value.
+    """
+    view = request.args.get('view', 'full')
+    if view not in ('full', 'summary'):
+        raise ValueError(f"Invalid view: {view}")
+    description_length = SUMMARY_DESCRIPTION_LENGTH if view == 'summary' else None
+
+    fields_arg = request.args.get('fields')
+    if fields_arg is None:
+        return FieldSelection(frozenset(GAME_FIELDS), description_length)
+    fields = {field.strip() for field in fields_arg.split(',') if field.strip()}
+    for field in sorted(fields):
+        if field not in GAME_FIELDS:
+            raise ValueError(f"Unknown field: {field}")
+    return FieldSelection(frozenset(fields | {'id'}), description_length)
+
+def _parse_id_arg(name: str) -> int | None:
+    value = request.args.get(name)
+    if value is None or value == '':
+        return None
+    return parse_id(value, name)
+
+def _parse_game_filters() -> GameFilters:
+    """
+    Reads `category` and `publisher` (ids) and `minRating`.
+
+    Raises ValueError naming the offending value.
+    """
+    min_rating_arg = request.args.get('minRating')
+    min_rating = None
+    if min_rating_arg:
+        try:
+            min_rating = float(min_rating_arg)
+        except ValueError:
+            min_rating = math.nan
+        if not math.isfinite(min_rating):
+            raise ValueError(f"Invalid minRating: {min_rating_arg}")
+    return GameFilters(_parse_id_arg('category'), _parse_id_arg('publisher'), min_rating)
+
+def _parse_ids(value: str) -> list[int]:
+    """
+    Reads a comma-separated list of game ids, dropping repeats but keeping
+    the order given.
+
+    Raises ValueError naming the offending value.
+    """
+    ids: dict[int, None] = {}
+    for part in value.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        ids[parse_id(part)] = None
+    if not ids:
+        raise ValueError("ids must list at least one game id")
+    if len(ids) > MAX_BATCH_IDS:
+        raise ValueError(f"At most {MAX_BATCH_IDS} ids can be requested at once")
+    return list(ids)
+
+def _parse_sort() -> str:
+    sort = request.args.get('sort') or DEFAULT_SORT
+    if sort not in GAME_SORTS:
+        raise ValueError(f"Invalid sort: {sort}")
+    return sort
+
+def _filter_conditions(filters: GameFilters, sort: str = 'rating') -> list[ColumnElement[bool]]:
+    conditions: list[ColumnElement[bool]] = []
+    if filters.category_id is not None:
+        conditions.append(Game.category_id == filters.category_id)
+    if filters.publisher_id is not None:
+        conditions.append(Game.publisher_id == filters.publisher_id)
+    if filters.min_rating is not None:
+        rating: ColumnElement[Any] = Game.star_rating
+        if sort != 'rating':
+            # `+ 0` hides the rating index from the planner, so it walks the
+            # sort order's index and skips low ratings instead of range-reading
+            # every match by rating and sorting them all for one page
+            rating = rating + 0
+        conditions.append(rating >= filters.min_rating)
+    return conditions
+
+def get_games_base_stmt(selection: FieldSelection = FULL_SELECTION, sort: str = DEFAULT_SORT) -> Select:
+    # Column rows rather than Game entities: serializing a page never needs
+    # ORM objects, their identity map entries or lazy relationship loads.
+    # Unrequested fields are left out of the SELECT (and their joins dropped),
+    # but the sort key is always read for the cursor
+    fields = selection.fields | {'starRating'} if sort == 'rating' else selection.fields
+    return get_game_rows_stmt(fields, selection.description_length)
+
+def get_games_page_stmt(offset: int, limit: int, selection: FieldSelection = FULL_SELECTION,
+                        filters: GameFilters = NO_FILTERS, sort: str = DEFAULT_SORT) -> Select:
+    """
+    Page of games in `sort` order. Each filter and sort combination is served
+    by an index that yields rows already in order (ux_games_title,
+    ix_games_star_rating, the primary key, or a per-category/publisher
+    composite), so no page sorts the full result set.
+    """
     return (
-        select(Game)
-        .join(Publisher, Game.publisher_id == Publisher.id, isouter=True)
-        .join(Category, Game.category_id == Category.id, isouter=True)
-        .options(
-            contains_eager(Game.publisher),
-            contains_eager(Game.category),
+        get_games_base_stmt(selection, sort)
+        .where(*_filter_conditions(filters, sort))
+        .order_by(*_SORT_ORDERS[sort])
+        .offset(offset)
+        .limit(limit)
+    )
+
+def get_games_count_stmt(filters: GameFilters = NO_FILTERS) -> Select:
+    # The outer joins are many-to-one, so counting games alone is equivalent
+    # to counting the joined rows
+    return select(func.count(Game.id)).where(*_filter_conditions(filters))
+
+def get_game_by_id_stmt(id: int) -> Select:
+    # With the row version, which detail responses carry as their ETag
+    return get_games_base_stmt().add_columns(Game.version).where(Game.id == id)
+
+def get_games_by_ids_stmt(ids: Sequence[int], selection: FieldSelection = FULL_SELECTION) -> Select:
+    """The given games in one primary key IN lookup, in no particular order."""
+    return get_games_base_stmt(selection).where(Game.id.in_(ids))
+
+def get_games_export_stmt(after: int | None = None) -> Select:
+    """Every game after the given id, in primary key order."""
+    stmt = get_games_base_stmt().order_by(Game.id.asc())
+    if after is not None:
+        stmt = stmt.where(Game.id > after)
+    return stmt
+
+def get_games_keyset_stmt(after: tuple[Any, ...] | None, page_size: int,
+                          selection: FieldSelection = FULL_SELECTION,
+                          filters: GameFilters = NO_FILTERS, sort: str = DEFAULT_SORT) -> Select:
+    """
+    Page of games in `sort` order starting after the given key: (title, id),
+    (star_rating, id) or (id,).
+
+    For the rating sort the statement reads either the rated games or, when
+    the key's rating is None, the unrated ones that follow them: a single
+    condition spanning both would stop the index seeking to the key.
+    """
+    stmt = (
+        get_games_base_stmt(selection, sort)
+        .where(*_filter_conditions(filters, sort))
+        .order_by(*_SORT_ORDERS[sort])
+    )
+    if sort == 'title':
+        if after is not None:
+            stmt = stmt.where(tuple_(Game.title, Game.id) > tuple_(*after))
+    elif sort == 'newest':
+        if after is not None:
+            stmt = stmt.where(Game.id < after[0])
+    elif after is None or after[0] is not None:
+        stmt = stmt.where(Game.star_rating.is_not(None))
+        if after is not None:
+            stmt = stmt.where(tuple_(Game.star_rating, Game.id) < tuple_(*after))
+    else:
+        stmt = stmt.where(Game.star_rating.is_(None))
+        if after[1] is not None:
+            stmt = stmt.where(Game.id < after[1])
+    # Fetch one extra row to learn whether another page follows
+    return stmt.limit(page_size + 1)
+
+def get_games_search_stmt(match: str, after: tuple[float, int] | None, page_size: int,
+                          selection: FieldSelection = FULL_SELECTION, filters: GameFilters = NO_FILTERS) -> Select:
+    """
+    Games matching an FTS5 query, best bm25 rank first (then by id), with the
+    highlighted title and a description snippet. The MATCH drives the plan;
+    games rows are then read by primary key.
+    """
+    rank = games_fts.c.rank
+    stmt = (
+        get_games_base_stmt(selection)
+        .add_columns(
+            rank.label('rank'),
+            func.highlight(games_fts.c.games_fts, 0, HIGHLIGHT_START, HIGHLIGHT_END).label('title_highlight'),
+            func.snippet(
+                games_fts.c.games_fts, 1, HIGHLIGHT_START, HIGHLIGHT_END, '…', SNIPPET_TOKENS
+            ).label('description_snippet'),
+        )
+        .join(games_fts, games_fts.c.rowid == Game.id)
+        .where(games_fts.c.games_fts.match(match), *_filter_conditions(filters))
+        .order_by(rank.asc(), Game.id.asc())
+    )
+    if after is not None:
+        stmt = stmt.where(or_(rank > after[0], and_(rank == after[0], Game.id > after[1])))
+    # Fetch one extra row to learn whether another page follows
+    return stmt.limit(page_size + 1)
+
+def _use_snapshot(filters: GameFilters = NO_FILTERS, sort: str = DEFAULT_SORT) -> bool:
+    # The snapshot holds the unfiltered catalog in title order only
+    return current_app.config.get('CATALOG_SNAPSHOT', False) and filters == NO_FILTERS and sort == DEFAULT_SORT
+
+def _fetch_games_page(offset: int, limit: int, selection: FieldSelection,
+                      filters: GameFilters = NO_FILTERS, sort: str = DEFAULT_SORT) -> Sequence[GameRecord]:
+    if _use_snapshot(filters, sort):
+        return get_catalog_snapshot().page(offset, limit)
+    rows = db.session.execute(
+        get_games_page_stmt(offset, limit, selection, filters, sort), bind_arguments=get_read_bind_arguments()
+    )
+    return [GameRecord.from_row(row) for row in rows]
+
+def _fetch_games_after(after: tuple[Any, ...] | None, page_size: int, selection: FieldSelection,
+                       filters: GameFilters = NO_FILTERS, sort: str = DEFAULT_SORT) -> Sequence[GameRecord]:
+    """Up to page_size + 1 games following `after`; the extra one signals a next page."""
+    if _use_snapshot(filters, sort):
+        return get_catalog_snapshot().after(after, page_size + 1)
+
+    def fetch(key: tuple[Any, ...] | None, size: int) -> list[GameRecord]:
+        rows = db.session.execute(
+            get_games_keyset_stmt(key, size, selection, filters, sort), bind_arguments=get_read_bind_arguments()
         )
+        return [GameRecord.from_row(row) for row in rows]
+
+    games = fetch(after, page_size)
+    # By rating, a page that runs out of rated games continues with the
+    # unrated ones (which minRating excludes)
+    in_rated_games = after is None or after[0] is not None
+    if sort == 'rating' and in_rated_games and len(games) <= page_size and filters.min_rating is None:
+        games += fetch((None, None), page_size - len(games))
+    return games
+
+def _count_games(filters: GameFilters = NO_FILTERS) -> int:
+    if _use_snapshot(filters):
+        return len(get_catalog_snapshot())
+    # Cached per filter combination until the next catalog write
+    return get_cached_count(
+        ('games', filters),
+        lambda: db.session.scalar(get_games_count_stmt(filters), bind_arguments=get_read_bind_arguments()) or 0
+    )
+
+def _parse_cursor(cursor: str, types: tuple[tuple[type, ...], ...]) -> tuple[Any, ...]:
+    """
+    Decodes a cursor whose values must have the given types, in order.
+
+    Raises ValueError if it does not.
+    """
+    values = decode_cursor(cursor, len(types))
+    for value, allowed in zip(values, types):
+        if isinstance(value, bool) or not isinstance(value, allowed):
+            raise ValueError("Invalid cursor")
+        if isinstance(value, int) and not in_integer_range(value):
+            raise ValueError("Invalid cursor")
+    return tuple(values)
+
+def _cursor_values(game: GameRecord, sort: str) -> list[Any]:
+    if sort == 'title':
+        return [game.title, game.id]
+    if sort == 'rating':
+        return [game.star_rating, game.id]
+    return [game.id]
+
+def _serialize_game(game: GameRecord, selection: FieldSelection) -> dict[str, Any]:
+    data = game.to_dict(selection.fields)
+    # Rows from SQL arrive truncated already; snapshot records do not
+    if selection.description_length is not None and data.get('description'):
+        data['description'] = data['description'][:selection.description_length]
+    return data
+
+def _games_response(games: Sequence[GameRecord], pagination: dict[str, Any],
+                    selection: FieldSelection) -> Response:
+    # Star ratings are the only floats in the payload
+    return json_response(
+        {"games": [_serialize_game(game, selection) for game in games], "pagination": pagination},
+        floats=[game.star_rating for game in games],
+    )
+
+def _get_games_by_cursor(cursor: str, page_size: int, selection: FieldSelection,
+                         filters: GameFilters = NO_FILTERS, sort: str = DEFAULT_SORT) -> tuple[Response, int] | Response:
+    after: tuple[Any, ...] | None = None
+    if cursor:
+        try:
+            after = _parse_cursor(cursor, _CURSOR_TYPES[sort])
+        except ValueError:
+            return jsonify({"error": "Invalid cursor"}), 400
+
+    games = _fetch_games_after(after, page_size, selection, filters, sort)
+
+    next_cursor = None
+    if len(games) > page_size:
+        games = games[:page_size]
+        next_cursor = encode_cursor(_cursor_values(games[-1], sort))
+
+    return _games_response(games, {
+        "pageSize": page_size,
+        "nextCursor": next_cursor,
+    }, selection)
+
+def _find_games_by_ids(ids: Sequence[int], selection: FieldSelection = FULL_SELECTION) -> dict[int, GameRecord]:
+    if _use_snapshot():
+        snapshot = get_catalog_snapshot()
+        return {id: game for id in ids if (game := snapshot.get(id)) is not None}
+    rows = db.session.execute(get_games_by_ids_stmt(ids, selection), bind_arguments=get_read_bind_arguments())
+    return {row.id: GameRecord.from_row(row) for row in rows}
+
+def _get_games_by_ids(ids: list[int], selection: FieldSelection) -> Response:
+    found = _find_games_by_ids(ids, selection)
+
+    # Games come back in the order they were asked for
+    games = [found[id] for id in ids if id in found]
+    return json_response(
+        {
+            "games": [_serialize_game(game, selection) for game in games],
+            "missing": [id for id in ids if id not in found],
+        },
+        floats=[game.star_rating for game in games],
+    )
+
+def _search_games(query: str, cursor: str, page_size: int, selection: FieldSelection,
+                  filters: GameFilters = NO_FILTERS) -> tuple[Response, int] | Response:
+    if not search_supported(db.engine):
+        return jsonify({"error": "Search is not supported on this database"}), 501
+    try:
+        match = build_match_query(query)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    after: tuple[Any, ...] | None = None
+    if cursor:
+        try:
+            after = _parse_cursor(cursor, ((int, float), (int,)))
+        except ValueError:
+            return jsonify({"error": "Invalid cursor"}), 400
+
+    rows = db.session.execute(
+        get_games_search_stmt(match, after, page_size, selection, filters), bind_arguments=get_read_bind_arguments()
+    ).all()
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = encode_cursor([rows[-1].rank, rows[-1].id])
+
+    games = []
+    for row in rows:
+        game = _serialize_game(GameRecord.from_row(row), selection)
+        game['highlights'] = {
+            'title': render_highlight(row.title_highlight),
+            'description': render_highlight(row.description_snippet),
+        }
+        games.append(game)
+
+    return json_response(
+        {"games": games, "pagination": {"pageSize": page_size, "nextCursor": next_cursor}},
+        floats=[getattr(row, 'star_rating', None) for row in rows],
     )
 
 @games_bp.route('/api/games', methods=['GET'])
-def get_games() -> Response:
+@catalog_conditional
+@cached_response
+def get_games() -> tuple[Response, int] | Response:
     page = request.args.get('page', default=1, type=int)
     page_size = request.args.get('pageSize', default=DEFAULT_PAGE_SIZE, type=int)
 
-    # Clamp pagination values
-    page = max(1, page)
+    # Clamp pagination values (the offset must fit a database INTEGER)
     page_size = max(1, min(page_size, 100))
+    page = max(1, min(page, MAX_INTEGER // page_size))
 
-    base_stmt = get_games_base_stmt().order_by(Game.title.asc())
+    # List views can ask for fewer fields or a short description; only the
+    # requested columns are read and serialized
+    try:
+        selection = _parse_field_selection()
+        filters = _parse_game_filters()
+        sort = _parse_sort()
+        ids_arg = request.args.get('ids')
+        ids = _parse_ids(ids_arg) if ids_arg is not None else None
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
 
-    # Get total count before pagination (clear ordering for performance)
-    count_stmt = select(func.count()).select_from(base_stmt.order_by(None).subquery())
-    total = db.session.scalar(count_stmt) or 0
-    total_pages = max(1, (total + page_size - 1) // page_size)
+    # Batch lookup: several games by id in one request and one query, in the
+    # order requested, with the ids that do not exist listed as `missing`
+    if ids is not None:
+        return _get_games_by_ids(ids, selection)
+
+    # Full-text search: ranked by relevance (`sort` does not apply) and
+    # always paged by cursor
+    query = request.args.get('q')
+    if query is not None:
+        return _search_games(query, request.args.get('cursor', ''), page_size, selection, filters)
+
+    # Keyset mode: `cursor` is present (empty for the first page). Cost per page
+    # stays flat no matter how deep the client pages, unlike OFFSET.
+    cursor = request.args.get('cursor')
+    if cursor is not None:
+        return _get_games_by_cursor(cursor, page_size, selection, filters, sort)
 
-    # Apply pagination
     offset = (page - 1) * page_size
-    paginated_stmt = base_stmt.offset(offset).limit(page_size)
-    games_list = [game.to_dict() for game in db.session.scalars(paginated_stmt).unique().all()]
 
-    return jsonify({
-        "games": games_list,
-        "pagination": {
+    # Clients that only need "is there a next page" can skip the count
+    if not _arg_flag('includeTotal', default=True):
+        games = _fetch_games_page(offset, page_size + 1, selection, filters, sort)
+        return _games_response(games[:page_size], {
             "page": page,
             "pageSize": page_size,
-            "total": total,
-            "totalPages": total_pages,
-        },
-    })
+            "hasNext": len(games) > page_size,
+        }, selection)
+
+    total = _count_games(filters)
+    total_pages = max(1, (total + page_size - 1) // page_size)
+
+    # Listing reads come from the snapshot when enabled, otherwise from the
+    # replica when one is configured
+    games = _fetch_games_page(offset, page_size, selection, filters, sort)
+
+    return _games_response(games, {
+        "page": page,
+        "pageSize": page_size,
+        "total": total,
+        "totalPages": total_pages,
+    }, selection)
+
+@games_bp.route('/api/games/export', methods=['GET'])
+@catalog_conditional
+def export_games() -> tuple[Response, int] | Response:
+    """
+    Streams the whole catalog as NDJSON (default) or CSV (`format=csv`), in
+    id order. `after` resumes an interrupted export after the last id seen.
+
+    Rows are read from one cursor in batches of EXPORT_BATCH_SIZE and written
+    as they arrive, so memory stays flat however large the catalog is.
+    """
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"error": f"Invalid format: {export_format}"}), 400
+    try:
+        after = _parse_id_arg('after')
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    def batches() -> Iterator[list[GameRecord]]:
+        # yield_per streams the result (a server-side cursor where the
+        # driver has one) instead of buffering every row
+        stmt = get_games_export_stmt(after).execution_options(yield_per=EXPORT_BATCH_SIZE)
+        result = db.session.execute(stmt, bind_arguments=get_read_bind_arguments())
+        for rows in result.partitions():
+            yield [GameRecord.from_row(row) for row in rows]
+
+    chunks = csv_chunks(batches()) if export_format == 'csv' else ndjson_chunks(batches())
+    encoding = negotiate_encoding()
+    if encoding is not None:
+        chunks = compress_chunks(chunks, encoding)
+
+    # The generator runs after the view returns; keep the request context
+    # (and with it the database session) until the last chunk is written
+    response = current_app.response_class(stream_with_context(chunks), mimetype=EXPORT_FORMATS[export_format])
+    response.content_encoding = encoding
+    response.vary.add('Accept-Encoding')
+    response.headers['Content-Disposition'] = f'attachment; filename=games.{export_format}'
+    return response
 
 @games_bp.route('/api/games/<int:id>', methods=['GET'])
+@game_conditional
+@cached_response
 def get_game(id: int) -> tuple[Response, int] | Response:
-    # Use the base statement and add filter for specific game
-    stmt = get_games_base_stmt().where(Game.id == id)
-    game = db.session.scalars(stmt).unique().one_or_none()
+    if _use_snapshot():
+        game = get_catalog_snapshot().get(id)
+    else:
+        # Use the base statement and add filter for specific game
+        row = db.session.execute(get_game_by_id_stmt(id)).one_or_none()
+        game = GameRecord.from_row(row) if row is not None else None
 
     # Return 404 if game not found
     if not game:
         return jsonify({"error": "Game not found"}), 404
 
-    # Convert the result using the model's to_dict method
-    return jsonify(game.to_dict())
+    response = json_response(game.to_dict(), floats=[game.star_rating])
+    response.set_etag(game_etag(game.id, game.version))
+    return response
+
+def _parse_game_write() -> tuple[dict[str, Any] | None, str | None]:
+    """
+    The games row for a single-game request body, or the reason it is
+    invalid. The row has no `star_rating` unless the body has `starRating`.
+    """
+    body = request.get_json(silent=True)
+    try:
+        game_input = parse_game_input(body)
+    except ValueError as exc:
+        return None, str(exc)
+    resolved = resolve_game_inputs({0: game_input})
+    if resolved.errors:
+        return None, resolved.errors[0]['error']
+    row = resolved.rows[0]
+    if 'starRating' not in body:
+        del row['star_rating']
+    return row, None
+
+def _stale_game_response(game: Game | None = None) -> tuple[Response, int]:
+    """
+    A 412 response carrying the game as stored now, and its ETag, so the
+    client can retry without another read: a cached or snapshot detail read
+    may lag behind rating flushes.
+    """
+    if game is None:
+        return jsonify({"error": "Game has been modified since it was read"}), 412
+    response = json_response(
+        {"error": "Game has been modified since it was read", "game": game.to_dict()}, floats=[game.star_rating]
+    )
+    response.set_etag(game_etag(game.id, game.version))
+    return response, 412
+
+def _commit_game_write(game_id: int | None = None) -> tuple[Response, int] | None:
+    """
+    Commits the session; returns a 409 response if a title is already
+    taken, or a 412 response if another writer changed the game after it
+    was loaded (its version no longer matched in the UPDATE or DELETE),
+    carrying game `game_id` as stored now.
+    """
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({"error": "A game with this title already exists"}), 409
+    except StaleDataError:
+        db.session.rollback()
+        current = db.session.get(Game, game_id, populate_existing=True) if game_id is not None else None
+        return _stale_game_response(current)
+    return None
+
+def _game_write_response(game: Game) -> Response:
+    """The written game, with the ETag of its new version for the next If-Match."""
+    response = json_response(game.to_dict(), floats=[game.star_rating])
+    response.set_etag(game_etag(game.id, game.version))
+    return response
+
+@games_bp.route('/api/games', methods=['POST'])
+def create_game() -> tuple[Response, int] | Response:
+    row, error = _parse_game_write()
+    if error is not None:
+        return jsonify({"error": error}), 400
+
+    game = Game(**row)
+    db.session.add(game)
+    conflict = _commit_game_write()
+    if conflict is not None:
+        return conflict
+
+    response = _game_write_response(game)
+    response.status_code = 201
+    response.headers['Location'] = f'/api/games/{game.id}'
+    return response
+
+@games_bp.route('/api/games/<int:id>', methods=['PUT'])
+def update_game(id: int) -> tuple[Response, int] | Response:
+    game = db.session.get(Game, id)
+    if game is None:
+        return jsonify({"error": "Game not found"}), 404
+    if if_match_fails(game_etag(game.id, game.version)):
+        return _stale_game_response(game)
+    row, error = _parse_game_write()
+    if error is not None:
+        return jsonify({"error": error}), 400
+    if 'star_rating' in row:
+        row.update(get_rating_values(row['star_rating']))
+
+    for key, value in row.items():
+        setattr(game, key, value)
+    conflict = _commit_game_write(id)
+    if conflict is not None:
+        return conflict
+
+    return _game_write_response(game)
+
+@games_bp.route('/api/games/<int:id>', methods=['DELETE'])
+def delete_game(id: int) -> tuple[Response, int] | Response:
+    game = db.session.get(Game, id)
+    if game is None:
+        return jsonify({"error": "Game not found"}), 404
+    if if_match_fails(game_etag(game.id, game.version)):
+        return _stale_game_response(game)
+
+    db.session.delete(game)
+    conflict = _commit_game_write(id)
+    if conflict is not None:
+        return conflict
+    return current_app.response_class(status=204)
+
+@games_bp.route('/api/games/bulk', methods=['POST'])
+def bulk_upsert_games() -> tuple[Response, int] | Response:
+    """
+    Creates or updates (matched by title) up to MAX_BULK_ROWS games from a
+    JSON list, or an object with a `games` list, in one transaction.
+
+    Every row is validated before anything is written: if any row is
+    invalid, nothing is and each problem is listed by row index. A title
+    repeated within the request keeps its last row.
+    """
+    if not upsert_supported(db.engine):
+        return jsonify({"error": "Bulk upsert is not supported on this database"}), 501
+    data = request.get_json(silent=True)
+    items = data.get('games') if isinstance(data, dict) else data
+    if not isinstance(items, list) or not items:
+        return jsonify({"error": "Request body must be a non-empty list of games"}), 400
+    if len(items) > MAX_BULK_ROWS:
+        return jsonify({"error": f"At most {MAX_BULK_ROWS} games can be written at once"}), 413
+
+    inputs: dict[int, GameInput] = {}
+    errors: list[dict[str, Any]] = []
+    for index, item in enumerate(items):
+        try:
+            inputs[index] = parse_game_input(item)
+        except ValueError as exc:
+            errors.append({'index': index, 'error': str(exc)})
+
+    # Last row wins for a repeated title
+    last_index = {game.title: index for index, game in inputs.items()}
+    inputs = {index: inputs[index] for index in sorted(last_index.values())}
+
+    # Category and publisher names: one query per table for the whole request
+    resolved = resolve_game_inputs(inputs)
+    errors = sorted(errors + resolved.errors, key=lambda error: error['index'])
+    if errors:
+        return jsonify({"error": "Invalid games; nothing was written", "errors": errors}), 400
+
+    counts = upsert_games(resolved.rows)
+    db.session.commit()
+    return jsonify(counts)
+
+@games_bp.route('/api/games/<int:id>/similar', methods=['GET'])
+@catalog_conditional
+@cached_response
+def get_similar_games(id: int) -> tuple[Response, int] | Response:
+    """
+    The games most like this one, best first, each with its `similarity`
+    score (0-1) from description TF-IDF cosine similarity, shared category
+    and publisher, and star rating proximity.
+    """
+    if not similarity_supported():
+        return jsonify({"error": "Similar games need NumPy, which is not installed"}), 501
+    limit = request.args.get('limit', DEFAULT_SIMILAR_GAMES, type=int)
+    if not 1 <= limit <= MAX_SIMILAR_GAMES:
+        return jsonify({"error": f"limit must be between 1 and {MAX_SIMILAR_GAMES}"}), 400
+
+    matches = get_similarity_index().similar(id, limit)
+    if matches is None:
+        return jsonify({"error": "Game not found"}), 404
+
+    found = _find_games_by_ids([game_id for game_id, _ in matches])
+    results = [(found[game_id], round(score, 4)) for game_id, score in matches if game_id in found]
+    return json_response(
+        {"gameId": id, "games": [{**game.to_dict(), "similarity": score} for game, score in results]},
+        floats=[value for game, score in results for value in (game.star_rating, score)],
+    )
+
+@games_bp.route('/api/games/<int:id>/ratings', methods=['POST'])
+def rate_game(id: int) -> tuple[Response, int]:
+    """
+    Queues one rating vote (1-5) for the game. Votes are written in batches
+    by the rating queue, so the game's average reflects them within about a
+    second.
+    """
+    data = request.get_json(silent=True)
+    rating = data.get('rating') if isinstance(data, dict) else None
+    if isinstance(rating, bool) or not isinstance(rating, (int, float)) or not MIN_VOTE <= rating <= MAX_VOTE:
+        return jsonify({"error": f"rating must be a number between {MIN_VOTE:g} and {MAX_VOTE:g}"}), 400
+    if db.session.scalar(select(Game.id).where(Game.id == id)) is None:
+        return jsonify({"error": "Game not found"}), 404
+
+    get_rating_queue().submit(id, float(rating))
+    return jsonify({"gameId": id, "queued": True}), 202
+
+@games_bp.route('/api/games/<int:id>/ratings', methods=['GET'])
+def get_game_ratings(id: int) -> tuple[Response, int] | Response:
+    """Vote totals and running average, counting votes this worker has not written yet."""
+    row = db.session.execute(
+        select(Game.rating_sum, Game.rating_count, Game.star_rating).where(Game.id == id)
+    ).one_or_none()
+    if row is None:
+        return jsonify({"error": "Game not found"}), 404
+
+    pending_sum, pending_count = get_rating_queue().pending(id)
+    vote_sum = row.rating_sum + pending_sum
+    vote_count = row.rating_count + pending_count
+    return jsonify({
+        "gameId": id,
+        "sum": vote_sum,
+        "count": vote_count,
+        "average": vote_sum / vote_count if vote_count else row.star_rating,
+        "pending": pending_count,
+    })
@@ -0,0 +1,43 @@
+from flask import jsonify, Response, Blueprint, request
+from models import db, Category, GameRecord
+from utils.conditional import catalog_conditional
+from utils.database import get_read_bind_arguments
+from utils.ids import parse_id
+from utils.leaderboards import DEFAULT_LEADERBOARD_SIZE, LEADERBOARDS, MAX_LEADERBOARD_SIZE, get_leaderboard_stmt
+from utils.response_cache import cached_response
+from utils.serialization import json_response
+
+# Create a Blueprint for leaderboard routes
+leaderboards_bp = Blueprint('leaderboards', __name__)
+
+@leaderboards_bp.route('/api/leaderboards/<board>', methods=['GET'])
+@catalog_conditional
+@cached_response
+def get_leaderboard(board: str) -> tuple[Response, int] | Response:
+    """
+    The top games by star rating (`top-rated`) or by recent rating votes
+    (`trending`), overall or within `category`, best first.
+    """
+    if board not in LEADERBOARDS:
+        return jsonify({"error": f"Unknown leaderboard; expected one of: {', '.join(LEADERBOARDS)}"}), 404
+
+    limit = request.args.get('limit', DEFAULT_LEADERBOARD_SIZE, type=int)
+    if not 1 <= limit <= MAX_LEADERBOARD_SIZE:
+        return jsonify({"error": f"limit must be between 1 and {MAX_LEADERBOARD_SIZE}"}), 400
+
+    category_id = None
+    if 'category' in request.args:
+        try:
+            category_id = parse_id(request.args['category'], 'category')
+        except ValueError as exc:
+            return jsonify({"error": str(exc)}), 400
+        if db.session.get(Category, category_id) is None:
+            return jsonify({"error": "Category not found"}), 404
+
+    stmt = get_leaderboard_stmt(board, limit, category_id)
+    rows = db.session.execute(stmt, bind_arguments=get_read_bind_arguments())
+    games = [GameRecord.from_row(row) for row in rows]
+    return json_response(
+        {"leaderboard": board, "category": category_id, "games": [game.to_dict() for game in games]},
+        floats=[game.star_rating for game in games],
+    )
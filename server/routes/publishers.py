@@ -0,0 +1,26 @@
+from flask import jsonify, Response, Blueprint
+from models import Game, Publisher
+from utils.catalog_stats import get_entity_summaries
+from utils.conditional import catalog_conditional
+from utils.response_cache import cached_response
+
+# Create a Blueprint for publishers routes
+publishers_bp = Blueprint('publishers', __name__)
+
+@publishers_bp.route('/api/publishers', methods=['GET'])
+@catalog_conditional
+@cached_response
+def get_publishers() -> Response:
+    return jsonify(get_entity_summaries(Publisher, Game.publisher_id))
+
+@publishers_bp.route('/api/publishers/<int:id>', methods=['GET'])
+@catalog_conditional
+@cached_response
+def get_publisher(id: int) -> tuple[Response, int] | Response:
+    summaries = get_entity_summaries(Publisher, Game.publisher_id, entity_id=id)
+
+    # Return 404 if publisher not found
+    if not summaries:
+        return jsonify({"error": "Publisher not found"}), 404
+
+    return jsonify(summaries[0])
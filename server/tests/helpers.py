@@ -0,0 +1,52 @@
+import os
+from contextlib import contextmanager
+import re
+from typing import Any, Iterable, Iterator
+from sqlalchemy import Executable, event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+def get_test_database_uri() -> str:
+    """
+    Database the suite runs against: in-memory SQLite by default, or any
+    SQLAlchemy URL in TEST_DATABASE_URL (e.g. a local PostgreSQL).
+    """
+    return os.environ.get('TEST_DATABASE_URL', 'sqlite:///:memory:')
+
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[list[str]]:
+    """Collects the SQL statements executed on `engine` inside the block."""
+    statements: list[str] = []
+
+    def _record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', _record)
+
+# A plan step reading a whole table in rowid order, with no index involved
+_FULL_SCAN_PATTERN = re.compile(r'^SCAN (\w+)$')
+
+def find_full_table_scans(session: Session, stmt: Executable, allowed_tables: Iterable[str] = ()) -> list[str]:
+    """
+    Runs SQLite's EXPLAIN QUERY PLAN for `stmt` and returns the plan steps
+    that scan an entire table without an index. Scans of `allowed_tables`
+    (e.g. a small table the endpoint lists in full) are ignored.
+    """
+    # Subqueries and CTEs also show up as SCAN steps; only real tables count
+    tables = set(inspect(session.get_bind()).get_table_names()) - set(allowed_tables)
+    scans = []
+    for detail in explain_query_plan(session, stmt):
+        match = _FULL_SCAN_PATTERN.match(detail)
+        if match and match.group(1) in tables:
+            scans.append(detail)
+    return scans
+
+def explain_query_plan(session: Session, stmt: Executable) -> list[str]:
+    """Returns the steps of SQLite's EXPLAIN QUERY PLAN for `stmt`."""
+    bind = session.get_bind()
+    sql = stmt.compile(dialect=bind.dialect, compile_kwargs={'literal_binds': True})
+    return [row.detail for row in session.execute(text(f'EXPLAIN QUERY PLAN {sql}'))]
@@ -0,0 +1,157 @@
+import os
+import tempfile
+import time
+import unittest
+from typing import Any, ContextManager
+from unittest import mock
+from sqlalchemy import func, inspect, select
+from app import create_app
+from models import Category, Game, Publisher, db
+from models.catalog_version import DEFAULT_LOCAL_VERSION_TTL
+from utils.similarity import similarity_supported
+from tests.helpers import get_test_database_uri
+
+class TestAppFactory(unittest.TestCase):
+    """Tests for the application factory and the init-db command."""
+
+    TEST_CONFIG = {
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': get_test_database_uri(),
+    }
+
+    def setUp(self) -> None:
+        self.app = create_app(self.TEST_CONFIG)
+
+    def tearDown(self) -> None:
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def test_create_app_does_no_database_work(self) -> None:
+        """Creating the app should not create tables or seed data."""
+        with self.app.app_context():
+            self.assertEqual(inspect(db.engine).get_table_names(), [])
+
+    def test_create_app_registers_blueprints(self) -> None:
+        """All API blueprints should be registered by the factory."""
+        self.assertEqual(
+            {'games', 'categories', 'publishers', 'auth', 'cache', 'leaderboards'},
+            set(self.app.blueprints)
+        )
+
+    def test_init_db_command_creates_and_seeds(self) -> None:
+        """`flask init-db` should create the schema and load the seed catalog."""
+        result = self.app.test_cli_runner().invoke(args=['init-db'])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        with self.app.app_context():
+            self.assertIn('games', inspect(db.engine).get_table_names())
+            self.assertGreater(db.session.scalar(select(func.count(Game.id))), 0)
+
+    def test_init_db_command_is_idempotent(self) -> None:
+        """Running init-db twice should not duplicate games."""
+        runner = self.app.test_cli_runner()
+        runner.invoke(args=['init-db'])
+        with self.app.app_context():
+            first_count = db.session.scalar(select(func.count(Game.id)))
+
+        result = runner.invoke(args=['init-db'])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        with self.app.app_context():
+            self.assertEqual(db.session.scalar(select(func.count(Game.id))), first_count)
+
+class TestWorkersSharingADatabase(unittest.TestCase):
+    """Tests for two app instances (workers) on one database, each with its own catalog version."""
+
+    GAMES_API_PATH: str = '/api/games'
+
+    def setUp(self) -> None:
+        database_uri = get_test_database_uri()
+        if database_uri == 'sqlite:///:memory:':
+            # Each in-memory connection is its own database; workers share a file
+            self.directory = tempfile.TemporaryDirectory()
+            database_uri = f'sqlite:///{os.path.join(self.directory.name, "catalog.db")}'
+        config = {'TESTING': True, 'SQLALCHEMY_DATABASE_URI': database_uri}
+        self.apps = [create_app(config), create_app(config)]
+        self.clients = [app.test_client() for app in self.apps]
+
+        with self.apps[0].app_context():
+            db.create_all()
+            db.session.add_all([Publisher(name="DevGames Inc"), Category(name="Strategy")])
+            db.session.flush()
+            db.session.add_all([
+                Game(title="Pipeline Panic", description="Build your DevOps pipeline before chaos ensues",
+                     publisher_id=1, category_id=1, star_rating=4.5),
+                Game(title="Agile Adventures", description="Navigate your team through sprints",
+                     publisher_id=1, category_id=1, star_rating=4.2),
+            ])
+            db.session.commit()
+
+    def tearDown(self) -> None:
+        for app in self.apps:
+            with app.app_context():
+                db.session.remove()
+                if app is self.apps[0]:
+                    db.drop_all()
+                db.engine.dispose()
+        if hasattr(self, 'directory'):
+            self.directory.cleanup()
+
+    def _write_in_other_worker(self) -> None:
+        """Helper adding a game and deleting game 2 through the second app"""
+        created = self.clients[1].post(self.GAMES_API_PATH, json={
+            'title': "Deploy Friday", 'description': "Ship releases and survive the weekend on call",
+            'category': "Strategy", 'publisher': "DevGames Inc", 'starRating': 4.0,
+        })
+        self.assertEqual(created.status_code, 201)
+        self.assertEqual(self.clients[1].delete(f'{self.GAMES_API_PATH}/2').status_code, 204)
+
+    def _later(self) -> ContextManager[Any]:
+        """Helper moving both clocks past the local catalog version's TTL"""
+        later = DEFAULT_LOCAL_VERSION_TTL + 1
+        wall_clock, monotonic = time.time() + later, time.monotonic() + later
+        return mock.patch.multiple(time, time=lambda: wall_clock, monotonic=lambda: monotonic)
+
+    def test_validators_lapse_after_other_worker_writes(self) -> None:
+        """A 304 validated by a per-worker catalog version should stop matching within CATALOG_VERSION_TTL."""
+        listing = self.clients[0].get(self.GAMES_API_PATH)
+        self._write_in_other_worker()
+
+        with self._later():
+            response = self.clients[0].get(self.GAMES_API_PATH, headers={'If-None-Match': listing.headers['ETag']})
+            self.assertEqual(response.status_code, 200)
+            titles = [game['title'] for game in response.get_json()['games']]
+            self.assertEqual(titles, ["Deploy Friday", "Pipeline Panic"])
+            response = self.clients[0].get(self.GAMES_API_PATH,
+                                           headers={'If-Modified-Since': listing.headers['Last-Modified']})
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response.headers['ETag'], listing.headers['ETag'])
+
+    def test_snapshot_is_rebuilt_after_other_worker_writes(self) -> None:
+        """A snapshot built from a per-worker catalog version should be rebuilt within CATALOG_VERSION_TTL."""
+        self.apps[0].config.update(CATALOG_SNAPSHOT=True, RESPONSE_CACHE_ENABLED=False)
+        self.assertEqual(self.clients[0].get(f'{self.GAMES_API_PATH}/2').status_code, 200)
+        self._write_in_other_worker()
+
+        with self._later():
+            self.assertEqual(self.clients[0].get(f'{self.GAMES_API_PATH}/2').status_code, 404)
+            response = self.clients[0].get(self.GAMES_API_PATH)
+            titles = [game['title'] for game in response.get_json()['games']]
+            self.assertEqual(titles, ["Deploy Friday", "Pipeline Panic"])
+
+    @unittest.skipUnless(similarity_supported(), 'similar games need NumPy')
+    def test_similarity_index_is_rebuilt_after_other_worker_writes(self) -> None:
+        """The similar games index of a per-worker catalog version should be rebuilt within CATALOG_VERSION_TTL."""
+        self.apps[0].config['RESPONSE_CACHE_ENABLED'] = False
+        similar = self.clients[0].get(f'{self.GAMES_API_PATH}/1/similar').get_json()['games']
+        self.assertEqual([game['id'] for game in similar], [2])
+        self._write_in_other_worker()
+
+        with self._later():
+            similar = self.clients[0].get(f'{self.GAMES_API_PATH}/1/similar').get_json()['games']
+        self.assertEqual([game['title'] for game in similar], ["Deploy Friday"])
+
+if __name__ == '__main__':
+    unittest.main()
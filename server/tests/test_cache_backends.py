@@ -0,0 +1,473 @@
+import fnmatch
+import json
+import os
+import shutil
+import socketserver
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from flask import Flask
+from models import Game, Publisher, Category, db, get_catalog_version
+from models.catalog_version import SharedCatalogVersion
+from routes.categories import categories_bp
+from routes.games import games_bp
+from tests.helpers import get_test_database_uri
+from utils.cache_backends import (
+    REDIS_RETRY_DELAY,
+    REDIS_SOCKET_TIMEOUT,
+    MemoryBackend,
+    RedisBackend,
+    SharedMemoryBackend,
+    create_cache_backend,
+)
+from utils.response_cache import init_response_cache
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    """Serves the handful of Redis commands the backend uses."""
+
+    def _read_command(self) -> list[bytes] | None:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def _bulk(self, value: bytes | None) -> bytes:
+        return b'$-1\r\n' if value is None else b'$%d\r\n%s\r\n' % (len(value), value)
+
+    def handle(self) -> None:
+        server: FakeRedisServer = self.server
+        while (args := self._read_command()) is not None:
+            command = args[0].upper()
+            with server.lock:
+                if command == b'GET':
+                    reply = self._bulk(server.data.get(args[1]))
+                elif command == b'SET':
+                    if b'NX' in args[3:] and args[1] in server.data:
+                        reply = self._bulk(None)
+                    else:
+                        server.data[args[1]] = args[2]
+                        reply = b'+OK\r\n'
+                elif command == b'INCR':
+                    server.data[args[1]] = b'%d' % (int(server.data.get(args[1], b'0')) + 1)
+                    reply = b':%s\r\n' % server.data[args[1]]
+                elif command == b'DEL':
+                    removed = sum(server.data.pop(key, None) is not None for key in args[1:])
+                    reply = b':%d\r\n' % removed
+                elif command == b'SCAN':
+                    pattern = args[args.index(b'MATCH') + 1].decode()
+                    keys = [key for key in server.data if fnmatch.fnmatchcase(key.decode(), pattern)]
+                    reply = b'*2\r\n' + self._bulk(b'0') + b'*%d\r\n' % len(keys) + b''.join(map(self._bulk, keys))
+                else:
+                    reply = b'-ERR unknown command\r\n'
+            self.wfile.write(reply)
+            self.wfile.flush()
+
+class FakeRedisServer(socketserver.ThreadingTCPServer):
+    """In-process stand-in for a Redis server, listening on a free local port."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        super().__init__(('127.0.0.1', 0), _RespHandler)
+        self.data: dict[bytes, bytes] = {}
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def url(self) -> str:
+        return f'redis://127.0.0.1:{self.server_address[1]}'
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+class _HangingHandler(socketserver.StreamRequestHandler):
+    """Reads commands and never replies, like a Redis server that has hung."""
+
+    def handle(self) -> None:
+        while self.rfile.read(1):
+            pass
+
+class HangingRedisServer(FakeRedisServer):
+    """Accepts connections but never answers a command."""
+
+    def __init__(self) -> None:
+        socketserver.ThreadingTCPServer.__init__(self, ('127.0.0.1', 0), _HangingHandler)
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+
+class TestMemoryBackend(unittest.TestCase):
+    """Tests for the per-process LRU backend."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Exceeding max_entries should evict the least recently used entry."""
+        backend = MemoryBackend(max_entries=2)
+        backend.set('a', b'1')
+        backend.set('b', b'2')
+        backend.get('a')
+        backend.set('c', b'3')
+
+        self.assertEqual(backend.get('a'), b'1')
+        self.assertIsNone(backend.get('b'))
+        self.assertEqual(backend.get('c'), b'3')
+        self.assertEqual(backend.stats()['evictions'], 1)
+
+    def test_evicts_to_stay_under_max_bytes(self) -> None:
+        """Total value size should stay within max_bytes."""
+        backend = MemoryBackend(max_bytes=10)
+        backend.set('a', b'123456')
+        backend.set('b', b'123456')
+        backend.set('huge', b'x' * 11)
+
+        self.assertIsNone(backend.get('a'))
+        self.assertIsNone(backend.get('huge'))
+        self.assertEqual(backend.stats()['bytes'], 6)
+
+    def test_expires_after_ttl(self) -> None:
+        """Entries older than their TTL should be treated as absent."""
+        backend = MemoryBackend()
+        with mock.patch('utils.cache_backends.time.monotonic', return_value=100.0):
+            backend.set('a', b'1', ttl=10)
+        with mock.patch('utils.cache_backends.time.monotonic', return_value=111.0):
+            self.assertIsNone(backend.get('a'))
+
+        self.assertEqual(backend.stats()['entries'], 0)
+
+    def test_add_and_incr(self) -> None:
+        """add should not overwrite and incr should count from zero."""
+        backend = MemoryBackend()
+
+        self.assertTrue(backend.add('a', b'1'))
+        self.assertFalse(backend.add('a', b'2'))
+        self.assertEqual(backend.get('a'), b'1')
+        self.assertEqual(backend.incr('n'), 1)
+        self.assertEqual(backend.incr('n'), 2)
+
+class TestSharedMemoryBackend(unittest.TestCase):
+    """Tests for the tmpfs-backed backend shared between workers."""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp(prefix='tailspin-cache-test-')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_instances_share_entries(self) -> None:
+        """A value written by one worker should be visible to another."""
+        first = SharedMemoryBackend(self.directory)
+        second = SharedMemoryBackend(self.directory)
+        first.set('a', b'shared', ttl=60)
+
+        self.assertEqual(second.get('a'), b'shared')
+        self.assertFalse(second.add('a', b'other'))
+        self.assertTrue(second.add('b', b'other'))
+        self.assertEqual(first.get('b'), b'other')
+
+    def test_expires_after_ttl(self) -> None:
+        """Entries older than their TTL should be treated as absent."""
+        backend = SharedMemoryBackend(self.directory)
+        with mock.patch('utils.cache_backends.time.time', return_value=1000.0):
+            backend.set('a', b'1', ttl=10)
+        with mock.patch('utils.cache_backends.time.time', return_value=1011.0):
+            self.assertIsNone(backend.get('a'))
+
+        self.assertEqual(backend.stats()['entries'], 0)
+
+    def test_incr_is_atomic_across_instances(self) -> None:
+        """Concurrent increments from several workers should not be lost."""
+        backends = [SharedMemoryBackend(self.directory) for _ in range(4)]
+
+        def bump(backend: SharedMemoryBackend) -> None:
+            for _ in range(50):
+                backend.incr('n')
+
+        threads = [threading.Thread(target=bump, args=(backend,)) for backend in backends]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(backends[0].get('n'), b'200')
+
+    def test_prune_keeps_counters_and_newest_entries(self) -> None:
+        """Pruning should evict the oldest expiring entries but never counters."""
+        backend = SharedMemoryBackend(self.directory, max_entries=2)
+        backend.incr('n')
+        for index, key in enumerate(['a', 'b', 'c']):
+            backend.set(key, b'x', ttl=60)
+            os.utime(backend._path(key), (1000 + index, 1000 + index))
+
+        backend.prune()
+
+        self.assertIsNone(backend.get('a'))
+        self.assertEqual(backend.get('c'), b'x')
+        self.assertEqual(backend.get('n'), b'1')
+        self.assertEqual(backend.stats()['evictions'], 1)
+
+class TestRedisBackend(unittest.TestCase):
+    """Tests for the Redis-protocol backend against a local stand-in server."""
+
+    def setUp(self) -> None:
+        self.server = FakeRedisServer()
+        self.backend = RedisBackend.from_url(self.server.url)
+
+    def tearDown(self) -> None:
+        self.backend.close()
+        self.server.stop()
+
+    def test_set_get_add_incr(self) -> None:
+        """Values and counters should round-trip under the key prefix."""
+        self.backend.set('a', b'\x00binary\r\n', ttl=60)
+
+        self.assertEqual(self.backend.get('a'), b'\x00binary\r\n')
+        self.assertIsNone(self.backend.get('missing'))
+        self.assertFalse(self.backend.add('a', b'other'))
+        self.assertTrue(self.backend.add('b', b'other'))
+        self.assertEqual(self.backend.incr('n'), 1)
+        self.assertEqual(self.backend.incr('n'), 2)
+        self.assertIn(b'tailspin:a', self.server.data)
+
+    def test_clear_only_removes_prefixed_keys(self) -> None:
+        """clear should leave other applications' keys alone."""
+        self.server.data[b'other:key'] = b'1'
+        self.backend.set('a', b'1')
+
+        self.backend.clear()
+
+        self.assertEqual(self.server.data, {b'other:key': b'1'})
+
+    def test_reconnects_after_dropped_connection(self) -> None:
+        """A connection closed by the server should be replaced transparently."""
+        self.backend.set('a', b'1')
+        self.backend._local.connection.shutdown(2)
+
+        self.assertEqual(self.backend.get('a'), b'1')
+
+    def test_unavailable_server_raises_os_error(self) -> None:
+        """Connection failures should surface as OSError."""
+        self.server.stop()
+        backend = RedisBackend.from_url(self.server.url)
+
+        with self.assertRaises(OSError):
+            backend.get('a')
+
+    def test_failures_fail_fast_until_retry_delay(self) -> None:
+        """After a server stops replying, commands should fail at once until the retry delay passes."""
+        server = HangingRedisServer()
+        self.addCleanup(server.stop)
+        backend = RedisBackend.from_url(server.url)
+        self.addCleanup(backend.close)
+
+        start = time.monotonic()
+        with self.assertRaises(OSError):
+            backend.get('a')
+        # One timeout: a hung server is not retried on a new connection
+        self.assertLess(time.monotonic() - start, 2 * REDIS_SOCKET_TIMEOUT)
+
+        start = time.monotonic()
+        for _ in range(10):
+            with self.assertRaises(OSError):
+                backend.get('a')
+        self.assertLess(time.monotonic() - start, REDIS_SOCKET_TIMEOUT)
+
+        # Once the delay has passed the server is tried again
+        backend.port = self.server.server_address[1]
+        with mock.patch('utils.cache_backends.time.monotonic', return_value=time.monotonic() + REDIS_RETRY_DELAY):
+            backend.set('a', b'1')
+        self.assertEqual(backend.get('a'), b'1')
+
+    def test_create_cache_backend_from_url(self) -> None:
+        """Cache URLs should select the matching backend."""
+        self.assertIsInstance(create_cache_backend('memory://'), MemoryBackend)
+        self.assertIsInstance(create_cache_backend(self.server.url), RedisBackend)
+        with self.assertRaises(ValueError):
+            create_cache_backend('memcached://localhost')
+
+class TestCrossWorkerInvalidation(unittest.TestCase):
+    """Two apps on one database and one shared cache stand in for two workers."""
+
+    GAMES_API_PATH: str = '/api/games'
+
+    def setUp(self) -> None:
+        """Create two apps sharing a SQLite file and a cache directory"""
+        self.directory = tempfile.mkdtemp(prefix='tailspin-cache-test-')
+        database_uri = f'sqlite:///{os.path.join(self.directory, "test.db")}'
+        cache_url = f'shm://{os.path.join(self.directory, "cache")}'
+
+        self.workers = []
+        for _ in range(2):
+            app = Flask(__name__)
+            app.config['TESTING'] = True
+            app.config['SQLALCHEMY_DATABASE_URI'] = database_uri
+            app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+            app.config['CACHE_URL'] = cache_url
+            app.register_blueprint(games_bp)
+            db.init_app(app)
+            init_response_cache(app)
+            self.workers.append(app)
+
+        with self.workers[0].app_context():
+            db.create_all()
+            db.session.add(Game(
+                title="Pipeline Panic",
+                description="Build your DevOps pipeline before chaos ensues",
+                publisher=Publisher(name="DevGames Inc"),
+                category=Category(name="Strategy"),
+                star_rating=4.5,
+            ))
+            db.session.commit()
+
+    def tearDown(self) -> None:
+        for app in self.workers:
+            with app.app_context():
+                db.session.remove()
+                db.engine.dispose()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_workers_share_cached_responses(self) -> None:
+        """A response cached by one worker should be a hit in another."""
+        first = self.workers[0].test_client().get(f'{self.GAMES_API_PATH}/1')
+        second = self.workers[1].test_client().get(f'{self.GAMES_API_PATH}/1')
+
+        self.assertEqual(first.headers['X-Cache'], 'MISS')
+        self.assertEqual(second.headers['X-Cache'], 'HIT')
+        self.assertEqual(first.headers['ETag'], second.headers['ETag'])
+
+    def test_write_in_one_worker_invalidates_all(self) -> None:
+        """A commit in one worker should bump the version every worker sees."""
+        reader = self.workers[0].test_client()
+        reader.get(f'{self.GAMES_API_PATH}/1')
+        with self.workers[0].app_context():
+            version = get_catalog_version()
+
+        with self.workers[1].app_context():
+            db.session.get(Game, 1).title = "Pipeline Panic Deluxe"
+            db.session.commit()
+        with self.workers[0].app_context():
+            self.assertEqual(get_catalog_version(), version + 1)
+
+        response = reader.get(f'{self.GAMES_API_PATH}/1')
+
+        self.assertEqual(response.headers['X-Cache'], 'MISS')
+        self.assertEqual(json.loads(response.data)['title'], "Pipeline Panic Deluxe")
+
+class _FlakyStore(MemoryBackend):
+    """Memory backend that raises OSError, like an unreachable server, while `down` is set."""
+
+    down = False
+
+    def get(self, key: str) -> bytes | None:
+        if self.down:
+            raise ConnectionRefusedError
+        return super().get(key)
+
+    def incr(self, key: str) -> int:
+        if self.down:
+            raise ConnectionRefusedError
+        return super().incr(key)
+
+class TestUnavailableCacheServer(unittest.TestCase):
+    """With the shared store down, only the cache should be lost."""
+
+    GAMES_API_PATH: str = '/api/games'
+
+    def setUp(self) -> None:
+        # A port nothing listens on any more
+        server = FakeRedisServer()
+        server.stop()
+
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = get_test_database_uri()
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        self.app.config['CACHE_URL'] = server.url
+        self.app.register_blueprint(games_bp)
+        self.app.register_blueprint(categories_bp)
+        db.init_app(self.app)
+        init_response_cache(self.app)
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+            db.session.add(Game(
+                title="Pipeline Panic",
+                description="Build your DevOps pipeline before chaos ensues",
+                publisher=Publisher(name="DevGames Inc"),
+                category=Category(name="Strategy"),
+                star_rating=4.5,
+            ))
+            with self.assertLogs(self.app.logger, 'ERROR'):
+                db.session.commit()
+
+    def tearDown(self) -> None:
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def test_reads_bypass_cache_and_validators(self) -> None:
+        """Catalog GETs should be answered in full, without ETags or cache entries."""
+        for path in (self.GAMES_API_PATH, '/api/categories', f'{self.GAMES_API_PATH}?includeTotal=false'):
+            response = self.client.get(path)
+
+            self.assertEqual(response.status_code, 200, path)
+            self.assertIsNone(response.headers.get('ETag'))
+            self.assertIsNone(response.headers.get('X-Cache'))
+        self.assertEqual(json.loads(self.client.get(self.GAMES_API_PATH).data)['pagination']['total'], 1)
+
+    def test_reads_from_snapshot(self) -> None:
+        """Snapshot reads should still work while the version cannot be read."""
+        self.app.config['CATALOG_SNAPSHOT'] = True
+
+        response = self.client.get(self.GAMES_API_PATH)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data)['games'][0]['title'], "Pipeline Panic")
+
+    def test_write_is_committed(self) -> None:
+        """A write should succeed, logging the failed version bump."""
+        with self.app.app_context():
+            db.session.get(Game, 1).title = "Pipeline Panic Deluxe"
+            with self.assertLogs(self.app.logger, 'ERROR'):
+                db.session.commit()
+
+        with self.app.app_context():
+            self.assertEqual(db.session.get(Game, 1).title, "Pipeline Panic Deluxe")
+
+    def test_hung_server_costs_one_timeout(self) -> None:
+        """With a server that accepts connections but never replies, later requests should not wait on it."""
+        server = HangingRedisServer()
+        self.addCleanup(server.stop)
+        self.app.config['CACHE_URL'] = server.url
+        init_response_cache(self.app)
+        self.client.get(self.GAMES_API_PATH)
+
+        for path in (self.GAMES_API_PATH, f'{self.GAMES_API_PATH}/1', '/api/categories'):
+            start = time.monotonic()
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 200, path)
+            self.assertLess(time.monotonic() - start, REDIS_SOCKET_TIMEOUT, path)
+
+    def test_failed_bump_is_retried(self) -> None:
+        """A bump lost while the store was down should land on the next read."""
+        store = _FlakyStore()
+        version = SharedCatalogVersion(store)
+        store.down = True
+
+        with self.assertRaises(OSError):
+            version.bump()
+        store.down = False
+
+        self.assertEqual(version.version, 1)
+        self.assertEqual(version.version, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+import unittest
+import json
+from typing import Dict, Any
+from flask import Flask, Response
+from sqlalchemy import select
+from models import Game, Publisher, Category, db
+from routes.categories import categories_bp
+from tests.helpers import count_queries, get_test_database_uri
+
+class TestCategoriesRoutes(unittest.TestCase):
+    # Test data as complete objects
+    TEST_DATA: Dict[str, Any] = {
+        "publishers": [
+            {"name": "DevGames Inc"},
+            {"name": "Scrum Masters"}
+        ],
+        "categories": [
+            {"name": "Strategy", "description": "Plan your way to production"},
+            {"name": "Card Game"},
+            {"name": "Puzzle"}
+        ],
+        "games": [
+            {"title": "Pipeline Panic", "publisher_index": 0, "category_index": 0, "star_rating": 4.5},
+            {"title": "Agile Adventures", "publisher_index": 1, "category_index": 0, "star_rating": 4.0},
+            {"title": "Cache Invalidation", "publisher_index": 0, "category_index": 0, "star_rating": 3.0},
+            {"title": "Deploy Friday", "publisher_index": 1, "category_index": 0, "star_rating": None},
+            {"title": "Stack Trace Solitaire", "publisher_index": 1, "category_index": 1, "star_rating": 3.5}
+        ]
+    }
+
+    # API paths
+    CATEGORIES_API_PATH: str = '/api/categories'
+
+    def setUp(self) -> None:
+        """Set up test database and seed data"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = get_test_database_uri()
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+        self.app.register_blueprint(categories_bp)
+        self.client = self.app.test_client()
+        db.init_app(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+            self._seed_test_data()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _seed_test_data(self) -> None:
+        """Helper method to seed test data"""
+        publishers = [Publisher(**data) for data in self.TEST_DATA["publishers"]]
+        categories = [Category(**data) for data in self.TEST_DATA["categories"]]
+        db.session.add_all(publishers + categories)
+
+        for game_data in self.TEST_DATA["games"]:
+            game_dict = game_data.copy()
+            publisher_index = game_dict.pop("publisher_index")
+            category_index = game_dict.pop("category_index")
+            db.session.add(Game(
+                **game_dict,
+                description="A long enough description for tests",
+                publisher=publishers[publisher_index],
+                category=categories[category_index]
+            ))
+        db.session.commit()
+
+    def _get_response_data(self, response: Response) -> Any:
+        """Helper method to parse response data"""
+        return json.loads(response.data)
+
+    def _get_category_id(self, name: str) -> int:
+        """Helper to look up a seeded category's id by name"""
+        with self.app.app_context():
+            return db.session.scalar(select(Category.id).where(Category.name == name))
+
+    def test_get_categories_success(self) -> None:
+        """Test listing categories with counts and averages, ordered by name"""
+        response = self.client.get(self.CATEGORIES_API_PATH)
+        data = self._get_response_data(response)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([c['name'] for c in data], ['Card Game', 'Puzzle', 'Strategy'])
+
+        by_name = {c['name']: c for c in data}
+        self.assertEqual(by_name['Strategy']['game_count'], 4)
+        self.assertEqual(by_name['Strategy']['average_rating'], 3.83)
+        self.assertEqual(by_name['Card Game']['game_count'], 1)
+        self.assertEqual(by_name['Card Game']['average_rating'], 3.5)
+
+    def test_get_categories_structure(self) -> None:
+        """Test that each category exposes the required fields"""
+        response = self.client.get(self.CATEGORIES_API_PATH)
+        data = self._get_response_data(response)
+
+        required_fields = ['id', 'name', 'description', 'game_count', 'average_rating', 'top_games']
+        for category in data:
+            for field in required_fields:
+                self.assertIn(field, category)
+            for game in category['top_games']:
+                self.assertEqual(set(game.keys()), {'id', 'title', 'starRating'})
+
+    def test_get_categories_top_games(self) -> None:
+        """Test that top games are capped and ordered by rating with unrated games last"""
+        response = self.client.get(self.CATEGORIES_API_PATH)
+        strategy = next(c for c in self._get_response_data(response) if c['name'] == 'Strategy')
+
+        self.assertEqual(
+            [g['title'] for g in strategy['top_games']],
+            ['Pipeline Panic', 'Agile Adventures', 'Cache Invalidation']
+        )
+
+    def test_get_categories_without_games(self) -> None:
+        """Test that a category with no games reports zero count and no average"""
+        response = self.client.get(self.CATEGORIES_API_PATH)
+        puzzle = next(c for c in self._get_response_data(response) if c['name'] == 'Puzzle')
+
+        self.assertEqual(puzzle['game_count'], 0)
+        self.assertIsNone(puzzle['average_rating'])
+        self.assertEqual(puzzle['top_games'], [])
+
+    def test_get_categories_constant_query_count(self) -> None:
+        """Test that listing categories does not issue per-category queries"""
+        with self.app.app_context():
+            with count_queries(db.engine) as statements:
+                response = self.client.get(self.CATEGORIES_API_PATH)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(statements), 2)
+
+    def test_get_categories_empty_database(self) -> None:
+        """Test listing categories when none exist"""
+        from sqlalchemy import delete
+        with self.app.app_context():
+            db.session.execute(delete(Game))
+            db.session.execute(delete(Category))
+            db.session.commit()
+
+        response = self.client.get(self.CATEGORIES_API_PATH)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._get_response_data(response), [])
+
+    def test_get_category_by_id_success(self) -> None:
+        """Test retrieving a single category summary"""
+        category_id = self._get_category_id('Strategy')
+
+        response = self.client.get(f'{self.CATEGORIES_API_PATH}/{category_id}')
+        data = self._get_response_data(response)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['name'], 'Strategy')
+        self.assertEqual(data['description'], 'Plan your way to production')
+        self.assertEqual(data['game_count'], 4)
+        self.assertEqual(len(data['top_games']), 3)
+
+    def test_get_category_by_id_not_found(self) -> None:
+        """Test retrieval of a non-existent category"""
+        response = self.client.get(f'{self.CATEGORIES_API_PATH}/999')
+        data = self._get_response_data(response)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(data['error'], "Category not found")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import gzip
+import unittest
+from unittest import mock
+from flask import Flask
+from models import Game, Publisher, Category, db
+from routes.games import games_bp
+from utils import compression
+from utils.compression import init_compression
+from tests.helpers import get_test_database_uri
+
+class TestResponseCompression(unittest.TestCase):
+    """Tests for content negotiation and precompressed cache entries."""
+
+    GAMES_API_PATH: str = '/api/games'
+    GZIP: dict[str, str] = {'Accept-Encoding': 'gzip, deflate'}
+
+    def setUp(self) -> None:
+        """Set up test database with a listing large enough to compress"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = get_test_database_uri()
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        self.app.register_blueprint(games_bp)
+        init_compression(self.app)
+        self.client = self.app.test_client()
+        db.init_app(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+            publisher = Publisher(name="DevGames Inc")
+            category = Category(name="Strategy")
+            for i in range(9):
+                db.session.add(Game(
+                    title=f"Pipeline Panic {i}",
+                    description="Build your DevOps pipeline before chaos ensues",
+                    publisher=publisher,
+                    category=category,
+                    star_rating=4.5,
+                ))
+            db.session.commit()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def test_gzip_negotiated(self) -> None:
+        """A listing should be gzipped for clients that accept it."""
+        plain = self.client.get(self.GAMES_API_PATH)
+        compressed = self.client.get(self.GAMES_API_PATH, headers=self.GZIP)
+
+        self.assertIsNone(plain.content_encoding)
+        self.assertEqual(compressed.content_encoding, 'gzip')
+        self.assertEqual(gzip.decompress(compressed.data), plain.data)
+        self.assertLess(len(compressed.data), len(plain.data))
+        self.assertIn('Accept-Encoding', compressed.vary)
+        self.assertIn('Accept-Encoding', plain.vary)
+
+    def test_small_bodies_not_compressed(self) -> None:
+        """Bodies under COMPRESSION_MIN_SIZE should go out as they are."""
+        response = self.client.get(f'{self.GAMES_API_PATH}/1', headers=self.GZIP)
+
+        self.assertLess(len(response.data), compression.DEFAULT_MIN_SIZE)
+        self.assertIsNone(response.content_encoding)
+
+    def test_refused_or_disabled_coding(self) -> None:
+        """q=0, unavailable codings and COMPRESSION_ENABLED=False should all get identity."""
+        with mock.patch('utils.compression.brotli', None):
+            for accept in ('gzip;q=0', 'br', 'identity'):
+                with self.subTest(accept=accept):
+                    response = self.client.get(self.GAMES_API_PATH, headers={'Accept-Encoding': accept})
+                    self.assertIsNone(response.content_encoding)
+
+        self.app.config['COMPRESSION_ENABLED'] = False
+        self.assertIsNone(self.client.get(self.GAMES_API_PATH, headers=self.GZIP).content_encoding)
+
+    def test_cached_entries_stored_compressed(self) -> None:
+        """Cache hits should be served from the stored compressed body without recompressing."""
+        first = self.client.get(self.GAMES_API_PATH, headers=self.GZIP)
+        with mock.patch('utils.compression.compress', wraps=compression.compress) as compress:
+            second = self.client.get(self.GAMES_API_PATH, headers=self.GZIP)
+            plain = self.client.get(self.GAMES_API_PATH)
+
+        self.assertEqual(second.headers['X-Cache'], 'HIT')
+        self.assertEqual(second.content_encoding, 'gzip')
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(plain.headers['X-Cache'], 'MISS')
+        self.assertIsNone(plain.content_encoding)
+        compress.assert_not_called()
+
+    def test_uncached_responses_compressed(self) -> None:
+        """With the response cache off, responses should still be compressed."""
+        self.app.config['RESPONSE_CACHE_ENABLED'] = False
+        response = self.client.get(self.GAMES_API_PATH, headers=self.GZIP)
+
+        self.assertEqual(response.content_encoding, 'gzip')
+        self.assertTrue(response.headers['ETag'].endswith('-gzip"'))
+
+    def test_coded_etag_revalidates(self) -> None:
+        """Each coding should carry its own ETag, and either should revalidate."""
+        plain = self.client.get(self.GAMES_API_PATH)
+        compressed = self.client.get(self.GAMES_API_PATH, headers=self.GZIP)
+
+        self.assertNotEqual(plain.headers['ETag'], compressed.headers['ETag'])
+        revalidated = self.client.get(self.GAMES_API_PATH, headers={
+            **self.GZIP, 'If-None-Match': compressed.headers['ETag'],
+        })
+        self.assertEqual(revalidated.status_code, 304)
+
+    @unittest.skipIf(compression.brotli is None, 'brotli is not installed')
+    def test_brotli_preferred(self) -> None:
+        """Clients accepting both codings should get brotli."""
+        response = self.client.get(self.GAMES_API_PATH, headers={'Accept-Encoding': 'gzip, br'})
+
+        self.assertEqual(response.content_encoding, 'br')
+        self.assertEqual(compression.brotli.decompress(response.data), self.client.get(self.GAMES_API_PATH).data)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from sqlalchemy import create_engine, text
+from app import create_app
+from models import Category, Game, Publisher, db
+from utils.database import (
+    REPLICA_BIND_KEY,
+    configure_sqlite_engine,
+    get_binds,
+    get_connection_string,
+    get_engine_options,
+    get_sqlite_pragmas,
+)
+
+class TestDatabaseConfiguration(unittest.TestCase):
+    """Tests for engine options and SQLite connection tuning."""
+
+    def setUp(self) -> None:
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.database_uri = f'sqlite:///{os.path.join(self.data_dir.name, "test.db")}'
+
+    def tearDown(self) -> None:
+        self.data_dir.cleanup()
+
+    def test_sqlite_pragmas_applied_on_connect(self) -> None:
+        """Every new connection should run with WAL, NORMAL sync and the tuned cache."""
+        engine = create_engine(self.database_uri)
+        configure_sqlite_engine(engine, get_sqlite_pragmas())
+
+        with engine.connect() as connection:
+            self.assertEqual(connection.scalar(text('PRAGMA journal_mode')), 'wal')
+            self.assertEqual(connection.scalar(text('PRAGMA synchronous')), 1)
+            self.assertEqual(connection.scalar(text('PRAGMA busy_timeout')), 5000)
+            self.assertEqual(connection.scalar(text('PRAGMA cache_size')), -65536)
+        engine.dispose()
+
+    def test_sqlite_pragmas_env_override(self) -> None:
+        """SQLITE_<PRAGMA> environment variables should override the defaults."""
+        with mock.patch.dict(os.environ, {'SQLITE_CACHE_SIZE': '-2000', 'SQLITE_SYNCHRONOUS': 'FULL'}):
+            pragmas = get_sqlite_pragmas()
+
+        self.assertEqual(pragmas['cache_size'], '-2000')
+        self.assertEqual(pragmas['synchronous'], 'FULL')
+        self.assertEqual(pragmas['journal_mode'], 'WAL')
+
+    def test_engine_options_for_file_database(self) -> None:
+        """File-backed databases should get an explicit connection pool size."""
+        with mock.patch.dict(os.environ, {'DB_POOL_SIZE': '2'}):
+            options = get_engine_options(self.database_uri)
+
+        self.assertEqual(options['pool_size'], 2)
+        self.assertIn('max_overflow', options)
+
+    def test_engine_options_for_memory_database(self) -> None:
+        """In-memory SQLite should keep SQLAlchemy's single-connection pool."""
+        self.assertEqual(get_engine_options('sqlite:///:memory:'), {})
+        self.assertEqual(get_engine_options('sqlite://'), {})
+
+    def test_engine_options_for_postgresql(self) -> None:
+        """Server databases should get pre-ping, recycling and a statement timeout."""
+        env = {'DB_POOL_SIZE': '20', 'DB_MAX_OVERFLOW': '5', 'DB_STATEMENT_TIMEOUT_MS': '3000'}
+        with mock.patch.dict(os.environ, env):
+            options = get_engine_options('postgresql+psycopg://tailspin@localhost/tailspin')
+
+        self.assertEqual(options['pool_size'], 20)
+        self.assertEqual(options['max_overflow'], 5)
+        self.assertTrue(options['pool_pre_ping'])
+        self.assertIn('pool_recycle', options)
+        self.assertEqual(options['connect_args'], {'options': '-c statement_timeout=3000'})
+
+    def test_connection_string_from_environment(self) -> None:
+        """DATABASE_URL should take precedence over the bundled SQLite file."""
+        with mock.patch.dict(os.environ, {'DATABASE_URL': 'postgresql://tailspin@db/tailspin'}):
+            self.assertEqual(get_connection_string(), 'postgresql://tailspin@db/tailspin')
+
+    def test_binds_without_replica(self) -> None:
+        """No replica bind should be registered unless a replica URL is configured."""
+        self.assertEqual(get_binds(None), {})
+        self.assertEqual(get_binds(self.database_uri)[REPLICA_BIND_KEY]['url'], self.database_uri)
+
+class TestReadReplicaRouting(unittest.TestCase):
+    """Listing reads should go to the replica bind while detail reads stay on the primary."""
+
+    def setUp(self) -> None:
+        self.app = create_app({
+            'TESTING': True,
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+            'SQLALCHEMY_BINDS': get_binds('sqlite:///:memory:'),
+        })
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+            replica = db.engines[REPLICA_BIND_KEY]
+            db.metadata.create_all(replica)
+
+            # Only the replica holds a game, so responses reveal which bind served them
+            with replica.begin() as connection:
+                connection.execute(Publisher.__table__.insert(), {'id': 1, 'name': 'Replica Games'})
+                connection.execute(Category.__table__.insert(), {'id': 1, 'name': 'Strategy'})
+                connection.execute(Game.__table__.insert(), {
+                    'id': 1,
+                    'title': 'Replica Rumble',
+                    'description': 'Only present on the read replica',
+                    'publisher_id': 1,
+                    'category_id': 1,
+                })
+
+    def tearDown(self) -> None:
+        with self.app.app_context():
+            db.session.remove()
+            for engine in db.engines.values():
+                engine.dispose()
+        # Flask-SQLAlchemy registers bind metadata on the shared `db` object;
+        # drop it so later test apps without a replica can still create_all()
+        db.metadatas.pop(REPLICA_BIND_KEY, None)
+
+    def test_listing_reads_from_replica(self) -> None:
+        """GET /api/games should be served from the replica."""
+        response = self.client.get('/api/games')
+        data = json.loads(response.data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([game['title'] for game in data['games']], ['Replica Rumble'])
+        self.assertEqual(data['pagination']['total'], 1)
+
+    def test_detail_reads_from_primary(self) -> None:
+        """GET /api/games/<id> should keep reading from the primary."""
+        response = self.client.get('/api/games/1')
+
+        self.assertEqual(response.status_code, 404)
+
+if __name__ == '__main__':
+    unittest.main()
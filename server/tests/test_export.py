@@ -0,0 +1,172 @@
+import csv
+import gzip
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from flask import Flask
+from sqlalchemy import insert
+from models import Game, Publisher, Category, db
+from routes.games import EXPORT_BATCH_SIZE, games_bp
+from tests.helpers import count_queries, get_test_database_uri
+
+def rss_bytes() -> int:
+    """Current resident set size of this process (Linux)."""
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+class TestGamesExport(unittest.TestCase):
+    """Tests for the streaming catalog export."""
+
+    EXPORT_API_PATH: str = '/api/games/export'
+    GAME_COUNT: int = EXPORT_BATCH_SIZE + 5
+
+    def setUp(self) -> None:
+        """Set up test database with more games than one export batch"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = get_test_database_uri()
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        self.app.register_blueprint(games_bp)
+        self.client = self.app.test_client()
+        db.init_app(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+            db.session.add_all([Publisher(name="DevGames Inc"), Category(name="Strategy")])
+            db.session.flush()
+            db.session.execute(insert(Game), [
+                {
+                    'title': f'Game {i}',
+                    'description': 'Ship it, then "fix" it',
+                    'publisher_id': 1,
+                    'category_id': 1,
+                    'star_rating': 4.5 if i % 2 else None,
+                }
+                for i in range(self.GAME_COUNT)
+            ])
+            db.session.commit()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def test_ndjson_matches_detail_endpoint(self) -> None:
+        """Each line should be the game as GET /api/games/<id> returns it."""
+        response = self.client.get(self.EXPORT_API_PATH)
+        lines = response.data.splitlines()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        self.assertEqual(len(lines), self.GAME_COUNT)
+        self.assertEqual([json.loads(line)['id'] for line in lines], list(range(1, self.GAME_COUNT + 1)))
+        self.assertEqual(lines[1] + b'\n', self.client.get('/api/games/2').data)
+
+    def test_csv(self) -> None:
+        """CSV exports should quote text and leave missing ratings empty."""
+        response = self.client.get(f'{self.EXPORT_API_PATH}?format=csv')
+        rows = list(csv.reader(io.StringIO(response.data.decode('utf-8'))))
+
+        self.assertEqual(response.mimetype, 'text/csv')
+        self.assertEqual(rows[0][:3], ['id', 'title', 'description'])
+        self.assertEqual(rows[1], ['1', 'Game 0', 'Ship it, then "fix" it', '1', 'DevGames Inc', '1', 'Strategy', ''])
+        self.assertEqual(len(rows), self.GAME_COUNT + 1)
+
+    def test_resume_after_id(self) -> None:
+        """`after` should continue an export from the next id."""
+        response = self.client.get(f'{self.EXPORT_API_PATH}?after={self.GAME_COUNT - 2}')
+
+        self.assertEqual([json.loads(line)['id'] for line in response.data.splitlines()],
+                         [self.GAME_COUNT - 1, self.GAME_COUNT])
+
+    def test_gzip(self) -> None:
+        """Clients accepting gzip should get the same body compressed, with its own ETag."""
+        plain = self.client.get(self.EXPORT_API_PATH)
+        compressed = self.client.get(self.EXPORT_API_PATH, headers={'Accept-Encoding': 'gzip'})
+
+        self.assertEqual(compressed.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(compressed.data), plain.data)
+        self.assertNotEqual(compressed.headers['ETag'], plain.headers['ETag'])
+        revalidated = self.client.get(self.EXPORT_API_PATH, headers={
+            'Accept-Encoding': 'gzip', 'If-None-Match': compressed.headers['ETag'],
+        })
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_single_query(self) -> None:
+        """The export should stream one statement rather than page through many."""
+        with self.app.app_context():
+            with count_queries(db.engine) as statements:
+                self.client.get(self.EXPORT_API_PATH)
+
+        self.assertEqual(len(statements), 1)
+
+    def test_invalid_parameters(self) -> None:
+        """Unknown formats and malformed ids should be rejected with 400."""
+        for query in ('format=xml', 'after=first', 'after=99999999999999999999'):
+            with self.subTest(query=query):
+                self.assertEqual(self.client.get(f'{self.EXPORT_API_PATH}?{query}').status_code, 400)
+
+@unittest.skipUnless(os.environ.get('RUN_SLOW_TESTS'), 'set RUN_SLOW_TESTS=1 to stream a 1M-game export')
+class TestGamesExportMemory(unittest.TestCase):
+    """Streaming a large catalog should not grow memory with its size."""
+
+    GAME_COUNT: int = 1_000_000
+    # Growth allowed while streaming: a few batches plus allocator slack
+    MAX_RSS_GROWTH: int = 32 * 1024 * 1024
+
+    def setUp(self) -> None:
+        """Set up a file-backed database with a million games"""
+        self.directory = tempfile.mkdtemp(prefix='tailspin-export-')
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.path.join(self.directory, "export.db")}'
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        self.app.register_blueprint(games_bp)
+        self.client = self.app.test_client()
+        db.init_app(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+            db.session.add_all([Publisher(name="DevGames Inc"), Category(name="Strategy")])
+            db.session.flush()
+            for start in range(0, self.GAME_COUNT, 50_000):
+                db.session.execute(insert(Game), [
+                    {'title': f'Game {i}', 'description': f'Synthetic game number {i}',
+                     'publisher_id': 1, 'category_id': 1, 'star_rating': 3.5}
+                    for i in range(start, start + 50_000)
+                ])
+            db.session.commit()
+
+    def tearDown(self) -> None:
+        """Clean up the database file"""
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.directory)
+
+    def _assert_bounded_rss(self, headers: dict[str, str]) -> None:
+        response = self.client.get('/api/games/export', headers=headers, buffered=False)
+        chunks = iter(response.response)
+        received = len(next(chunks))
+        baseline = peak = rss_bytes()
+        for chunk in chunks:
+            received += len(chunk)
+            peak = max(peak, rss_bytes())
+        response.close()
+
+        self.assertGreater(received, self.GAME_COUNT * 50 // (10 if 'Accept-Encoding' in headers else 1))
+        self.assertLess(peak - baseline, self.MAX_RSS_GROWTH)
+
+    def test_ndjson_rss_is_bounded(self) -> None:
+        self._assert_bounded_rss({})
+
+    def test_gzip_rss_is_bounded(self) -> None:
+        self._assert_bounded_rss({'Accept-Encoding': 'gzip'})
+
+if __name__ == '__main__':
+    unittest.main()
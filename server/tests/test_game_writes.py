@@ -0,0 +1,403 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+from flask import Flask
+from sqlalchemy import func, select, text
+from models import Game, Publisher, Category, create_search_index, db, get_catalog_version
+from routes.games import games_bp
+from utils.game_writes import MAX_BULK_ROWS, UPSERT_BATCH_SIZE
+from utils.compression import init_compression
+from utils.migrations import create_missing_columns, create_missing_indexes, rebuild_autoincrement_tables
+from utils.rating_queue import get_rating_flush_stmt
+from tests.helpers import count_queries, get_test_database_uri
+
+class TestGameWrites(unittest.TestCase):
+    """Tests for creating, updating and deleting games, one at a time and in bulk."""
+
+    GAMES_API_PATH: str = '/api/games'
+    BULK_API_PATH: str = '/api/games/bulk'
+
+    def setUp(self) -> None:
+        """Set up test database with one existing game"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = get_test_database_uri()
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        self.app.register_blueprint(games_bp)
+        self.client = self.app.test_client()
+        db.init_app(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+            db.session.add_all([
+                Publisher(name="DevGames Inc"),
+                Publisher(name="Scrum Masters"),
+                Category(name="Strategy"),
+                Category(name="Card Game"),
+            ])
+            db.session.flush()
+            db.session.add(Game(
+                title="Pipeline Panic",
+                description="Build your DevOps pipeline before chaos ensues",
+                publisher_id=1,
+                category_id=1,
+                star_rating=4.5,
+            ))
+            db.session.commit()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _game(self, title: str = "Agile Adventures", **overrides: object) -> dict[str, object]:
+        """Helper building a valid game request body"""
+        return {
+            'title': title,
+            'description': "Navigate your team through sprints and releases",
+            'category': "Card Game",
+            'publisher': "Scrum Masters",
+            'starRating': 4.0,
+            **overrides,
+        }
+
+    def _game_count(self) -> int:
+        """Helper counting the games in the database"""
+        with self.app.app_context():
+            return db.session.scalar(select(func.count(Game.id)))
+
+    def test_create_game(self) -> None:
+        """POST should create the game and return it with its location."""
+        response = self.client.post(self.GAMES_API_PATH, json=self._game())
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.headers['Location'], f"/api/games/{data['id']}")
+        self.assertEqual(data['title'], "Agile Adventures")
+        self.assertEqual(data['category']['name'], "Card Game")
+        self.assertEqual(data['publisher']['name'], "Scrum Masters")
+        self.assertEqual(self.client.get(response.headers['Location']).get_json(), data)
+
+    def test_create_game_rejects_invalid_input(self) -> None:
+        """POST should explain what is wrong with the body and write nothing."""
+        cases = [
+            (None, "Game must be a JSON object"),
+            (self._game(title="A"), "Game title must be at least 2 characters"),
+            (self._game(starRating=7), "starRating must be between 0 and 5"),
+            (self._game(starRating="high"), "starRating must be a number"),
+            (self._game(category="Board Games"), "Unknown category: Board Games"),
+            (self._game(publisher="Nobody"), "Unknown publisher: Nobody"),
+        ]
+        for body, error in cases:
+            with self.subTest(body=body):
+                response = self.client.post(self.GAMES_API_PATH, json=body)
+
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(error, response.get_json()['error'])
+        self.assertEqual(self._game_count(), 1)
+
+    def test_create_game_with_taken_title_conflicts(self) -> None:
+        """POST should return 409 when the title already exists."""
+        response = self.client.post(self.GAMES_API_PATH, json=self._game("Pipeline Panic"))
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(self._game_count(), 1)
+
+    def test_update_game(self) -> None:
+        """PUT should replace the game's fields."""
+        response = self.client.put(f'{self.GAMES_API_PATH}/1', json=self._game("Pipeline Panic 2", starRating=None))
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['id'], 1)
+        self.assertEqual(data['title'], "Pipeline Panic 2")
+        self.assertIsNone(data['starRating'])
+        self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/1').get_json(), data)
+
+    def test_update_errors(self) -> None:
+        """PUT should return 404 for an unknown game, 400 for bad input and 409 for a taken title."""
+        self.client.post(self.GAMES_API_PATH, json=self._game())
+
+        self.assertEqual(self.client.put(f'{self.GAMES_API_PATH}/999', json=self._game("Other")).status_code, 404)
+        self.assertEqual(self.client.put(f'{self.GAMES_API_PATH}/1', json=self._game(description="short")).status_code, 400)
+        self.assertEqual(self.client.put(f'{self.GAMES_API_PATH}/1', json=self._game()).status_code, 409)
+        self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/1').get_json()['title'], "Pipeline Panic")
+
+    def test_delete_game(self) -> None:
+        """DELETE should remove the game, and 404 once it is gone."""
+        response = self.client.delete(f'{self.GAMES_API_PATH}/1')
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(response.data, b'')
+        self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/1').status_code, 404)
+        self.assertEqual(self.client.delete(f'{self.GAMES_API_PATH}/1').status_code, 404)
+
+    def test_writes_invalidate_the_catalog(self) -> None:
+        """Every write should bump the catalog version so cached lists are refreshed."""
+        with self.app.app_context():
+            version = get_catalog_version()
+
+        self.client.post(self.GAMES_API_PATH, json=self._game())
+        self.client.put(f'{self.GAMES_API_PATH}/2', json=self._game("Agile Adventures II"))
+        self.client.delete(f'{self.GAMES_API_PATH}/2')
+        self.client.post(self.BULK_API_PATH, json=[self._game()])
+
+        with self.app.app_context():
+            self.assertEqual(get_catalog_version(), version + 4)
+
+    def test_bulk_creates_and_updates_by_title(self) -> None:
+        """Bulk upserts should insert new titles and update existing ones in place."""
+        games = [self._game(f"Bulk Game {i}") for i in range(3)]
+        games.append(self._game("Pipeline Panic", starRating=2.0))
+
+        response = self.client.post(self.BULK_API_PATH, json={'games': games})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {'created': 3, 'updated': 1})
+        self.assertEqual(self._game_count(), 4)
+        updated = self.client.get(f'{self.GAMES_API_PATH}/1').get_json()
+        self.assertEqual(updated['starRating'], 2.0)
+        self.assertEqual(updated['category']['name'], "Card Game")
+
+    def test_bulk_keeps_last_row_for_repeated_title(self) -> None:
+        """A title repeated within one request should be written once, with its last row."""
+        response = self.client.post(self.BULK_API_PATH, json=[
+            self._game(starRating=1.0),
+            self._game(starRating=3.0),
+        ])
+
+        self.assertEqual(response.get_json(), {'created': 1, 'updated': 0})
+        self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/2').get_json()['starRating'], 3.0)
+
+    def _vote(self, *ratings: float) -> None:
+        """Helper writing rating votes for game 1 as a rating queue flush does"""
+        with self.app.app_context():
+            for rating in ratings:
+                db.session.execute(get_rating_flush_stmt(), [
+                    {'game_id': 1, 'vote_sum': rating, 'vote_count': 1, 'trending_weight': 1.0}
+                ])
+            db.session.commit()
+
+    def _ratings(self) -> tuple[float | None, float, int]:
+        """Helper reading game 1's stored rating and vote totals"""
+        with self.app.app_context():
+            return tuple(db.session.execute(
+                select(Game.star_rating, Game.rating_sum, Game.rating_count).where(Game.id == 1)
+            ).one())
+
+    def test_writes_without_star_rating_keep_it(self) -> None:
+        """Bulk upserts and PUTs that leave out starRating should not touch the rating or its votes."""
+        self._vote(4, 2)
+        game = self._game("Pipeline Panic")
+        del game['starRating']
+
+        self.assertEqual(self.client.post(self.BULK_API_PATH, json=[game]).status_code, 200)
+        self.assertEqual(self._ratings(), (3.0, 6.0, 2))
+        self.assertEqual(self.client.put(f'{self.GAMES_API_PATH}/1', json=game).get_json()['starRating'], 3.0)
+        self.assertEqual(self._ratings(), (3.0, 6.0, 2))
+        self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/1/ratings').get_json()['average'], 3.0)
+
+    def test_explicit_star_rating_rescales_votes(self) -> None:
+        """An explicit starRating should rescale the vote totals, so later votes average from it."""
+        self._vote(4, 2)
+
+        self.client.put(f'{self.GAMES_API_PATH}/1', json=self._game("Pipeline Panic", starRating=4.0))
+        self.assertEqual(self._ratings(), (4.0, 8.0, 2))
+        self._vote(1)
+        self.assertEqual(self._ratings(), (3.0, 9.0, 3))
+
+        self.client.post(self.BULK_API_PATH, json=[self._game("Pipeline Panic", starRating=5.0)])
+        self.assertEqual(self._ratings(), (5.0, 15.0, 3))
+
+        # A PUT clearing the rating clears its votes too
+        self.client.put(f'{self.GAMES_API_PATH}/1', json=self._game("Pipeline Panic", starRating=None))
+        self.assertEqual(self._ratings(), (None, 0.0, 0))
+
+    def test_bulk_reports_every_invalid_row_and_writes_nothing(self) -> None:
+        """One invalid row should fail the whole request, listing each problem by index."""
+        response = self.client.post(self.BULK_API_PATH, json=[
+            self._game("Fine Game"),
+            self._game(title=None),
+            self._game("Other Game", category="Board Games"),
+            "not a game",
+        ])
+        errors = response.get_json()['errors']
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([error['index'] for error in errors], [1, 2, 3])
+        self.assertEqual(errors[1]['error'], "Unknown category: Board Games")
+        self.assertEqual(self._game_count(), 1)
+
+    def test_bulk_rejects_bad_bodies(self) -> None:
+        """Bulk writes need a non-empty list of at most MAX_BULK_ROWS games."""
+        self.assertEqual(self.client.post(self.BULK_API_PATH, json=[]).status_code, 400)
+        self.assertEqual(self.client.post(self.BULK_API_PATH, json={'game': {}}).status_code, 400)
+        response = self.client.post(self.BULK_API_PATH, json=[self._game()] * (MAX_BULK_ROWS + 1))
+        self.assertEqual(response.status_code, 413)
+
+    def test_bulk_without_upsert_support(self) -> None:
+        """Databases without ON CONFLICT DO UPDATE should get 501, not a server error."""
+        with mock.patch('routes.games.upsert_supported', return_value=False):
+            response = self.client.post(self.BULK_API_PATH, json=[self._game()])
+        self.assertEqual(response.status_code, 501)
+
+    def test_bulk_query_count_does_not_grow_with_rows(self) -> None:
+        """Thousands of rows should take a handful of statements, not one per row."""
+        games = [self._game(f"Bulk Game {i}") for i in range(UPSERT_BATCH_SIZE * 2)]
+
+        with self.app.app_context():
+            with count_queries(db.engine) as statements:
+                response = self.client.post(self.BULK_API_PATH, json=games)
+
+        self.assertEqual(response.get_json(), {'created': len(games), 'updated': 0})
+        # Two name lookups, two existing-title lookups and two upsert batches
+        self.assertLessEqual(len(statements), 6)
+        self.assertEqual(self._game_count(), len(games) + 1)
+
+    @unittest.skipUnless(get_test_database_uri().startswith('sqlite'), 'full-text search uses SQLite FTS5')
+    def test_bulk_updates_keep_search_in_sync(self) -> None:
+        """Upserted titles should be searchable, and replaced ones no longer."""
+        self.client.post(self.BULK_API_PATH, json=[self._game("Pipeline Mayhem")])
+        self.client.put(f'{self.GAMES_API_PATH}/1', json=self._game("Release Rush"))
+
+        titles = [game['title'] for game in self.client.get(f'{self.GAMES_API_PATH}?q=pipeline').get_json()['games']]
+        self.assertEqual(titles, ["Pipeline Mayhem"])
+
+    def test_detail_etag_follows_the_game_version(self) -> None:
+        """A game's ETag should change when it is written, not when another game is."""
+        etag = self.client.get(f'{self.GAMES_API_PATH}/1').headers['ETag']
+        self.client.post(self.GAMES_API_PATH, json=self._game())
+
+        response = self.client.get(f'{self.GAMES_API_PATH}/1', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['ETag'], etag)
+
+        self.client.put(f'{self.GAMES_API_PATH}/1', json=self._game("Pipeline Panic"))
+        response = self.client.get(f'{self.GAMES_API_PATH}/1', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_deleted_ids_are_not_reused(self) -> None:
+        """A game created after the newest one was deleted should get a new id, so old ETags never match it."""
+        created = self.client.post(self.GAMES_API_PATH, json=self._game())
+        etag = self.client.get(created.headers['Location']).headers['ETag']
+        self.client.delete(created.headers['Location'])
+
+        replacement = self.client.post(self.GAMES_API_PATH, json=self._game("Release Rush"))
+
+        self.assertNotEqual(replacement.headers['Location'], created.headers['Location'])
+        self.assertNotEqual(replacement.headers['ETag'], etag)
+        response = self.client.get(replacement.headers['Location'], headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['title'], "Release Rush")
+
+    def test_detail_if_modified_since(self) -> None:
+        """The detail endpoint should send Last-Modified and honour If-Modified-Since until the next write."""
+        last_modified = self.client.get(f'{self.GAMES_API_PATH}/1').headers['Last-Modified']
+
+        response = self.client.get(f'{self.GAMES_API_PATH}/1', headers={'If-Modified-Since': last_modified})
+        self.assertEqual(response.status_code, 304)
+        self.assertIsNotNone(response.headers.get('ETag'))
+
+        with mock.patch('models.catalog_version._now', return_value=datetime.now(timezone.utc) + timedelta(seconds=5)):
+            self.client.put(f'{self.GAMES_API_PATH}/1', json=self._game("Pipeline Panic", starRating=3.0))
+        response = self.client.get(f'{self.GAMES_API_PATH}/1', headers={'If-Modified-Since': last_modified})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['starRating'], 3.0)
+
+    def test_update_with_current_if_match(self) -> None:
+        """PUT with the ETag just read should succeed and return the next one."""
+        etag = self.client.get(f'{self.GAMES_API_PATH}/1').headers['ETag']
+
+        response = self.client.put(f'{self.GAMES_API_PATH}/1', json=self._game("Pipeline Panic"), headers={'If-Match': etag})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/1').headers['ETag'], response.headers['ETag'])
+
+    def test_writes_with_stale_if_match_fail(self) -> None:
+        """PUT and DELETE with an outdated ETag should return 412 and change nothing."""
+        stale = self.client.get(f'{self.GAMES_API_PATH}/1').headers['ETag']
+        self.client.put(f'{self.GAMES_API_PATH}/1', json=self._game("Pipeline Panic", starRating=3.0))
+
+        response = self.client.put(f'{self.GAMES_API_PATH}/1', json=self._game("Pipeline Panic", starRating=1.0), headers={'If-Match': stale})
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(self.client.delete(f'{self.GAMES_API_PATH}/1', headers={'If-Match': stale}).status_code, 412)
+        current = self.client.get(f'{self.GAMES_API_PATH}/1')
+        self.assertEqual(current.get_json()['starRating'], 3.0)
+
+        # The 412 carries the stored game and its ETag, enough to retry
+        self.assertEqual(response.get_json()['game'], current.get_json())
+        self.assertEqual(response.headers['ETag'], current.headers['ETag'])
+        retry = self.client.put(f'{self.GAMES_API_PATH}/1', json=self._game("Pipeline Panic", starRating=1.0),
+                                headers={'If-Match': response.headers['ETag']})
+        self.assertEqual(retry.status_code, 200)
+
+    def test_if_match_accepts_compressed_etag_and_star(self) -> None:
+        """The ETag of a compressed read and If-Match: * should both match the current game."""
+        self.app.config['COMPRESSION_MIN_SIZE'] = 0
+        init_compression(self.app)
+        etag = self.client.get(f'{self.GAMES_API_PATH}/1', headers={'Accept-Encoding': 'gzip'}).headers['ETag']
+        self.assertTrue(etag.endswith('-gzip"'))
+
+        self.assertEqual(self.client.put(f'{self.GAMES_API_PATH}/1', json=self._game("Pipeline Panic"), headers={'If-Match': etag}).status_code, 200)
+        self.assertEqual(self.client.delete(f'{self.GAMES_API_PATH}/1', headers={'If-Match': '*'}).status_code, 204)
+
+    def test_concurrent_write_between_read_and_commit_fails(self) -> None:
+        """A write landing after the game was loaded should make the versioned UPDATE fail with 412."""
+        def concurrent_write(etag: str) -> bool:
+            db.session.connection().execute(text('UPDATE games SET version = version + 1 WHERE id = 1'))
+            return False
+
+        with mock.patch('routes.games.if_match_fails', side_effect=concurrent_write):
+            response = self.client.put(f'{self.GAMES_API_PATH}/1', json=self._game("Pipeline Panic 2"))
+
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(response.get_json()['game']['title'], "Pipeline Panic")
+        self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/1').get_json()['title'], "Pipeline Panic")
+
+    def test_bulk_updates_bump_versions(self) -> None:
+        """Games updated by a bulk upsert should get a new ETag."""
+        etag = self.client.get(f'{self.GAMES_API_PATH}/1').headers['ETag']
+        self.client.post(self.BULK_API_PATH, json=[self._game("Pipeline Panic")])
+
+        self.assertNotEqual(self.client.get(f'{self.GAMES_API_PATH}/1').headers['ETag'], etag)
+
+    @unittest.skipUnless(get_test_database_uri().startswith('sqlite'), 'drops a column with SQLite syntax')
+    def test_create_missing_columns_adds_version(self) -> None:
+        """Databases created before the version column should get it, with existing rows at version 1."""
+        with self.app.app_context():
+            db.session.execute(text('ALTER TABLE games DROP COLUMN version'))
+            db.session.commit()
+
+            self.assertEqual(create_missing_columns(), ['games.version'])
+            self.assertEqual(create_missing_columns(), [])
+            self.assertEqual(db.session.scalar(select(Game.version).where(Game.id == 1)), 1)
+
+    @unittest.skipUnless(get_test_database_uri().startswith('sqlite'), 'AUTOINCREMENT is SQLite-specific')
+    def test_rebuild_autoincrement_tables(self) -> None:
+        """A games table created without AUTOINCREMENT should be rebuilt with it, keeping rows and search."""
+        with self.app.app_context():
+            create_sql = db.session.scalar(text("SELECT sql FROM sqlite_master WHERE name = 'games'"))
+            db.session.execute(text(create_sql.replace('games', 'games_old', 1).replace(' AUTOINCREMENT', '')))
+            db.session.execute(text('INSERT INTO games_old SELECT * FROM games'))
+            db.session.execute(text('DROP TABLE games'))
+            db.session.execute(text('ALTER TABLE games_old RENAME TO games'))
+            db.session.commit()
+
+            self.assertEqual(rebuild_autoincrement_tables(), ['games'])
+            self.assertEqual(rebuild_autoincrement_tables(), [])
+            create_missing_indexes()
+            with db.engine.begin() as connection:
+                create_search_index(connection)
+            self.assertIn('AUTOINCREMENT', db.session.scalar(text("SELECT sql FROM sqlite_master WHERE name = 'games'")))
+
+        self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/1').get_json()['title'], "Pipeline Panic")
+        self.test_deleted_ids_are_not_reused()
+        titles = [game['title'] for game in self.client.get(f'{self.GAMES_API_PATH}?q=pipeline').get_json()['games']]
+        self.assertEqual(titles, ["Pipeline Panic"])
+
+if __name__ == '__main__':
+    unittest.main()
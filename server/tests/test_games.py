@@ -4,6 +4,7 @@ from typing import Dict, Any
 from flask import Flask, Response
 from models import Game, Publisher, Category, db
 from routes.games import games_bp
+from tests.helpers import count_queries, get_test_database_uri
 
 class TestGamesRoutes(unittest.TestCase):
     # Test data as complete objects
@@ -42,7 +43,7 @@ class TestGamesRoutes(unittest.TestCase):
         # Create a fresh Flask app for testing
         self.app = Flask(__name__)
         self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = get_test_database_uri()
         self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
         
         # Register the games blueprint
@@ -197,6 +198,363 @@ class TestGamesRoutes(unittest.TestCase):
 
         self.assertEqual(data['pagination']['page'], 1)
 
+    def test_get_games_cursor_first_page(self) -> None:
+        """Test that an empty cursor starts keyset pagination at the first title"""
+        response = self.client.get(f'{self.GAMES_API_PATH}?cursor=&pageSize=1')
+        data = self._get_response_data(response)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data['games']), 1)
+        self.assertEqual(data['games'][0]['title'], 'Agile Adventures')
+        self.assertEqual(data['pagination']['pageSize'], 1)
+        self.assertIsNotNone(data['pagination']['nextCursor'])
+        self.assertNotIn('total', data['pagination'])
+
+    def test_get_games_cursor_follows_next_cursor(self) -> None:
+        """Test that following nextCursor walks every game once and then stops"""
+        titles = []
+        cursor = ''
+        while cursor is not None:
+            response = self.client.get(f'{self.GAMES_API_PATH}?cursor={cursor}&pageSize=1')
+            data = self._get_response_data(response)
+            self.assertEqual(response.status_code, 200)
+            titles.extend(game['title'] for game in data['games'])
+            cursor = data['pagination']['nextCursor']
+
+        self.assertEqual(titles, ['Agile Adventures', 'Pipeline Panic'])
+
+    def test_get_games_cursor_last_page_has_no_next(self) -> None:
+        """Test that a page holding the final game returns a null nextCursor"""
+        response = self.client.get(f'{self.GAMES_API_PATH}?cursor=')
+        data = self._get_response_data(response)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data['games']), 2)
+        self.assertIsNone(data['pagination']['nextCursor'])
+
+    def test_get_games_invalid_cursor(self) -> None:
+        """Test that a malformed cursor is rejected with 400"""
+        # The last one holds an id too large for a database INTEGER
+        for cursor in ['not-a-cursor', 'WyJvbmx5LW9uZSJd', 'WyJhIiwxMDAwMDAwMDAwMDAwMDAwMDAwMDBd']:
+            response = self.client.get(f'{self.GAMES_API_PATH}?cursor={cursor}')
+            data = self._get_response_data(response)
+
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(data['error'], "Invalid cursor")
+
+    def test_get_games_huge_page(self) -> None:
+        """Test that a page number past any database offset returns an empty page"""
+        response = self.client.get(f'{self.GAMES_API_PATH}?page=99999999999999999999')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._get_response_data(response)['games'], [])
+
+    def test_get_games_without_total(self) -> None:
+        """Test that includeTotal=false replaces the count with hasNext"""
+        response = self.client.get(f'{self.GAMES_API_PATH}?pageSize=1&includeTotal=false')
+        data = self._get_response_data(response)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data['games']), 1)
+        self.assertTrue(data['pagination']['hasNext'])
+        self.assertNotIn('total', data['pagination'])
+        self.assertNotIn('totalPages', data['pagination'])
+
+        response = self.client.get(f'{self.GAMES_API_PATH}?pageSize=1&page=2&includeTotal=false')
+        self.assertFalse(self._get_response_data(response)['pagination']['hasNext'])
+
+    def test_get_games_sparse_fields(self) -> None:
+        """Test that fields= limits each game to the requested keys plus id"""
+        response = self.client.get(f'{self.GAMES_API_PATH}?fields=title,starRating')
+        games = self._get_games_list(response)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(games[0]), {'id', 'title', 'starRating'})
+
+    def test_get_games_sparse_fields_skip_columns_and_joins(self) -> None:
+        """Test that unrequested columns are not read from the database"""
+        with self.app.app_context():
+            with count_queries(db.engine) as statements:
+                self.client.get(f'{self.GAMES_API_PATH}?fields=title&cursor=')
+
+        self.assertFalse(any('description' in statement for statement in statements))
+        self.assertFalse(any('JOIN' in statement for statement in statements))
+
+    def test_get_games_sparse_fields_with_cursor(self) -> None:
+        """Test that sparse fieldsets still page by cursor"""
+        response = self.client.get(f'{self.GAMES_API_PATH}?fields=category&cursor=&pageSize=1')
+        data = self._get_response_data(response)
+
+        self.assertEqual(set(data['games'][0]), {'id', 'category'})
+        next_response = self.client.get(
+            f"{self.GAMES_API_PATH}?fields=category&cursor={data['pagination']['nextCursor']}&pageSize=1"
+        )
+        self.assertEqual(len(self._get_games_list(next_response)), 1)
+
+    def _add_unrated_game(self) -> None:
+        """Helper adding a game without a star rating to the first category and publisher"""
+        with self.app.app_context():
+            db.session.add(Game(
+                title="Zero Downtime",
+                description="Keep the service up while you ship",
+                publisher_id=1,
+                category_id=1,
+                star_rating=None,
+            ))
+            db.session.commit()
+
+    def test_get_games_filtered_by_category_and_publisher(self) -> None:
+        """Test that category and publisher filters limit the games and the total"""
+        response = self.client.get(f'{self.GAMES_API_PATH}?category=2')
+        data = self._get_response_data(response)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([game['title'] for game in data['games']], ['Agile Adventures'])
+        self.assertEqual(data['pagination']['total'], 1)
+
+        response = self.client.get(f'{self.GAMES_API_PATH}?category=2&publisher=1')
+        self.assertEqual(self._get_response_data(response)['pagination']['total'], 0)
+
+    def test_get_games_filtered_by_min_rating(self) -> None:
+        """Test that minRating keeps games rated at least that value"""
+        self._add_unrated_game()
+        response = self.client.get(f'{self.GAMES_API_PATH}?minRating=4.3')
+
+        self.assertEqual([game['title'] for game in self._get_games_list(response)], ['Pipeline Panic'])
+
+    def test_get_games_sorted(self) -> None:
+        """Test that sort=rating puts unrated games last and sort=newest goes by id"""
+        self._add_unrated_game()
+        expected = {
+            'title': ['Agile Adventures', 'Pipeline Panic', 'Zero Downtime'],
+            'rating': ['Pipeline Panic', 'Agile Adventures', 'Zero Downtime'],
+            'newest': ['Zero Downtime', 'Agile Adventures', 'Pipeline Panic'],
+        }
+        for sort, titles in expected.items():
+            with self.subTest(sort=sort):
+                response = self.client.get(f'{self.GAMES_API_PATH}?sort={sort}')
+                self.assertEqual([game['title'] for game in self._get_games_list(response)], titles)
+
+    def test_get_games_sorted_by_cursor(self) -> None:
+        """Test that cursors follow each sort order, across rated and unrated games"""
+        self._add_unrated_game()
+        for sort in ('title', 'rating', 'newest'):
+            titles = []
+            cursor = ''
+            while cursor is not None:
+                response = self.client.get(
+                    f'{self.GAMES_API_PATH}?sort={sort}&fields=title&cursor={cursor}&pageSize=1'
+                )
+                data = self._get_response_data(response)
+                titles.extend(game['title'] for game in data['games'])
+                cursor = data['pagination']['nextCursor']
+
+            with self.subTest(sort=sort):
+                expected = self._get_games_list(self.client.get(f'{self.GAMES_API_PATH}?sort={sort}'))
+                self.assertEqual(titles, [game['title'] for game in expected])
+
+    def test_get_games_filtered_totals_cached_per_filter(self) -> None:
+        """Test that each filter combination keeps its own cached total"""
+        self.app.config['RESPONSE_CACHE_ENABLED'] = False
+        self.client.get(f'{self.GAMES_API_PATH}?category=1')
+        self.client.get(f'{self.GAMES_API_PATH}?category=2')
+
+        with self.app.app_context():
+            with count_queries(db.engine) as statements:
+                first = self._get_response_data(self.client.get(f'{self.GAMES_API_PATH}?category=1&page=2'))
+                second = self._get_response_data(self.client.get(f'{self.GAMES_API_PATH}?category=2&page=2'))
+
+        self.assertFalse(any('count(' in statement.lower() for statement in statements))
+        self.assertEqual(first['pagination']['total'], 1)
+        self.assertEqual(second['pagination']['total'], 1)
+
+    def test_get_games_invalid_filters(self) -> None:
+        """Test that malformed filters and sorts are rejected with 400"""
+        cases = {
+            'category=strategy': "Invalid category: strategy",
+            'publisher=1.5': "Invalid publisher: 1.5",
+            'publisher=99999999999999999999': "Invalid publisher: 99999999999999999999",
+            'minRating=nan': "Invalid minRating: nan",
+            'sort=price': "Invalid sort: price",
+        }
+        for query, error in cases.items():
+            with self.subTest(query=query):
+                response = self.client.get(f'{self.GAMES_API_PATH}?{query}')
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(self._get_response_data(response)['error'], error)
+
+    def test_get_games_cursor_from_another_sort(self) -> None:
+        """Test that a title cursor is rejected by the rating sort"""
+        response = self.client.get(f'{self.GAMES_API_PATH}?cursor=&pageSize=1')
+        cursor = self._get_response_data(response)['pagination']['nextCursor']
+
+        response = self.client.get(f'{self.GAMES_API_PATH}?sort=rating&cursor={cursor}')
+        self.assertEqual(response.status_code, 400)
+
+    def test_get_games_by_ids(self) -> None:
+        """Test that ids= returns the games in the requested order and lists missing ids"""
+        response = self.client.get(f'{self.GAMES_API_PATH}?ids=2,99,1,2')
+        data = self._get_response_data(response)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([game['title'] for game in data['games']], ['Agile Adventures', 'Pipeline Panic'])
+        self.assertEqual(data['missing'], [99])
+        self.assertNotIn('pagination', data)
+
+    def test_get_games_by_ids_single_query(self) -> None:
+        """Test that a batch lookup runs one query, honouring sparse fields"""
+        self.app.config['RESPONSE_CACHE_ENABLED'] = False
+        with self.app.app_context():
+            with count_queries(db.engine) as statements:
+                response = self.client.get(f'{self.GAMES_API_PATH}?ids=1,2&fields=title')
+
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(set(self._get_games_list(response)[0]), {'id', 'title'})
+
+    def test_get_games_by_ids_invalid(self) -> None:
+        """Test that malformed, empty and oversized id lists are rejected with 400"""
+        too_many = ','.join(str(i) for i in range(1, 102))
+        cases = {
+            'ids=1,two': "Invalid id: two",
+            'ids=99999999999999999999': "Invalid id: 99999999999999999999",
+            'ids=,': "ids must list at least one game id",
+            f'ids={too_many}': "At most 100 ids can be requested at once",
+        }
+        for query, error in cases.items():
+            with self.subTest(query=query[:20]):
+                response = self.client.get(f'{self.GAMES_API_PATH}?{query}')
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(self._get_response_data(response)['error'], error)
+
+    def test_get_games_unknown_field(self) -> None:
+        """Test that unknown fields and views are rejected with 400"""
+        response = self.client.get(f'{self.GAMES_API_PATH}?fields=title,price')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self._get_response_data(response)['error'], "Unknown field: price")
+
+        response = self.client.get(f'{self.GAMES_API_PATH}?view=tiny')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self._get_response_data(response)['error'], "Invalid view: tiny")
+
+    def test_get_games_summary_view_truncates_description(self) -> None:
+        """Test that view=summary shortens long descriptions and keeps the other fields"""
+        with self.app.app_context():
+            game = db.session.get(Game, 1)
+            game.description = "A very long description. " * 20
+            db.session.commit()
+
+        response = self.client.get(f'{self.GAMES_API_PATH}?view=summary')
+        games = {game['id']: game for game in self._get_games_list(response)}
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(games[1]['description'], ("A very long description. " * 20)[:150])
+        self.assertEqual(games[2]['description'], self.TEST_DATA['games'][1]['description'])
+        self.assertEqual(set(games[1]), {'id', 'title', 'description', 'publisher', 'category', 'starRating'})
+
+    def test_get_games_total_is_cached(self) -> None:
+        """Test that repeated listings reuse the cached total instead of counting again"""
+        self.client.get(self.GAMES_API_PATH)
+
+        with self.app.app_context():
+            with count_queries(db.engine) as statements:
+                response = self.client.get(self.GAMES_API_PATH)
+
+        self.assertEqual(self._get_response_data(response)['pagination']['total'], 2)
+        self.assertFalse(any('count(' in statement.lower() for statement in statements))
+
+    def test_get_games_total_invalidated_on_write(self) -> None:
+        """Test that adding a game refreshes the cached total"""
+        self.client.get(self.GAMES_API_PATH)
+
+        with self.app.app_context():
+            db.session.add(Game(
+                title="Merge Conflict Mayhem",
+                description="Resolve conflicts before the release train departs",
+                publisher_id=1,
+                category_id=1,
+                star_rating=3.9,
+            ))
+            db.session.commit()
+
+        response = self.client.get(self.GAMES_API_PATH)
+        self.assertEqual(self._get_response_data(response)['pagination']['total'], 3)
+
+    def test_get_games_total_expires(self) -> None:
+        """Test that a cached total is recounted after its TTL, catching writes this worker never saw"""
+        self.app.config.update(RESPONSE_CACHE_ENABLED=False, COUNT_CACHE_TTL=0)
+        self.client.get(self.GAMES_API_PATH)
+
+        with self.app.app_context():
+            # Core on its own connection: like another process, no session events
+            with db.engine.begin() as connection:
+                connection.execute(Game.__table__.delete().where(Game.title == "Agile Adventures"))
+
+        response = self.client.get(self.GAMES_API_PATH)
+        self.assertEqual(self._get_response_data(response)['pagination']['total'], 1)
+
+    def test_get_games_sets_validators(self) -> None:
+        """Test that listings carry an ETag, Last-Modified and revalidation policy"""
+        response = self.client.get(self.GAMES_API_PATH)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.headers.get('ETag'))
+        self.assertIsNotNone(response.headers.get('Last-Modified'))
+        self.assertIn('no-cache', response.headers['Cache-Control'])
+
+    def test_get_games_if_none_match_not_modified(self) -> None:
+        """Test that a matching If-None-Match gets a 304 without querying the database"""
+        etag = self.client.get(self.GAMES_API_PATH).headers['ETag']
+
+        with self.app.app_context():
+            with count_queries(db.engine) as statements:
+                response = self.client.get(self.GAMES_API_PATH, headers={'If-None-Match': etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+        self.assertEqual(response.headers['ETag'], etag)
+        self.assertEqual(statements, [])
+
+    def test_get_games_if_modified_since_not_modified(self) -> None:
+        """Test that an up-to-date If-Modified-Since gets a 304"""
+        last_modified = self.client.get(self.GAMES_API_PATH).headers['Last-Modified']
+
+        response = self.client.get(self.GAMES_API_PATH, headers={'If-Modified-Since': last_modified})
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_get_games_etag_varies_by_query(self) -> None:
+        """Test that different pages of the listing get different ETags"""
+        first = self.client.get(f'{self.GAMES_API_PATH}?pageSize=1&page=1')
+        second = self.client.get(f'{self.GAMES_API_PATH}?pageSize=1&page=2',
+                                 headers={'If-None-Match': first.headers['ETag']})
+
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(first.headers['ETag'], second.headers['ETag'])
+
+    def test_get_game_etag_changes_after_write(self) -> None:
+        """Test that a catalog write invalidates previously issued ETags"""
+        response = self.client.get(f'{self.GAMES_API_PATH}/1')
+        etag = response.headers['ETag']
+
+        with self.app.app_context():
+            game = db.session.get(Game, 1)
+            game.star_rating = 2.5
+            db.session.commit()
+
+        response = self.client.get(f'{self.GAMES_API_PATH}/1', headers={'If-None-Match': etag})
+        data = self._get_response_data(response)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['starRating'], 2.5)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_get_game_not_found_has_no_etag(self) -> None:
+        """Test that error responses are not given validators"""
+        response = self.client.get(f'{self.GAMES_API_PATH}/999')
+
+        self.assertEqual(response.status_code, 404)
+        self.assertIsNone(response.headers.get('ETag'))
+
     def test_get_game_by_id_success(self) -> None:
         """Test successful retrieval of a single game by ID"""
         response = self.client.get(self.GAMES_API_PATH)
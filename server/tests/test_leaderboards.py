@@ -0,0 +1,106 @@
+import unittest
+from datetime import datetime, timezone
+from flask import Flask
+from models import Game, Publisher, Category, db
+from routes.leaderboards import leaderboards_bp
+from utils.leaderboards import TRENDING_EPOCH, TRENDING_HALF_LIFE, trending_weight
+from utils.rating_queue import get_rating_queue
+from tests.helpers import get_test_database_uri
+
+class TestLeaderboards(unittest.TestCase):
+    """Tests for the top-rated and trending leaderboards."""
+
+    LEADERBOARDS_API_PATH: str = '/api/leaderboards'
+
+    def setUp(self) -> None:
+        """Set up test database with rated and unrated games in two categories"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = get_test_database_uri()
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        self.app.config['RATING_QUEUE_FLUSH_INTERVAL'] = 60
+        self.app.register_blueprint(leaderboards_bp)
+        self.client = self.app.test_client()
+        db.init_app(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+            db.session.add_all([Publisher(name="DevGames Inc"), Category(name="Strategy"), Category(name="Card Game")])
+            db.session.flush()
+            ratings = [(1, 4.5), (1, 3.0), (2, 4.8), (2, None), (1, 4.5), (2, 2.0)]
+            db.session.add_all([
+                Game(title=f"Game {i}", description="A perfectly fine game", publisher_id=1,
+                     category_id=category_id, star_rating=star_rating)
+                for i, (category_id, star_rating) in enumerate(ratings, start=1)
+            ])
+            db.session.commit()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            get_rating_queue().stop()
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _ids(self, path: str) -> list[int]:
+        """Helper returning the game ids on a leaderboard, in rank order"""
+        response = self.client.get(f'{self.LEADERBOARDS_API_PATH}/{path}')
+        self.assertEqual(response.status_code, 200)
+        return [game['id'] for game in response.get_json()['games']]
+
+    def test_top_rated_overall(self) -> None:
+        """Rated games should rank by star rating, newest first on ties, unrated excluded."""
+        self.assertEqual(self._ids('top-rated'), [3, 5, 1, 2, 6])
+        self.assertEqual(self._ids('top-rated?limit=2'), [3, 5])
+
+    def test_top_rated_per_category(self) -> None:
+        """A category's board should only hold its own games."""
+        response = self.client.get(f'{self.LEADERBOARDS_API_PATH}/top-rated?category=2')
+        data = response.get_json()
+
+        self.assertEqual(data['leaderboard'], 'top-rated')
+        self.assertEqual(data['category'], 2)
+        self.assertEqual([game['id'] for game in data['games']], [3, 6])
+        self.assertEqual(data['games'][0]['category']['name'], "Card Game")
+
+    def test_leaderboards_follow_writes(self) -> None:
+        """A changed rating should move the game on the next read."""
+        self._ids('top-rated')
+        with self.app.app_context():
+            db.session.get(Game, 2).star_rating = 5.0
+            db.session.commit()
+
+        self.assertEqual(self._ids('top-rated')[0], 2)
+
+    def test_trending_ranks_by_recent_votes(self) -> None:
+        """Only voted games should trend, the most voted first."""
+        self.assertEqual(self._ids('trending'), [])
+
+        with self.app.app_context():
+            queue = get_rating_queue()
+            for game_id in (4, 4, 4, 2, 6):
+                queue.submit(game_id, 5)
+            queue.flush()
+
+        self.assertEqual(self._ids('trending'), [4, 6, 2])
+        self.assertEqual(self._ids('trending?category=1'), [2])
+
+    def test_trending_weight_doubles_every_half_life(self) -> None:
+        """A vote should count twice as much as one cast a half-life earlier."""
+        now = datetime(2026, 10, 17, tzinfo=timezone.utc)
+
+        self.assertEqual(trending_weight(TRENDING_EPOCH), 1.0)
+        self.assertAlmostEqual(trending_weight(now + TRENDING_HALF_LIFE) / trending_weight(now), 2.0)
+
+    def test_invalid_requests(self) -> None:
+        """Unknown boards and categories and out-of-range limits should be rejected."""
+        self.assertEqual(self.client.get(f'{self.LEADERBOARDS_API_PATH}/worst').status_code, 404)
+        self.assertEqual(self.client.get(f'{self.LEADERBOARDS_API_PATH}/top-rated?limit=0').status_code, 400)
+        self.assertEqual(self.client.get(f'{self.LEADERBOARDS_API_PATH}/top-rated?limit=101').status_code, 400)
+        self.assertEqual(self.client.get(f'{self.LEADERBOARDS_API_PATH}/top-rated?category=abc').status_code, 400)
+        self.assertEqual(self.client.get(f'{self.LEADERBOARDS_API_PATH}/top-rated?category=99999999999999999999').status_code, 400)
+        self.assertEqual(self.client.get(f'{self.LEADERBOARDS_API_PATH}/top-rated?category=99').status_code, 404)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 from typing import Dict, Any
 from flask import Flask
 from models import Game, Publisher, Category, db
+from tests.helpers import get_test_database_uri
 
 class TestModels(unittest.TestCase):
     """Test suite for model validations"""
@@ -22,7 +23,7 @@ class TestModels(unittest.TestCase):
         # Create a fresh Flask app for testing
         self.app = Flask(__name__)
         self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = get_test_database_uri()
         self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
         
         # Initialize in-memory database for testing
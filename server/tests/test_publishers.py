@@ -0,0 +1,172 @@
+import unittest
+import json
+from typing import Dict, Any
+from flask import Flask, Response
+from sqlalchemy import select
+from models import Game, Category, Publisher, db
+from routes.publishers import publishers_bp
+from tests.helpers import count_queries, get_test_database_uri
+
+class TestPublishersRoutes(unittest.TestCase):
+    # Test data as complete objects
+    TEST_DATA: Dict[str, Any] = {
+        "categories": [
+            {"name": "Strategy"},
+            {"name": "Card Game"}
+        ],
+        "publishers": [
+            {"name": "DevGames Inc", "description": "Shipping developer games since 2010"},
+            {"name": "Scrum Masters"},
+            {"name": "Indie Ops"}
+        ],
+        "games": [
+            {"title": "Pipeline Panic", "category_index": 0, "publisher_index": 0, "star_rating": 4.5},
+            {"title": "Agile Adventures", "category_index": 1, "publisher_index": 0, "star_rating": 4.0},
+            {"title": "Cache Invalidation", "category_index": 0, "publisher_index": 0, "star_rating": 3.0},
+            {"title": "Deploy Friday", "category_index": 1, "publisher_index": 0, "star_rating": None},
+            {"title": "Stack Trace Solitaire", "category_index": 1, "publisher_index": 1, "star_rating": 3.5}
+        ]
+    }
+
+    # API paths
+    PUBLISHERS_API_PATH: str = '/api/publishers'
+
+    def setUp(self) -> None:
+        """Set up test database and seed data"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = get_test_database_uri()
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+        self.app.register_blueprint(publishers_bp)
+        self.client = self.app.test_client()
+        db.init_app(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+            self._seed_test_data()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _seed_test_data(self) -> None:
+        """Helper method to seed test data"""
+        categories = [Category(**data) for data in self.TEST_DATA["categories"]]
+        publishers = [Publisher(**data) for data in self.TEST_DATA["publishers"]]
+        db.session.add_all(categories + publishers)
+
+        for game_data in self.TEST_DATA["games"]:
+            game_dict = game_data.copy()
+            category_index = game_dict.pop("category_index")
+            publisher_index = game_dict.pop("publisher_index")
+            db.session.add(Game(
+                **game_dict,
+                description="A long enough description for tests",
+                category=categories[category_index],
+                publisher=publishers[publisher_index]
+            ))
+        db.session.commit()
+
+    def _get_response_data(self, response: Response) -> Any:
+        """Helper method to parse response data"""
+        return json.loads(response.data)
+
+    def _get_publisher_id(self, name: str) -> int:
+        """Helper to look up a seeded publisher's id by name"""
+        with self.app.app_context():
+            return db.session.scalar(select(Publisher.id).where(Publisher.name == name))
+
+    def test_get_publishers_success(self) -> None:
+        """Test listing publishers with counts and averages, ordered by name"""
+        response = self.client.get(self.PUBLISHERS_API_PATH)
+        data = self._get_response_data(response)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([c['name'] for c in data], ['DevGames Inc', 'Indie Ops', 'Scrum Masters'])
+
+        by_name = {c['name']: c for c in data}
+        self.assertEqual(by_name['DevGames Inc']['game_count'], 4)
+        self.assertEqual(by_name['DevGames Inc']['average_rating'], 3.83)
+        self.assertEqual(by_name['Scrum Masters']['game_count'], 1)
+        self.assertEqual(by_name['Scrum Masters']['average_rating'], 3.5)
+
+    def test_get_publishers_structure(self) -> None:
+        """Test that each publisher exposes the required fields"""
+        response = self.client.get(self.PUBLISHERS_API_PATH)
+        data = self._get_response_data(response)
+
+        required_fields = ['id', 'name', 'description', 'game_count', 'average_rating', 'top_games']
+        for publisher in data:
+            for field in required_fields:
+                self.assertIn(field, publisher)
+            for game in publisher['top_games']:
+                self.assertEqual(set(game.keys()), {'id', 'title', 'starRating'})
+
+    def test_get_publishers_top_games(self) -> None:
+        """Test that top games are capped and ordered by rating with unrated games last"""
+        response = self.client.get(self.PUBLISHERS_API_PATH)
+        devgames = next(c for c in self._get_response_data(response) if c['name'] == 'DevGames Inc')
+
+        self.assertEqual(
+            [g['title'] for g in devgames['top_games']],
+            ['Pipeline Panic', 'Agile Adventures', 'Cache Invalidation']
+        )
+
+    def test_get_publishers_without_games(self) -> None:
+        """Test that a publisher with no games reports zero count and no average"""
+        response = self.client.get(self.PUBLISHERS_API_PATH)
+        puzzle = next(c for c in self._get_response_data(response) if c['name'] == 'Indie Ops')
+
+        self.assertEqual(puzzle['game_count'], 0)
+        self.assertIsNone(puzzle['average_rating'])
+        self.assertEqual(puzzle['top_games'], [])
+
+    def test_get_publishers_constant_query_count(self) -> None:
+        """Test that listing publishers does not issue per-publisher queries"""
+        with self.app.app_context():
+            with count_queries(db.engine) as statements:
+                response = self.client.get(self.PUBLISHERS_API_PATH)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(statements), 2)
+
+    def test_get_publishers_empty_database(self) -> None:
+        """Test listing publishers when none exist"""
+        from sqlalchemy import delete
+        with self.app.app_context():
+            db.session.execute(delete(Game))
+            db.session.execute(delete(Publisher))
+            db.session.commit()
+
+        response = self.client.get(self.PUBLISHERS_API_PATH)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._get_response_data(response), [])
+
+    def test_get_publisher_by_id_success(self) -> None:
+        """Test retrieving a single publisher summary"""
+        publisher_id = self._get_publisher_id('DevGames Inc')
+
+        response = self.client.get(f'{self.PUBLISHERS_API_PATH}/{publisher_id}')
+        data = self._get_response_data(response)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['name'], 'DevGames Inc')
+        self.assertEqual(data['description'], 'Shipping developer games since 2010')
+        self.assertEqual(data['game_count'], 4)
+        self.assertEqual(len(data['top_games']), 3)
+
+    def test_get_publisher_by_id_not_found(self) -> None:
+        """Test retrieval of a non-existent publisher"""
+        response = self.client.get(f'{self.PUBLISHERS_API_PATH}/999')
+        data = self._get_response_data(response)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(data['error'], "Publisher not found")
+
+if __name__ == '__main__':
+    unittest.main()
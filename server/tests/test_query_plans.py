@@ -0,0 +1,158 @@
+import itertools
+import unittest
+from flask import Flask
+from sqlalchemy import Executable
+from models import Game, Publisher, Category, db
+from routes.games import (
+    FieldSelection,
+    GAME_SORTS,
+    GameFilters,
+    get_game_by_id_stmt,
+    get_games_by_ids_stmt,
+    get_games_count_stmt,
+    get_games_keyset_stmt,
+    get_games_page_stmt,
+    get_games_search_stmt,
+)
+from utils.catalog_stats import get_entity_summary_stmt, get_top_games_stmt
+from utils.leaderboards import LEADERBOARDS, get_leaderboard_stmt
+from utils.migrations import create_missing_indexes, drop_obsolete_indexes
+from tests.helpers import explain_query_plan, find_full_table_scans, get_test_database_uri
+
+@unittest.skipUnless(get_test_database_uri().startswith('sqlite'), 'EXPLAIN QUERY PLAN is SQLite-specific')
+class TestQueryPlans(unittest.TestCase):
+    """Every statement an API route runs should be served by an index, not a full table scan."""
+
+    def setUp(self) -> None:
+        """Set up an empty test database with the full schema"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = get_test_database_uri()
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        db.init_app(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _assert_no_full_scans(self, stmt: Executable, allowed_tables: tuple[str, ...] = ()) -> None:
+        """Helper asserting the statement's plan has no unindexed table scans"""
+        with self.app.app_context():
+            self.assertEqual(find_full_table_scans(db.session, stmt, allowed_tables), [])
+
+    def _assert_reads_title_index(self, stmt: Executable) -> None:
+        """Helper asserting the statement reads games in (title, id) order from ux_games_title"""
+        with self.app.app_context():
+            plan = explain_query_plan(db.session, stmt)
+        self.assertIn('INDEX ux_games_title', plan[0])
+        self.assertNotIn('USE TEMP B-TREE FOR ORDER BY', plan)
+
+    def test_games_page_uses_index(self) -> None:
+        """GET /api/games pages in title order via ux_games_title"""
+        self._assert_no_full_scans(get_games_page_stmt(offset=90, limit=9))
+        self._assert_no_full_scans(get_games_page_stmt(90, 9, FieldSelection(frozenset({'id', 'title'}))))
+        self._assert_reads_title_index(get_games_page_stmt(offset=90, limit=9))
+
+    def test_games_count_uses_index(self) -> None:
+        """The listing total counts a covering index instead of the table"""
+        self._assert_no_full_scans(get_games_count_stmt())
+
+    def test_games_keyset_uses_index(self) -> None:
+        """Keyset pages seek into ux_games_title"""
+        self._assert_no_full_scans(get_games_keyset_stmt(None, 9))
+        self._assert_no_full_scans(get_games_keyset_stmt(('Pipeline Panic', 4), 9))
+        self._assert_reads_title_index(get_games_keyset_stmt(('Pipeline Panic', 4), 9))
+
+    def test_filtered_sorted_games_avoid_sorting(self) -> None:
+        """Every filter and sort combination reads rows in order from an index"""
+        filter_values = itertools.product((None, 1), (None, 2), (None, 3.5))
+        for (category_id, publisher_id, min_rating), sort in itertools.product(filter_values, GAME_SORTS):
+            filters = GameFilters(category_id, publisher_id, min_rating)
+            # By rating, the unrated games are read by a statement of their own
+            afters = {'title': [('Pipeline Panic', 4)], 'rating': [(4.5, 4), (None, 4)], 'newest': [(4,)]}[sort]
+            # Newest-first without a category or publisher walks the primary key itself
+            allowed = ('games',) if sort == 'newest' and category_id is None and publisher_id is None else ()
+            for stmt in [
+                get_games_page_stmt(90, 9, filters=filters, sort=sort),
+                get_games_keyset_stmt(None, 9, filters=filters, sort=sort),
+                *(get_games_keyset_stmt(after, 9, filters=filters, sort=sort) for after in afters),
+            ]:
+                with self.subTest(filters=filters, sort=sort):
+                    self._assert_no_full_scans(stmt, allowed)
+                    with self.app.app_context():
+                        self.assertNotIn('USE TEMP B-TREE FOR ORDER BY', explain_query_plan(db.session, stmt))
+
+    def test_filtered_games_count_uses_index(self) -> None:
+        """Filtered totals count an index range"""
+        self._assert_no_full_scans(get_games_count_stmt(GameFilters(category_id=1, min_rating=3.5)))
+        self._assert_no_full_scans(get_games_count_stmt(GameFilters(publisher_id=2)))
+
+    def test_games_search_uses_fts_index(self) -> None:
+        """Search reads matches from the FTS5 index, then games by primary key"""
+        self._assert_no_full_scans(get_games_search_stmt('"pipe"*', None, 9))
+        self._assert_no_full_scans(get_games_search_stmt('"pipe"*', (-1.5, 4), 9))
+
+    def test_game_by_id_uses_primary_key(self) -> None:
+        """GET /api/games/<id> looks the game up by primary key"""
+        self._assert_no_full_scans(get_game_by_id_stmt(1))
+
+    def test_games_by_ids_use_primary_key(self) -> None:
+        """Batch lookups probe the primary key once per id"""
+        self._assert_no_full_scans(get_games_by_ids_stmt([5, 1, 9]))
+
+    def test_entity_summaries_use_index(self) -> None:
+        """Category and publisher listings only scan the (small) entity table itself"""
+        self._assert_no_full_scans(get_entity_summary_stmt(Category, Game.category_id), ('categories',))
+        self._assert_no_full_scans(get_entity_summary_stmt(Publisher, Game.publisher_id), ('publishers',))
+        self._assert_no_full_scans(get_entity_summary_stmt(Category, Game.category_id, entity_id=1))
+
+    def test_top_games_use_index(self) -> None:
+        """Top games per entity are ranked from the (fk, star_rating) indexes"""
+        self._assert_no_full_scans(get_top_games_stmt(Game.category_id))
+        self._assert_no_full_scans(get_top_games_stmt(Game.publisher_id, entity_id=1))
+
+    def test_leaderboards_read_in_index_order(self) -> None:
+        """Leaderboards walk a score index, overall or per category, without sorting"""
+        for board, category_id in itertools.product(LEADERBOARDS, (None, 3)):
+            with self.subTest(board=board, category_id=category_id):
+                stmt = get_leaderboard_stmt(board, 10, category_id)
+                self._assert_no_full_scans(stmt)
+                with self.app.app_context():
+                    self.assertNotIn('USE TEMP B-TREE FOR ORDER BY', explain_query_plan(db.session, stmt))
+
+    def test_detects_full_table_scan(self) -> None:
+        """The helper itself should flag a scan on an unindexed column"""
+        from sqlalchemy import select
+        with self.app.app_context():
+            scans = find_full_table_scans(db.session, select(Game).where(Game.description == 'x'))
+
+        self.assertEqual(scans, ['SCAN games'])
+
+    def test_create_missing_indexes(self) -> None:
+        """Indexes dropped from an existing database are recreated by the migration"""
+        from sqlalchemy import text
+        with self.app.app_context():
+            db.session.execute(text('DROP INDEX ix_games_category_id_title_id'))
+            db.session.commit()
+
+            self.assertEqual(create_missing_indexes(), ['ix_games_category_id_title_id'])
+            self.assertEqual(create_missing_indexes(), [])
+
+    def test_drop_obsolete_indexes(self) -> None:
+        """Indexes earlier releases created that are now redundant are dropped by the migration"""
+        from sqlalchemy import text
+        with self.app.app_context():
+            db.session.execute(text('CREATE INDEX ix_games_title_id ON games (title, id)'))
+            db.session.commit()
+
+            self.assertEqual(drop_obsolete_indexes(), ['ix_games_title_id'])
+            self.assertEqual(drop_obsolete_indexes(), [])
+
+if __name__ == '__main__':
+    unittest.main()
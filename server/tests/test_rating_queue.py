@@ -0,0 +1,194 @@
+import time
+import unittest
+from unittest import mock
+from flask import Flask
+from sqlalchemy import select
+from models import Game, Publisher, Category, db, get_catalog_version
+from routes.games import games_bp
+from utils.rating_queue import RatingQueue, get_rating_queue
+from tests.helpers import count_queries, get_test_database_uri
+
+class TestRatingQueue(unittest.TestCase):
+    """Tests for the write-behind rating vote queue and its endpoints."""
+
+    GAMES_API_PATH: str = '/api/games'
+
+    def setUp(self) -> None:
+        """Set up test database with two games"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = get_test_database_uri()
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        # Only explicit flushes, unless a test starts its own queue
+        self.app.config['RATING_QUEUE_FLUSH_INTERVAL'] = 60
+        self.app.register_blueprint(games_bp)
+        self.client = self.app.test_client()
+        db.init_app(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+            db.session.add_all([Publisher(name="DevGames Inc"), Category(name="Strategy")])
+            db.session.flush()
+            db.session.add_all([
+                Game(title="Pipeline Panic", description="Build your DevOps pipeline before chaos ensues",
+                     publisher_id=1, category_id=1, star_rating=4.5),
+                Game(title="Agile Adventures", description="Navigate your team through sprints",
+                     publisher_id=1, category_id=1),
+            ])
+            db.session.commit()
+            self.queue = get_rating_queue()
+
+    def tearDown(self) -> None:
+        """Stop the queue, clean up test database and ensure proper connection closure"""
+        self.queue.stop()
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _ratings(self, game_id: int) -> tuple[float, int, float | None]:
+        """Helper reading a game's stored vote totals and average"""
+        with self.app.app_context():
+            return tuple(db.session.execute(
+                select(Game.rating_sum, Game.rating_count, Game.star_rating).where(Game.id == game_id)
+            ).one())
+
+    def _wait_for(self, condition, timeout: float = 5.0) -> None:
+        """Helper polling until the flush thread has done its work"""
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                self.fail("timed out waiting for the rating queue")
+            time.sleep(0.01)
+
+    def test_flush_writes_running_totals_in_one_statement(self) -> None:
+        """Votes for many games should be written by one executemany UPDATE."""
+        for rating in (5, 4, 3):
+            self.queue.submit(1, rating)
+        self.queue.submit(2, 2)
+
+        with self.app.app_context():
+            with count_queries(db.engine) as statements:
+                self.assertEqual(self.queue.flush(), 4)
+
+        self.assertEqual([s for s in statements if s.startswith('UPDATE')], [statements[0]])
+        self.assertEqual(self._ratings(1), (12.0, 3, 4.0))
+        self.assertEqual(self._ratings(2), (2.0, 1, 2.0))
+        self.assertEqual(self.queue.flush(), 0)
+
+    def test_flushes_accumulate(self) -> None:
+        """Later flushes should add to the stored totals."""
+        self.queue.submit(1, 5)
+        self.queue.flush()
+        self.queue.submit(1, 2)
+        self.queue.flush()
+
+        self.assertEqual(self._ratings(1), (7.0, 2, 3.5))
+        self.assertEqual(self.queue.stats()['flushes'], 2)
+
+    def test_flush_invalidates_catalog_and_etag(self) -> None:
+        """A flush changes listed ratings, so it should bump the catalog and row versions."""
+        etag = self.client.get(f'{self.GAMES_API_PATH}/1').headers['ETag']
+        with self.app.app_context():
+            version = get_catalog_version()
+
+        self.queue.submit(1, 1)
+        self.queue.flush()
+
+        with self.app.app_context():
+            self.assertEqual(get_catalog_version(), version + 1)
+        response = self.client.get(f'{self.GAMES_API_PATH}/1')
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertEqual(response.get_json()['starRating'], 1.0)
+
+    def test_catalog_bumps_are_coalesced(self) -> None:
+        """Flushes within the bump interval should share one catalog version bump, made once it passes."""
+        self.queue = RatingQueue(self.app, flush_interval=60, bump_interval=60)
+        with self.app.app_context():
+            version = get_catalog_version()
+
+        self.queue.submit(1, 1)
+        self.queue.flush()
+        self.queue.submit(2, 3)
+        self.queue.flush()
+        with self.app.app_context():
+            self.assertEqual(get_catalog_version(), version + 1)
+        # The row version is bumped by every flush regardless
+        self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/2').get_json()['starRating'], 3.0)
+
+        with mock.patch('utils.rating_queue.time.monotonic', return_value=time.monotonic() + 61):
+            self.queue.submit(2, 5)
+            self.queue.flush()
+        with self.app.app_context():
+            self.assertEqual(get_catalog_version(), version + 2)
+
+        self.queue.submit(1, 5)
+        self.queue.flush()
+        self.queue.stop()
+        with self.app.app_context():
+            self.assertEqual(get_catalog_version(), version + 3)
+        self.assertEqual(self.queue.stats()['bumps'], 3)
+
+    def test_failed_flush_keeps_votes_queued(self) -> None:
+        """Votes from a batch that could not be written should be retried by the next flush."""
+        self.queue.submit(1, 4)
+        with mock.patch('utils.rating_queue.get_rating_flush_stmt', side_effect=RuntimeError("database is locked")):
+            with self.assertLogs(self.app.logger, 'ERROR'):
+                with self.assertRaises(RuntimeError):
+                    self.queue.flush()
+        self.queue.submit(1, 2)
+
+        self.assertEqual(self.queue.stats()['pending'], 2)
+        self.assertEqual(self.queue.flush(), 2)
+        self.assertEqual(self._ratings(1), (6.0, 2, 3.0))
+
+    def test_thread_flushes_when_batch_is_full(self) -> None:
+        """Reaching max_pending should wake the flush thread before the interval."""
+        self.queue = RatingQueue(self.app, max_pending=3, flush_interval=60)
+        for rating in (1, 2, 3):
+            self.queue.submit(2, rating)
+
+        self._wait_for(lambda: self.queue.stats()['flushed'] == 3)
+        self.assertEqual(self._ratings(2), (6.0, 3, 2.0))
+
+    def test_thread_flushes_on_interval(self) -> None:
+        """A few votes should still be written once the interval passes."""
+        self.queue = RatingQueue(self.app, max_pending=1_000, flush_interval=0.05)
+        self.queue.submit(2, 5)
+
+        self._wait_for(lambda: self.queue.stats()['flushed'] == 1)
+        self.assertEqual(self._ratings(2), (5.0, 1, 5.0))
+
+    def test_stop_drains_pending_votes(self) -> None:
+        """Stopping the queue should write every vote still buffered."""
+        self.queue.submit(1, 3)
+        self.queue.submit(2, 4)
+
+        self.queue.stop()
+
+        self.assertEqual(self.queue.stats()['pending'], 0)
+        self.assertEqual(self._ratings(1), (3.0, 1, 3.0))
+        self.assertEqual(self._ratings(2), (4.0, 1, 4.0))
+
+    def test_rate_game_endpoint(self) -> None:
+        """POST should queue the vote, and GET should count it before it is written."""
+        response = self.client.post(f'{self.GAMES_API_PATH}/1/ratings', json={'rating': 4})
+        self.assertEqual(response.status_code, 202)
+
+        self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/1/ratings').get_json(),
+                         {'gameId': 1, 'sum': 4.0, 'count': 1, 'average': 4.0, 'pending': 1})
+        self.queue.flush()
+        self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/1/ratings').get_json()['pending'], 0)
+        self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/2/ratings').get_json()['average'], None)
+
+    def test_rate_game_rejects_invalid_votes(self) -> None:
+        """Votes must be numbers from 1 to 5 for an existing game."""
+        for body in ({'rating': 0}, {'rating': 6}, {'rating': True}, {'rating': "5"}, {}, None):
+            with self.subTest(body=body):
+                self.assertEqual(self.client.post(f'{self.GAMES_API_PATH}/1/ratings', json=body).status_code, 400)
+        self.assertEqual(self.client.post(f'{self.GAMES_API_PATH}/999/ratings', json={'rating': 3}).status_code, 404)
+        self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/999/ratings').status_code, 404)
+        self.assertEqual(self.queue.stats()['submitted'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import json
+import unittest
+from unittest import mock
+from flask import Flask
+from models import Game, Publisher, Category, db
+from routes.cache import cache_bp
+from routes.games import games_bp
+from utils.cache_backends import MemoryBackend
+from utils.response_cache import CachedResponse, ResponseCache
+from tests.helpers import get_test_database_uri
+
+class TestResponseCache(unittest.TestCase):
+    """Tests for the response cache on top of its backend."""
+
+    def _entry(self, body: bytes = b'{}') -> CachedResponse:
+        """Helper building a cached 200 response"""
+        return CachedResponse(200, [('Content-Type', 'application/json')], body)
+
+    def test_get_returns_stored_entry(self) -> None:
+        """A stored entry should be returned and counted as a hit."""
+        cache = ResponseCache()
+        cache.set('a', self._entry(b'[1]'))
+
+        self.assertEqual(cache.get('a'), self._entry(b'[1]'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_entries_round_trip_through_bytes(self) -> None:
+        """Entries should survive encoding, including newlines in the body."""
+        entry = CachedResponse(200, [('Content-Type', 'application/json'), ('Vary', 'Accept')], b'{\n"a":1}\n')
+
+        self.assertEqual(CachedResponse.decode(entry.encode()), entry)
+
+    def test_entries_expire_after_ttl(self) -> None:
+        """The cache TTL should be passed to the backend."""
+        cache = ResponseCache(MemoryBackend(), ttl=10)
+        with mock.patch('utils.cache_backends.time.monotonic', return_value=100.0):
+            cache.set('a', self._entry())
+        with mock.patch('utils.cache_backends.time.monotonic', return_value=111.0):
+            self.assertIsNone(cache.get('a'))
+
+    def test_backend_errors_are_misses(self) -> None:
+        """An unavailable backend should count errors and behave like a miss."""
+        backend = mock.Mock(spec=MemoryBackend, shared=True)
+        backend.get.side_effect = ConnectionRefusedError()
+        backend.set.side_effect = ConnectionRefusedError()
+        backend.stats.side_effect = ConnectionRefusedError()
+        cache = ResponseCache(backend)
+
+        cache.set('a', self._entry())
+
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['errors'], 2)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+class TestCachedRoutes(unittest.TestCase):
+    """Tests for response caching on the games endpoints."""
+
+    GAMES_API_PATH: str = '/api/games'
+    CACHE_STATS_API_PATH: str = '/api/cache/stats'
+
+    def setUp(self) -> None:
+        """Set up test database with one game"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = get_test_database_uri()
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        self.app.register_blueprint(games_bp)
+        self.app.register_blueprint(cache_bp)
+        self.client = self.app.test_client()
+        db.init_app(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+            publisher = Publisher(name="DevGames Inc")
+            category = Category(name="Strategy")
+            db.session.add(Game(
+                title="Pipeline Panic",
+                description="Build your DevOps pipeline before chaos ensues",
+                publisher=publisher,
+                category=category,
+                star_rating=4.5,
+            ))
+            db.session.commit()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def test_repeat_request_is_cache_hit(self) -> None:
+        """The second identical request should be served from the cache."""
+        first = self.client.get(self.GAMES_API_PATH)
+        second = self.client.get(self.GAMES_API_PATH)
+
+        self.assertEqual(first.headers['X-Cache'], 'MISS')
+        self.assertEqual(second.headers['X-Cache'], 'HIT')
+        self.assertEqual(first.data, second.data)
+
+    def test_query_args_are_part_of_key(self) -> None:
+        """Different query arguments should be cached separately."""
+        self.client.get(f'{self.GAMES_API_PATH}?page=1')
+        response = self.client.get(f'{self.GAMES_API_PATH}?page=2')
+
+        self.assertEqual(response.headers['X-Cache'], 'MISS')
+
+    def test_write_invalidates_cache(self) -> None:
+        """Committing a catalog write should clear cached responses."""
+        self.client.get(f'{self.GAMES_API_PATH}/1')
+
+        with self.app.app_context():
+            db.session.get(Game, 1).title = "Pipeline Panic Deluxe"
+            db.session.commit()
+
+        response = self.client.get(f'{self.GAMES_API_PATH}/1')
+
+        self.assertEqual(response.headers['X-Cache'], 'MISS')
+        self.assertEqual(json.loads(response.data)['title'], "Pipeline Panic Deluxe")
+
+    def test_errors_are_not_cached(self) -> None:
+        """404 responses should not be stored."""
+        self.client.get(f'{self.GAMES_API_PATH}/999')
+        response = self.client.get(f'{self.GAMES_API_PATH}/999')
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.headers['X-Cache'], 'MISS')
+
+    def test_cache_disabled_by_config(self) -> None:
+        """RESPONSE_CACHE_ENABLED=False should bypass the cache."""
+        self.app.config['RESPONSE_CACHE_ENABLED'] = False
+        self.client.get(self.GAMES_API_PATH)
+        response = self.client.get(self.GAMES_API_PATH)
+
+        self.assertNotIn('X-Cache', response.headers)
+
+    def test_cache_stats_endpoint(self) -> None:
+        """The stats endpoint should expose hit and miss counters."""
+        self.client.get(self.GAMES_API_PATH)
+        self.client.get(self.GAMES_API_PATH)
+
+        response = self.client.get(self.CACHE_STATS_API_PATH)
+        data = json.loads(response.data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['hits'], 1)
+        self.assertEqual(data['misses'], 1)
+        self.assertEqual(data['entries'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import unittest
+from flask import Flask
+from models import Game, Publisher, Category, db
+from routes.games import games_bp
+from utils.search import build_match_query, render_highlight
+from tests.helpers import get_test_database_uri
+
+@unittest.skipUnless(get_test_database_uri().startswith('sqlite'), 'full-text search uses SQLite FTS5')
+class TestGamesSearch(unittest.TestCase):
+    """Tests for full-text search on GET /api/games?q=..."""
+
+    GAMES_API_PATH: str = '/api/games'
+
+    def setUp(self) -> None:
+        """Set up test database with games to search"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = get_test_database_uri()
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        self.app.config['RESPONSE_CACHE_ENABLED'] = False
+        self.app.register_blueprint(games_bp)
+        self.client = self.app.test_client()
+        db.init_app(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+            publisher = Publisher(name="DevGames Inc")
+            category = Category(name="Strategy")
+            for title, description in [
+                ("Agile Adventures", "Navigate sprints and keep the deployment pipeline green"),
+                ("Pipeline Panic <Deluxe>", "Build your DevOps pipeline before chaos ensues"),
+                ("Merge Conflict Mayhem", "Resolve conflicts before the release train leaves"),
+            ]:
+                db.session.add(Game(title=title, description=description,
+                                    publisher=publisher, category=category, star_rating=4.0))
+            db.session.commit()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _search(self, query: str, **params: str) -> dict:
+        response = self.client.get(self.GAMES_API_PATH, query_string={'q': query, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    def _titles(self, query: str, **params: str) -> list[str]:
+        return [game['title'] for game in self._search(query, **params)['games']]
+
+    def test_prefix_match_ranks_title_matches_first(self) -> None:
+        """Words match as prefixes, and a title hit outranks a description hit."""
+        self.assertEqual(self._titles('pipe'), ["Pipeline Panic <Deluxe>", "Agile Adventures"])
+        self.assertEqual(self._titles('merge conf'), ["Merge Conflict Mayhem"])
+        self.assertEqual(self._titles('nothing matches'), [])
+
+    def test_highlights_are_escaped(self) -> None:
+        """Matched terms are wrapped in <mark>; the rest of the text is HTML-escaped."""
+        game = self._search('pipeline')['games'][0]
+
+        self.assertEqual(game['highlights']['title'], '<mark>Pipeline</mark> Panic &lt;Deluxe&gt;')
+        self.assertIn('<mark>pipeline</mark>', game['highlights']['description'])
+        self.assertEqual(game['title'], "Pipeline Panic <Deluxe>")
+
+    def test_cursor_pagination(self) -> None:
+        """Pages follow the rank order and end with a null cursor."""
+        first = self._search('pipeline', pageSize='1')
+        second = self._search('pipeline', pageSize='1', cursor=first['pagination']['nextCursor'])
+
+        self.assertEqual([game['title'] for game in first['games']], ["Pipeline Panic <Deluxe>"])
+        self.assertEqual([game['title'] for game in second['games']], ["Agile Adventures"])
+        self.assertIsNone(second['pagination']['nextCursor'])
+
+    def test_sparse_fields(self) -> None:
+        """fields= applies to search results, highlights are always included."""
+        game = self._search('merge', fields='title')['games'][0]
+
+        self.assertEqual(set(game), {'id', 'title', 'highlights'})
+
+    def test_filters_apply_to_search(self) -> None:
+        """Listing filters narrow search results."""
+        with self.app.app_context():
+            db.session.get(Game, 1).star_rating = 2.0
+            db.session.commit()
+
+        self.assertEqual(self._titles('pipeline', minRating='3'), ["Pipeline Panic <Deluxe>"])
+        self.assertEqual(self._titles('pipeline', category='2'), [])
+
+    def test_index_follows_writes(self) -> None:
+        """Triggers keep the index in step with inserts, updates and deletes."""
+        with self.app.app_context():
+            existing = db.session.get(Game, 2)
+            db.session.add(Game(title="Kanban Quest", description="Limit work in progress",
+                                publisher=existing.publisher, category=existing.category))
+            db.session.get(Game, 3).title = "Rebase Rampage"
+            db.session.delete(db.session.get(Game, 1))
+            db.session.commit()
+
+        self.assertEqual(self._titles('kanban'), ["Kanban Quest"])
+        self.assertEqual(self._titles('merge'), [])
+        self.assertEqual(self._titles('rebase'), ["Rebase Rampage"])
+        self.assertEqual(self._titles('sprints'), [])
+
+    def test_query_syntax_is_inert(self) -> None:
+        """FTS5 operators in user input are searched as plain words."""
+        self.assertEqual(self._titles('pipeline OR "merge" NOT*'), [])
+        self.assertEqual(self._titles('title:merge'), [])
+        self.assertEqual(self._titles('(conflict)'), ["Merge Conflict Mayhem"])
+
+    def test_invalid_requests(self) -> None:
+        """Empty queries and malformed cursors are rejected."""
+        for params in ({'q': ''}, {'q': '"*'}, {'q': 'pipe', 'cursor': 'garbage'}):
+            with self.subTest(params=params):
+                response = self.client.get(self.GAMES_API_PATH, query_string=params)
+                self.assertEqual(response.status_code, 400)
+
+class TestSearchQuery(unittest.TestCase):
+    """Tests for the search query helpers."""
+
+    def test_build_match_query(self) -> None:
+        self.assertEqual(build_match_query('Pipe  panic!'), '"Pipe"* "panic"*')
+        self.assertEqual(build_match_query('a b c d e f g h i j'), '"a"* "b"* "c"* "d"* "e"* "f"* "g"* "h"*')
+        with self.assertRaises(ValueError):
+            build_match_query(' -- ')
+
+    def test_render_highlight(self) -> None:
+        self.assertEqual(render_highlight('\x02a&b\x03 <c>'), '<mark>a&amp;b</mark> &lt;c&gt;')
+        self.assertIsNone(render_highlight(None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import csv
+import os
+import tempfile
+import unittest
+from typing import Any
+from flask import Flask
+from sqlalchemy import func, select
+from models import Game, Publisher, Category, db
+from utils.seed_database import import_games
+from tests.helpers import get_test_database_uri
+
+class TestSeedDatabase(unittest.TestCase):
+    """Tests for the bulk CSV importer."""
+
+    TEST_DATA: dict[str, Any] = {
+        "rows": [
+            ["Pipeline Panic", "Strategy", "DevGames Inc", "Build your DevOps pipeline before chaos ensues"],
+            ["Agile Adventures", "Card Game", "Scrum Masters", "Navigate your team through sprints and releases"],
+            ["Merge Mayhem", "Strategy", "Scrum Masters", "Resolve conflicts before the release train departs"],
+            ["Pipeline Panic", "Strategy", "DevGames Inc", "A duplicate title that should be skipped"],
+        ]
+    }
+
+    def setUp(self) -> None:
+        """Set up test database and a temporary CSV file"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = get_test_database_uri()
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        db.init_app(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+
+        self.csv_dir = tempfile.TemporaryDirectory()
+        self.csv_path = self._write_csv(self.TEST_DATA["rows"])
+
+    def tearDown(self) -> None:
+        """Clean up test database and temporary files"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+        self.csv_dir.cleanup()
+
+    def _write_csv(self, rows: list[list[str]], name: str = 'games.csv') -> str:
+        """Helper writing rows to a CSV with the seed file's header"""
+        path = os.path.join(self.csv_dir.name, name)
+        with open(path, 'w', newline='', encoding='utf-8') as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(['Title', 'Category', 'Publisher', 'Description'])
+            writer.writerows(rows)
+        return path
+
+    def _count(self, model: type[db.Model]) -> int:
+        """Helper counting rows of a model"""
+        return db.session.scalar(select(func.count()).select_from(model))
+
+    def test_import_games_creates_rows(self) -> None:
+        """Test that games, categories and publishers are created and linked"""
+        with self.app.app_context():
+            stats = import_games(self.csv_path, chunk_size=2)
+
+            self.assertEqual(stats['games_created'], 3)
+            self.assertEqual(stats['games_skipped'], 1)
+            self.assertEqual(stats['categories_created'], 2)
+            self.assertEqual(stats['publishers_created'], 2)
+
+            game = db.session.scalars(select(Game).where(Game.title == "Merge Mayhem")).one()
+            self.assertEqual(game.category.name, "Strategy")
+            self.assertEqual(game.publisher.name, "Scrum Masters")
+            self.assertTrue(game.description.endswith("Support this game through our crowdfunding platform!"))
+            self.assertTrue(3.0 <= game.star_rating <= 5.0)
+
+    def test_import_games_is_idempotent(self) -> None:
+        """Test that a second import skips every existing title"""
+        with self.app.app_context():
+            import_games(self.csv_path)
+            stats = import_games(self.csv_path)
+
+            self.assertEqual(stats['games_created'], 0)
+            self.assertEqual(stats['categories_created'], 0)
+            self.assertEqual(self._count(Game), 3)
+            self.assertEqual(self._count(Category), 2)
+            self.assertEqual(self._count(Publisher), 2)
+
+    def test_import_games_reuses_existing_entities(self) -> None:
+        """Test that existing categories and publishers are matched by name"""
+        with self.app.app_context():
+            db.session.add(Category(name="Strategy"))
+            db.session.commit()
+
+            stats = import_games(self.csv_path)
+
+            self.assertEqual(stats['categories_created'], 1)
+            self.assertEqual(self._count(Category), 2)
+
+    def test_import_games_validates_rows(self) -> None:
+        """Test that bulk inserts still enforce the model validation rules"""
+        path = self._write_csv([["X", "Strategy", "DevGames Inc", "Long enough description"]], 'invalid.csv')
+
+        with self.app.app_context():
+            with self.assertRaises(ValueError) as context:
+                import_games(path)
+
+            self.assertIn("Game title must be at least 2 characters", str(context.exception))
+
+if __name__ == '__main__':
+    unittest.main()
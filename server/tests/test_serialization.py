@@ -0,0 +1,131 @@
+import unittest
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import mock
+from flask import Flask, jsonify
+from sqlalchemy import select
+from models import Game, Publisher, Category, db
+from routes.games import games_bp
+from utils.serialization import dumps_json, json_response
+from tests.helpers import get_test_database_uri
+
+# Values whose encoding differs between encoders unless handled carefully
+SAMPLE_PAYLOADS = [
+    {'b': 1, 'a': [1, 2.5, None, True], 'c': {'z': 'x', 'y': 'é'}},
+    {'starRating': 4.5, 'tiny': 1e-05, 'huge': 1e16, 'zero': -0.0, 'edge': 0.0001},
+    {'nan': float('nan'), 'inf': float('inf')},
+    {'text': 'line\nbreak "quoted"   </script>', 'emoji': '\U0001f3b2'},
+    {'big': 2 ** 70, 'when': datetime(2024, 1, 2, tzinfo=timezone.utc), 'price': Decimal('1.10')},
+    [{'id': 1, 'title': 'Pipeline Panic', 'publisher': None, 'category': {'id': 2, 'name': 'Strategy'}}],
+]
+
+class TestDumpsJson(unittest.TestCase):
+    """dumps_json must write exactly the bytes jsonify does."""
+
+    def setUp(self) -> None:
+        self.app = Flask(__name__)
+
+    def _jsonify_bytes(self, obj: object) -> bytes:
+        with self.app.app_context():
+            return jsonify(obj).get_data()
+
+    def test_matches_jsonify(self) -> None:
+        """Each sample should encode identically with the fast encoder."""
+        for payload in SAMPLE_PAYLOADS:
+            with self.subTest(payload=payload):
+                self.assertEqual(dumps_json(payload) + b'\n', self._jsonify_bytes(payload))
+
+    def test_matches_jsonify_without_orjson(self) -> None:
+        """The stdlib fallback should produce the same bytes."""
+        with mock.patch('utils.serialization.orjson', None):
+            for payload in SAMPLE_PAYLOADS:
+                with self.subTest(payload=payload):
+                    self.assertEqual(dumps_json(payload) + b'\n', self._jsonify_bytes(payload))
+
+    def test_matches_jsonify_with_floats_hint(self) -> None:
+        """Caller-supplied floats should select the same encoding as a full walk."""
+        payload = {'games': [{'starRating': 1e-05}, {'starRating': None}]}
+
+        self.assertEqual(dumps_json(payload, floats=[1e-05, None]) + b'\n', self._jsonify_bytes(payload))
+
+    def test_json_response_matches_jsonify(self) -> None:
+        """json_response should match jsonify's body and mimetype."""
+        with self.app.app_context():
+            response = json_response(SAMPLE_PAYLOADS[0])
+            expected = jsonify(SAMPLE_PAYLOADS[0])
+
+        self.assertEqual(response.get_data(), expected.get_data())
+        self.assertEqual(response.mimetype, expected.mimetype)
+
+    def test_json_response_defers_to_jsonify_in_debug(self) -> None:
+        """Debug mode pretty-prints, so the provider should be used."""
+        self.app.debug = True
+        with self.app.app_context():
+            response = json_response({'a': 1})
+
+        self.assertEqual(response.get_data(), b'{\n  "a": 1\n}\n')
+
+class TestGamesSerialization(unittest.TestCase):
+    """The row-based games endpoints must match the ORM serialization byte for byte."""
+
+    GAMES_API_PATH: str = '/api/games'
+
+    def setUp(self) -> None:
+        """Set up test database with games, including non-ASCII text"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = get_test_database_uri()
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        self.app.config['RESPONSE_CACHE_ENABLED'] = False
+        self.app.register_blueprint(games_bp)
+        self.client = self.app.test_client()
+        db.init_app(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+            publisher = Publisher(name="DevGames Inc")
+            category = Category(name="Strategy")
+            db.session.add_all([
+                Game(title="Pipeline Panic", description="Build your DevOps pipeline before chaos ensues",
+                     publisher=publisher, category=category, star_rating=4.5),
+                Game(title="Café Deploys", description="Ship to production between espressos",
+                     publisher=publisher, category=category, star_rating=None),
+            ])
+            db.session.commit()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _legacy_bytes(self, payload: object) -> bytes:
+        with self.app.app_context():
+            return jsonify(payload).get_data()
+
+    def test_list_matches_orm_serialization(self) -> None:
+        """A listing page should match jsonify over Game.to_dict."""
+        with self.app.app_context():
+            games = db.session.scalars(select(Game).order_by(Game.title, Game.id)).all()
+            expected = {
+                'games': [game.to_dict() for game in games],
+                'pagination': {'page': 1, 'pageSize': 9, 'total': 2, 'totalPages': 1},
+            }
+
+        response = self.client.get(self.GAMES_API_PATH)
+
+        self.assertEqual(response.data, self._legacy_bytes(expected))
+
+    def test_detail_matches_orm_serialization(self) -> None:
+        """Each game should match jsonify over Game.to_dict."""
+        for game_id in (1, 2):
+            with self.app.app_context():
+                expected = db.session.get(Game, game_id).to_dict()
+
+            response = self.client.get(f'{self.GAMES_API_PATH}/{game_id}')
+
+            self.assertEqual(response.data, self._legacy_bytes(expected))
+
+if __name__ == '__main__':
+    unittest.main()
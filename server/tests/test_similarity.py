@@ -0,0 +1,120 @@
+import unittest
+from unittest import mock
+from flask import Flask
+from models import Game, Publisher, Category, db
+from routes.games import games_bp
+from utils import similarity
+from utils.similarity import get_similarity_index, similarity_supported
+from tests.helpers import get_test_database_uri
+
+@unittest.skipUnless(similarity_supported(), 'similar games need NumPy')
+class TestSimilarGames(unittest.TestCase):
+    """Tests for the similar games endpoint and its TF-IDF index."""
+
+    GAMES_API_PATH: str = '/api/games'
+
+    def setUp(self) -> None:
+        """Set up test database with games of overlapping themes"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = get_test_database_uri()
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        self.app.register_blueprint(games_bp)
+        self.client = self.app.test_client()
+        db.init_app(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+            db.session.add_all([
+                Publisher(name="DevGames Inc"), Publisher(name="Scrum Masters"),
+                Category(name="Strategy"), Category(name="Card Game"),
+            ])
+            db.session.flush()
+            games = [
+                ("Space Traders", "Trade cargo between distant planets and dodge space pirates", 1, 1, 4.0),
+                ("Cargo Runner", "Haul cargo between planets while space pirates give chase", 1, 1, 4.2),
+                ("Pirate Bay", "Sail the seas as pirates and plunder merchant ships", 2, 2, 3.0),
+                ("Sprint Planning", "Estimate stories with your team before the sprint starts", 2, 2, None),
+                ("Deploy Friday", "Ship releases to production and survive the weekend on call", 1, 2, 4.0),
+            ]
+            db.session.add_all([
+                Game(title=title, description=description, publisher_id=publisher_id,
+                     category_id=category_id, star_rating=star_rating)
+                for title, description, publisher_id, category_id, star_rating in games
+            ])
+            db.session.commit()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _similar(self, game_id: int, query: str = '') -> list[dict]:
+        """Helper returning the similar games listed for a game"""
+        response = self.client.get(f'{self.GAMES_API_PATH}/{game_id}/similar{query}')
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()['games']
+
+    def test_ranks_by_description_category_and_publisher(self) -> None:
+        """The game sharing words, category and publisher should rank first; the game itself never."""
+        games = self._similar(1)
+
+        self.assertEqual([game['id'] for game in games], [2, 5, 3, 4])
+        self.assertEqual(games[0]['title'], "Cargo Runner")
+        self.assertEqual(games[0]['category']['name'], "Strategy")
+        scores = [game['similarity'] for game in games]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertTrue(0 <= scores[-1] < scores[0] <= 1)
+
+    def test_limit(self) -> None:
+        """limit should cap the list, within 1 and MAX_SIMILAR_GAMES."""
+        self.assertEqual([game['id'] for game in self._similar(1, '?limit=2')], [2, 5])
+        self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/1/similar?limit=0').status_code, 400)
+        self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/1/similar?limit=51').status_code, 400)
+
+    def test_unknown_game(self) -> None:
+        """Asking for games similar to a missing game should return 404."""
+        self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/999/similar').status_code, 404)
+
+    def test_text_scores_match_dense_cosine(self) -> None:
+        """Sparse postings scoring should equal dense cosine similarity of the TF-IDF rows."""
+        import numpy as np
+        with self.app.app_context():
+            index = get_similarity_index()
+        dense = np.zeros((len(index), len(index.vocabulary)))
+        for row in range(len(index)):
+            start, stop = index.row_indptr[row], index.row_indptr[row + 1]
+            dense[row, index.term_ids[start:stop]] = index.weights[start:stop]
+
+        for row in range(len(index)):
+            np.testing.assert_allclose(index._text_scores(row), dense @ dense[row], atol=1e-12)
+        np.testing.assert_allclose(np.linalg.norm(dense, axis=1), 1.0)
+
+    def test_rebuild_only_tokenizes_changed_games(self) -> None:
+        """After a write only new or changed descriptions should be tokenized again."""
+        self._similar(1)
+        with self.app.app_context():
+            db.session.get(Game, 3).description = "Haul cargo between planets as space pirates"
+            db.session.add(Game(title="Quiet Farm", description="Grow crops in a calm valley",
+                                publisher_id=2, category_id=2))
+            db.session.delete(db.session.get(Game, 4))
+            db.session.commit()
+
+        with mock.patch('utils.similarity._tokenize', wraps=similarity._tokenize) as tokenize:
+            games = self._similar(1)
+
+        self.assertEqual(tokenize.call_count, 2)
+        ids = [game['id'] for game in games]
+        self.assertEqual(ids[:2], [2, 3])
+        self.assertNotIn(4, ids)
+        self.assertIn(6, ids)
+
+    def test_without_numpy(self) -> None:
+        """The endpoint should report 501 when NumPy is not installed."""
+        with mock.patch('routes.games.similarity_supported', return_value=False):
+            self.assertEqual(self.client.get(f'{self.GAMES_API_PATH}/1/similar').status_code, 501)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+from flask import Flask
+from sqlalchemy import select
+from models import Game, Publisher, Category, db, get_catalog_snapshot
+from tests import test_games
+from tests.helpers import count_queries, get_test_database_uri
+
+class TestCatalogSnapshot(unittest.TestCase):
+    """Tests for the in-memory catalog snapshot."""
+
+    def setUp(self) -> None:
+        """Set up test database with games out of title order"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = get_test_database_uri()
+        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        db.init_app(self.app)
+
+        with self.app.app_context():
+            db.create_all()
+            publisher = Publisher(name="DevGames Inc")
+            category = Category(name="Strategy")
+            for title in ["Zero Downtime", "Agile Adventures", "Merge Conflict Mayhem"]:
+                db.session.add(Game(
+                    title=title,
+                    description="A game about shipping software on time",
+                    publisher=publisher,
+                    category=category,
+                    star_rating=4.0,
+                ))
+            db.session.commit()
+
+    def tearDown(self) -> None:
+        """Clean up test database and ensure proper connection closure"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def test_records_match_model_serialization(self) -> None:
+        """Snapshot records should serialize exactly like the ORM models."""
+        with self.app.app_context():
+            snapshot = get_catalog_snapshot()
+            games = db.session.scalars(select(Game).order_by(Game.title, Game.id)).all()
+
+            self.assertEqual([record.to_dict() for record in snapshot.games], [game.to_dict() for game in games])
+
+    def test_records_share_entity_references(self) -> None:
+        """Games of one category should point at the same (id, name) pair."""
+        with self.app.app_context():
+            first, second, _ = get_catalog_snapshot().games
+
+        self.assertIs(first.category, second.category)
+        with self.assertRaises(AttributeError):
+            first.extra = True
+
+    def test_get_page_and_after(self) -> None:
+        """Lookups should follow (title, id) order like the SQL queries."""
+        with self.app.app_context():
+            snapshot = get_catalog_snapshot()
+
+        self.assertEqual(snapshot.get(1).title, "Zero Downtime")
+        self.assertIsNone(snapshot.get(999))
+        self.assertEqual([game.title for game in snapshot.page(1, 5)], ["Merge Conflict Mayhem", "Zero Downtime"])
+        self.assertEqual([game.title for game in snapshot.after(("Agile Adventures", 2), 1)], ["Merge Conflict Mayhem"])
+        self.assertEqual(len(snapshot.after(None, 10)), 3)
+
+    def test_reused_until_catalog_changes(self) -> None:
+        """The snapshot should be rebuilt only after a committed write."""
+        with self.app.app_context():
+            first = get_catalog_snapshot()
+            with count_queries(db.engine) as statements:
+                self.assertIs(get_catalog_snapshot(), first)
+            self.assertEqual(statements, [])
+
+            db.session.get(Game, 1).title = "Zero Downtime Deluxe"
+            db.session.commit()
+            second = get_catalog_snapshot()
+
+        self.assertIsNot(second, first)
+        self.assertEqual(second.get(1).title, "Zero Downtime Deluxe")
+        self.assertEqual(first.get(1).title, "Zero Downtime")
+
+class TestGamesRoutesFromSnapshot(test_games.TestGamesRoutes):
+    """Runs the games route tests with reads served from the snapshot."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.app.config['CATALOG_SNAPSHOT'] = True
+
+    @unittest.skip("the snapshot's total is its length, not a cached count")
+    def test_get_games_total_expires(self) -> None:
+        pass
+
+    @unittest.skip("the snapshot holds every column, so there is no SELECT to narrow")
+    def test_get_games_sparse_fields_skip_columns_and_joins(self) -> None:
+        pass
+
+    def test_warm_requests_run_no_queries(self) -> None:
+        """Once built, the snapshot should answer reads without SQL."""
+        self.app.config['RESPONSE_CACHE_ENABLED'] = False
+        self.client.get(self.GAMES_API_PATH)
+
+        with self.app.app_context():
+            with count_queries(db.engine) as statements:
+                self.client.get(self.GAMES_API_PATH)
+                self.client.get(f'{self.GAMES_API_PATH}?cursor=')
+                self.client.get(f'{self.GAMES_API_PATH}/1')
+
+        self.assertEqual(statements, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,410 @@
+import fcntl
+import hashlib
+import os
+import socket
+import struct
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from urllib.parse import unquote, urlsplit
+
+DEFAULT_CACHE_URL = 'memory://'
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_SHM_DIRECTORY = '/dev/shm/tailspin-cache'
+DEFAULT_REDIS_PORT = 6379
+# Seconds to wait on connect or on a reply before treating Redis as unavailable
+REDIS_SOCKET_TIMEOUT = 0.5
+# Seconds after a failed command during which commands fail at once, rather
+# than each waiting out the timeout on a server that is down or hung
+REDIS_RETRY_DELAY = 5.0
+
+def get_cache_url() -> str:
+    """
+    Returns the cache backend URL from CACHE_URL: `memory://` (per process,
+    the default), `shm:///dev/shm/<dir>` (shared by the workers on one host)
+    or `redis://[:password@]host[:port][/db]` (shared by every host).
+    """
+    return os.environ.get('CACHE_URL') or DEFAULT_CACHE_URL
+
+class CacheBackend(ABC):
+    """Byte-string key/value store used by the response cache."""
+
+    # True when other worker processes see the same keys
+    shared: bool = False
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """Returns the value stored under `key`, or None if absent or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Stores `value` under `key`, expiring after `ttl` seconds if given."""
+
+    @abstractmethod
+    def add(self, key: str, value: bytes) -> bool:
+        """Stores `value` only if `key` is absent. Returns whether it was stored."""
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Atomically increments the integer under `key` (0 if absent) and returns it."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes every key."""
+
+    def stats(self) -> dict[str, int]:
+        return {}
+
+class MemoryBackend(CacheBackend):
+    """
+    Thread-safe LRU in the current process, bounded by entry count and total
+    value size.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[float | None, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        if len(value) > self.max_bytes:
+            return
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._store(key, value, expires_at)
+
+    def add(self, key: str, value: bytes) -> bool:
+        with self._lock:
+            if key in self._entries:
+                return False
+            self._store(key, value, None)
+            return True
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            _, value = self._entries.get(key, (None, b'0'))
+            count = int(value) + 1
+            self._store(key, str(count).encode('ascii'), None)
+            return count
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {'evictions': self.evictions, 'entries': len(self._entries), 'bytes': self._bytes}
+
+    def _store(self, key: str, value: bytes, expires_at: float | None) -> None:
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (expires_at, value)
+        self._bytes += len(value)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        _, value = self._entries.pop(key)
+        self._bytes -= len(value)
+
+# Each file holds its expiry (Unix time, 0 for none) followed by the value
+_SHM_HEADER = struct.Struct('!d')
+# Expired and surplus entries are swept after this many writes
+_SHM_PRUNE_INTERVAL = 256
+
+class SharedMemoryBackend(CacheBackend):
+    """
+    Store shared by every worker on the host: one file per key in a
+    directory on tmpfs (/dev/shm), so reads and writes never touch disk.
+    Writes go to a temporary file that is renamed into place, so readers see
+    either the old or the new value; counters are updated under an flock.
+    """
+
+    shared = True
+
+    def __init__(self, directory: str = DEFAULT_SHM_DIRECTORY, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+        self._lock_path = os.path.join(directory, '.lock')
+        self._writes = 0
+        self.evictions = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest())
+
+    def _read(self, path: str) -> tuple[float, bytes] | None:
+        try:
+            with open(path, 'rb') as entry_file:
+                data = entry_file.read()
+        except FileNotFoundError:
+            return None
+        (expires_at,) = _SHM_HEADER.unpack_from(data)
+        return expires_at, data[_SHM_HEADER.size:]
+
+    def _write_temp(self, value: bytes, ttl: float | None) -> str:
+        expires_at = time.time() + ttl if ttl is not None else 0.0
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix='.tmp-')
+        with os.fdopen(fd, 'wb') as temp_file:
+            temp_file.write(_SHM_HEADER.pack(expires_at) + value)
+        return temp_path
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        entry = self._read(path)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at and expires_at < time.time():
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            return None
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        os.replace(self._write_temp(value, ttl), self._path(key))
+        self._writes += 1
+        if self._writes % _SHM_PRUNE_INTERVAL == 0:
+            self.prune()
+
+    def add(self, key: str, value: bytes) -> bool:
+        temp_path = self._write_temp(value, None)
+        try:
+            # link() fails if the target exists, unlike rename()
+            os.link(temp_path, self._path(key))
+            return True
+        except FileExistsError:
+            return False
+        finally:
+            os.unlink(temp_path)
+
+    def incr(self, key: str) -> int:
+        with open(self._lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                count = int(self.get(key) or 0) + 1
+                os.replace(self._write_temp(str(count).encode('ascii'), None), self._path(key))
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        return count
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            if not name.startswith('.'):
+                try:
+                    os.unlink(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    pass
+
+    def prune(self) -> None:
+        """Removes expired entries, then the oldest ones above `max_entries`."""
+        now = time.time()
+        expiring: list[tuple[float, str]] = []
+        for name in os.listdir(self.directory):
+            if name.startswith('.'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                entry = self._read(path)
+                modified = os.path.getmtime(path)
+            except FileNotFoundError:
+                continue
+            if entry is None or not entry[0]:
+                # Entries without a TTL (counters) are never evicted
+                continue
+            if entry[0] < now:
+                os.unlink(path)
+            else:
+                expiring.append((modified, path))
+
+        expiring.sort()
+        for _, path in expiring[:max(0, len(expiring) - self.max_entries)]:
+            try:
+                os.unlink(path)
+                self.evictions += 1
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> dict[str, int]:
+        entries = [entry for entry in os.scandir(self.directory) if not entry.name.startswith('.')]
+        return {
+            'evictions': self.evictions,
+            'entries': len(entries),
+            'bytes': sum(entry.stat().st_size - _SHM_HEADER.size for entry in entries),
+        }
+
+class RedisError(OSError):
+    """Raised when the Redis server replies with an error."""
+
+class RedisBackend(CacheBackend):
+    """
+    Store shared by every worker on every host, speaking the Redis protocol
+    (RESP) directly over a socket; any RESP-compatible server will do. Keys
+    are prefixed so the database can be shared with other applications.
+    """
+
+    shared = True
+
+    def __init__(self, host: str = 'localhost', port: int = DEFAULT_REDIS_PORT, db: int = 0,
+                 password: str | None = None, prefix: str = 'tailspin:') -> None:
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.prefix = prefix
+        # One connection per thread; a connection is never shared mid-command
+        self._local = threading.local()
+        # time.monotonic() before which commands fail without trying the server
+        self._retry_at = 0.0
+
+    @classmethod
+    def from_url(cls, url: str) -> 'RedisBackend':
+        parts = urlsplit(url)
+        path = parts.path.strip('/')
+        return cls(
+            host=parts.hostname or 'localhost',
+            port=parts.port or DEFAULT_REDIS_PORT,
+            db=int(path) if path else 0,
+            password=unquote(parts.password) if parts.password else None,
+        )
+
+    def _connect(self) -> socket.socket:
+        connection = socket.create_connection((self.host, self.port), timeout=REDIS_SOCKET_TIMEOUT)
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._local.connection = connection
+        self._local.reader = connection.makefile('rb')
+        if self.password:
+            self._call(b'AUTH', self.password)
+        if self.db:
+            self._call(b'SELECT', str(self.db))
+        return connection
+
+    def _call(self, *args: bytes | str) -> object:
+        parts = [arg.encode('utf-8') if isinstance(arg, str) else arg for arg in args]
+        payload = b''.join([b'*%d\r\n' % len(parts)] + [b'$%d\r\n%s\r\n' % (len(part), part) for part in parts])
+        self._local.connection.sendall(payload)
+        return self._read_reply()
+
+    def _read_reply(self) -> object:
+        line = self._local.reader.readline()
+        if not line.endswith(b'\r\n'):
+            raise ConnectionError("Connection closed by Redis server")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b'+':
+            return rest
+        if kind == b'-':
+            raise RedisError(rest.decode('utf-8', 'replace'))
+        if kind == b':':
+            return int(rest)
+        if kind == b'$':
+            length = int(rest)
+            if length < 0:
+                return None
+            data = self._local.reader.read(length + 2)
+            return data[:-2]
+        if kind == b'*':
+            length = int(rest)
+            return None if length < 0 else [self._read_reply() for _ in range(length)]
+        raise RedisError(f"Unexpected reply type {kind!r}")
+
+    def execute(self, *args: bytes | str) -> object:
+        """
+        Sends one command, reconnecting once if the connection was dropped.
+        After a failure, every command raises ConnectionError at once for
+        REDIS_RETRY_DELAY seconds, so an unreachable or unresponsive server
+        costs one timeout per delay instead of one per command.
+        """
+        if time.monotonic() < self._retry_at:
+            raise ConnectionError("Redis server unavailable; retrying shortly")
+        try:
+            reply = self._execute(*args)
+        except RedisError:
+            raise
+        except OSError:
+            # The reply stream may be out of step with the commands sent
+            self.close()
+            self._retry_at = time.monotonic() + REDIS_RETRY_DELAY
+            raise
+        self._retry_at = 0.0
+        return reply
+
+    def _execute(self, *args: bytes | str) -> object:
+        if getattr(self._local, 'connection', None) is None:
+            self._connect()
+        try:
+            return self._call(*args)
+        except (RedisError, TimeoutError):
+            # A server that does not answer would only be waited on again
+            raise
+        except OSError:
+            self.close()
+            self._connect()
+            return self._call(*args)
+
+    def close(self) -> None:
+        connection = getattr(self._local, 'connection', None)
+        self._local.connection = None
+        if connection is not None:
+            connection.close()
+
+    def get(self, key: str) -> bytes | None:
+        return self.execute(b'GET', self.prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        if ttl is None:
+            self.execute(b'SET', self.prefix + key, value)
+        else:
+            self.execute(b'SET', self.prefix + key, value, b'PX', str(max(1, int(ttl * 1000))))
+
+    def add(self, key: str, value: bytes) -> bool:
+        return self.execute(b'SET', self.prefix + key, value, b'NX') is not None
+
+    def incr(self, key: str) -> int:
+        return self.execute(b'INCR', self.prefix + key)
+
+    def clear(self) -> None:
+        cursor = b'0'
+        while True:
+            cursor, keys = self.execute(b'SCAN', cursor, b'MATCH', self.prefix + '*', b'COUNT', b'1000')
+            if keys:
+                self.execute(b'DEL', *keys)
+            if cursor == b'0':
+                break
+
+def create_cache_backend(url: str, max_entries: int = DEFAULT_MAX_ENTRIES,
+                         max_bytes: int = DEFAULT_MAX_BYTES) -> CacheBackend:
+    """
+    Creates the backend for a cache URL (see `get_cache_url`).
+
+    Raises ValueError for an unsupported scheme.
+    """
+    scheme = urlsplit(url).scheme
+    if scheme == 'memory':
+        return MemoryBackend(max_entries=max_entries, max_bytes=max_bytes)
+    if scheme == 'shm':
+        return SharedMemoryBackend(urlsplit(url).path or DEFAULT_SHM_DIRECTORY, max_entries=max_entries)
+    if scheme == 'redis':
+        return RedisBackend.from_url(url)
+    raise ValueError(f"Unsupported cache URL scheme: {scheme!r}")
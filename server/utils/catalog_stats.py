@@ -0,0 +1,75 @@
+from typing import Any
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import InstrumentedAttribute
+from models import db, Game, Category, Publisher
+from utils.database import get_read_bind_arguments
+
+# Number of highest-rated games listed per category or publisher
+TOP_GAMES_PER_ENTITY = 3
+
+def get_entity_summaries(
+    model: type[Category] | type[Publisher],
+    fk_column: InstrumentedAttribute[int],
+    entity_id: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Serializes categories or publishers with their game count, average star
+    rating and top-rated games.
+
+    Uses one grouped aggregate for the counts and averages plus one windowed
+    query for the top games, however many entities are returned.
+    """
+    summary_stmt = get_entity_summary_stmt(model, fk_column, entity_id)
+    rows = db.session.execute(summary_stmt, bind_arguments=get_read_bind_arguments()).all()
+    if not rows:
+        return []
+
+    top_games: dict[int, list[dict[str, Any]]] = {}
+    top_games_stmt = get_top_games_stmt(fk_column, entity_id)
+    for row in db.session.execute(top_games_stmt, bind_arguments=get_read_bind_arguments()):
+        top_games.setdefault(row.entity_id, []).append({
+            'id': row.id,
+            'title': row.title,
+            'starRating': row.star_rating,
+        })
+
+    summaries = []
+    for entity, game_count, average_rating in rows:
+        summary = entity.to_dict(game_count=game_count)
+        summary['average_rating'] = round(average_rating, 2) if average_rating is not None else None
+        summary['top_games'] = top_games.get(entity.id, [])
+        summaries.append(summary)
+    return summaries
+
+def get_entity_summary_stmt(
+    model: type[Category] | type[Publisher],
+    fk_column: InstrumentedAttribute[int],
+    entity_id: int | None = None,
+) -> Select:
+    """Game count and average rating per entity, one row per entity."""
+    stmt = (
+        select(model, func.count(Game.id), func.avg(Game.star_rating))
+        .join(Game, fk_column == model.id, isouter=True)
+        .group_by(model.id)
+        .order_by(model.name.asc())
+    )
+    if entity_id is not None:
+        stmt = stmt.where(model.id == entity_id)
+    return stmt
+
+def get_top_games_stmt(fk_column: InstrumentedAttribute[int], entity_id: int | None = None) -> Select:
+    """Top-rated games per entity, ranked within each (fk, star_rating) index range."""
+    rank = func.row_number().over(
+        partition_by=fk_column,
+        order_by=(Game.star_rating.desc().nulls_last(), Game.title.asc()),
+    ).label('rank')
+    ranked = select(fk_column.label('entity_id'), Game.id, Game.title, Game.star_rating, rank)
+    if entity_id is not None:
+        ranked = ranked.where(fk_column == entity_id)
+    ranked = ranked.subquery()
+
+    return (
+        select(ranked.c.entity_id, ranked.c.id, ranked.c.title, ranked.c.star_rating)
+        .where(ranked.c.rank <= TOP_GAMES_PER_ENTITY)
+        .order_by(ranked.c.entity_id, ranked.c.rank)
+    )
@@ -0,0 +1,102 @@
+import gzip
+import zlib
+from typing import Iterable, Iterator
+from flask import Flask, Response, current_app, request
+
+try:
+    import brotli
+except ImportError:  # optional; gzip is offered on its own without it
+    brotli = None
+
+# Content codings this server can produce, in order of preference
+CONTENT_CODINGS = ('br', 'gzip')
+
+# Bodies smaller than this go out as they are: below about one packet the
+# coding overhead and CPU cost outweigh the bytes saved
+DEFAULT_MIN_SIZE = 1024
+
+# Middle levels: most of the size reduction of the maximum at a fraction of
+# the CPU time
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+_COMPRESSIBLE_MIMETYPES = frozenset({
+    'application/json',
+    'application/x-ndjson',
+    'application/javascript',
+    'image/svg+xml',
+})
+
+def _available_codings() -> tuple[str, ...]:
+    return CONTENT_CODINGS if brotli is not None else ('gzip',)
+
+def is_compressible(response: Response) -> bool:
+    return response.mimetype.startswith('text/') or response.mimetype in _COMPRESSIBLE_MIMETYPES
+
+def negotiate_encoding() -> str | None:
+    """
+    The content coding to send this request, from its Accept-Encoding
+    (honouring q-values), or None for the identity coding.
+    """
+    if not current_app.config.get('COMPRESSION_ENABLED', True):
+        return None
+    return request.accept_encodings.best_match(_available_codings())
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    # mtime=0 keeps the output a pure function of the input
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+def compress_chunks(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    """Compresses a stream of chunks as one body, chunk by chunk."""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        for chunk in chunks:
+            compressed = compressor.process(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.finish()
+        return
+
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+def compress_response(response: Response, encoding: str | None) -> Response:
+    """
+    Compresses a complete response body with `encoding` if it is worth it:
+    a successful, compressible, not yet encoded body of at least
+    COMPRESSION_MIN_SIZE bytes. Marks every compressible response as varying
+    by Accept-Encoding either way.
+    """
+    if (response.status_code != 200 or response.is_streamed or response.direct_passthrough
+            or response.content_encoding or not is_compressible(response)):
+        return response
+    response.vary.add('Accept-Encoding')
+    if encoding is None:
+        return response
+
+    body = response.get_data()
+    if len(body) < current_app.config.get('COMPRESSION_MIN_SIZE', DEFAULT_MIN_SIZE):
+        return response
+    response.set_data(compress(body, encoding))
+    response.content_encoding = encoding
+    # A strong validator names one representation; give the coded one its own
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(f'{etag}-{encoding}')
+    return response
+
+def init_compression(app: Flask) -> None:
+    """
+    Compresses the app's responses for clients that accept it. Cached
+    catalog responses arrive here already compressed (`cached_response`
+    stores each coding once), so this only compresses the rest.
+    """
+    @app.after_request
+    def _compress(response: Response) -> Response:
+        return compress_response(response, negotiate_encoding())
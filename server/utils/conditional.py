@@ -0,0 +1,105 @@
+import hashlib
+from functools import wraps
+from typing import Any, Callable
+from flask import Response, current_app, make_response, request
+from werkzeug.datastructures import ETags
+from models import get_catalog_last_modified, get_catalog_token
+from utils.compression import CONTENT_CODINGS
+
+def _catalog_etag() -> str:
+    """Strong validator for this URL at the current catalog version."""
+    key = f'{get_catalog_token()}:{request.full_path}'.encode('utf-8')
+    return hashlib.blake2b(key, digest_size=12).hexdigest()
+
+def _encoded_etag(etag: str, content_encoding: str | None) -> str:
+    # Each content coding is a different representation, so it needs its own
+    # strong validator
+    return f'{etag}-{content_encoding}' if content_encoding else etag
+
+def game_etag(game_id: int, version: int) -> str:
+    """Strong validator for one game at its row version."""
+    return f'game-{game_id}-v{version}'
+
+def _matches_any_coding(etags: ETags, etag: str, weak: bool = True) -> bool:
+    contains = etags.contains_weak if weak else etags.contains
+    return any(contains(_encoded_etag(etag, coding)) for coding in (None, *CONTENT_CODINGS))
+
+def if_match_fails(etag: str) -> bool:
+    """
+    Whether the request's If-Match rules out the current `etag`, meaning the
+    client's copy is stale. Requests without If-Match always proceed. The
+    ETag of any content coding of the current representation matches.
+    """
+    return bool(request.if_match) and not _matches_any_coding(request.if_match, etag, weak=False)
+
+def _is_not_modified(etag: str, last_modified: Any) -> bool:
+    # If-None-Match takes precedence; If-Modified-Since only applies without it
+    if request.if_none_match:
+        return _matches_any_coding(request.if_none_match, etag)
+    if request.if_modified_since is not None and last_modified is not None:
+        return last_modified <= request.if_modified_since
+    return False
+
+def _set_validators(response: Response, etag: str, last_modified: Any) -> Response:
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    # Caches may store the response but must revalidate it on every use
+    response.cache_control.no_cache = True
+    return response
+
+def catalog_conditional(view: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Makes a catalog GET endpoint answer conditional requests. The ETag and
+    Last-Modified come from the catalog version, so a matching If-None-Match
+    or If-Modified-Since gets a 304 before the view (and the ORM) runs. If
+    the catalog version cannot be read, the request is answered in full.
+    """
+    @wraps(view)
+    def wrapper(*args: Any, **kwargs: Any) -> Response:
+        try:
+            etag = _catalog_etag()
+            last_modified = get_catalog_last_modified()
+        except OSError:
+            # The shared catalog version is unreachable: answer in full,
+            # without validators a later request could not check
+            return make_response(view(*args, **kwargs))
+        if _is_not_modified(etag, last_modified):
+            return _set_validators(current_app.response_class(status=304), etag, last_modified)
+
+        response = make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            _set_validators(response, _encoded_etag(etag, response.content_encoding), last_modified)
+        return response
+
+    return wrapper
+
+def game_conditional(view: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Makes the game detail endpoint answer If-None-Match against the ETag
+    the view sets from the game's row version, the same validator writes
+    check If-Match against. Unlike catalog ETags it only changes when this
+    game does. The view still runs (usually a response cache or snapshot
+    hit), since only it knows the version. Last-Modified and
+    If-Modified-Since use the catalog's last write, as catalog endpoints do.
+    """
+    @wraps(view)
+    def wrapper(*args: Any, **kwargs: Any) -> Response:
+        # Read before the view, so a write that lands meanwhile is not missed
+        try:
+            last_modified = get_catalog_last_modified()
+        except OSError:
+            last_modified = None
+        response = make_response(view(*args, **kwargs))
+        etag, _ = response.get_etag()
+        if response.status_code != 200 or etag is None:
+            return response
+        if response.content_encoding:
+            etag = etag.removesuffix(f'-{response.content_encoding}')
+
+        if _is_not_modified(etag, last_modified):
+            return _set_validators(current_app.response_class(status=304), etag, last_modified)
+        response.last_modified = last_modified
+        response.cache_control.no_cache = True
+        return response
+
+    return wrapper
@@ -0,0 +1,40 @@
+import time
+from typing import Callable, Hashable
+from flask import current_app
+from models import get_catalog_version
+
+# Upper bound on distinct cached counts (one per filter combination)
+MAX_CACHED_COUNTS = 1024
+
+# Seconds a count is reused even if no write was seen: with the default
+# in-process catalog version, writes made by other workers or processes (or
+# landing on a lagging replica) never bump this worker's version
+DEFAULT_TTL_SECONDS = 30.0
+
+_EXTENSION_KEY = 'count_cache'
+
+def get_cached_count(key: Hashable, compute: Callable[[], int]) -> int:
+    """
+    Returns the count stored under `key`, calling `compute` only when no count
+    has been cached since the catalog version last changed, or the cached one
+    is older than `COUNT_CACHE_TTL` seconds.
+    """
+    counts: dict[Hashable, tuple[int, float, int]] = current_app.extensions.setdefault(_EXTENSION_KEY, {})
+    # Read the version before computing, so a write that lands mid-query
+    # leaves the stored entry already stale
+    try:
+        version = get_catalog_version()
+    except OSError:
+        # A shared catalog version is unreachable: count without caching
+        return compute()
+    now = time.monotonic()
+
+    cached = counts.get(key)
+    if cached is not None and cached[0] == version and cached[1] > now:
+        return cached[2]
+
+    count = compute()
+    if len(counts) >= MAX_CACHED_COUNTS:
+        counts.clear()
+    counts[key] = (version, now + current_app.config.get('COUNT_CACHE_TTL', DEFAULT_TTL_SECONDS), count)
+    return count
@@ -1,16 +1,137 @@
 import os
+from typing import Any
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from models import db
+
+# Connection-level SQLite settings applied to every new connection. WAL lets
+# readers proceed while a writer commits; synchronous=NORMAL is durable in WAL
+# mode except for the last transactions on power loss; cache_size is negative
+# to express KiB (64 MiB); mmap_size is in bytes (256 MiB).
+SQLITE_PRAGMA_DEFAULTS: dict[str, str | int] = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'cache_size': -65536,
+    'mmap_size': 268435456,
+    'temp_store': 'MEMORY',
+}
+
+# Connections kept per process. Gunicorn sync workers serve one request at a
+# time, so a small pool is enough; raise it for threaded workers.
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+# Seconds before a pooled connection is replaced (server-based databases only)
+DEFAULT_POOL_RECYCLE = 1800
+
+# Flask-SQLAlchemy bind key for the optional read-only replica
+REPLICA_BIND_KEY = 'replica'
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.environ.get(name, '').strip().lower()
+    if not value:
+        return default
+    return value in {'1', 'true', 'yes', 'on'}
 
 def get_connection_string() -> str:
     """
-    Returns the connection string for the database.
+    Returns the connection string for the database: DATABASE_URL when set,
+    otherwise the SQLite file under data/.
     """
+    if database_url := os.environ.get('DATABASE_URL'):
+        return database_url
+
     # Get the server directory
     server_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     # Go up one level to project root, then into data folder
     project_root = os.path.dirname(server_dir)
     data_dir = os.path.join(project_root, "data")
-    
+
     # Create the data directory if it doesn't exist
     os.makedirs(data_dir, exist_ok=True)
-    
-    return f'sqlite:///{os.path.join(data_dir, "tailspin-toys.db")}'
\ No newline at end of file
+
+    return f'sqlite:///{os.path.join(data_dir, "tailspin-toys.db")}'
+
+def get_replica_connection_string() -> str | None:
+    """
+    Returns the connection string for the read-only replica (DATABASE_REPLICA_URL),
+    or None when listing reads should go to the primary.
+    """
+    return os.environ.get('DATABASE_REPLICA_URL') or None
+
+def get_catalog_snapshot_enabled() -> bool:
+    """
+    Returns whether game reads are served from the in-memory catalog snapshot
+    (CATALOG_SNAPSHOT) instead of querying the database.
+    """
+    return _env_flag('CATALOG_SNAPSHOT', default=False)
+
+def get_sqlite_pragmas() -> dict[str, str | int]:
+    """
+    Returns the SQLite PRAGMAs to apply, with each default overridable by an
+    environment variable named SQLITE_<PRAGMA> (e.g. SQLITE_CACHE_SIZE).
+    """
+    return {
+        name: os.environ.get(f'SQLITE_{name.upper()}', default)
+        for name, default in SQLITE_PRAGMA_DEFAULTS.items()
+    }
+
+def get_engine_options(database_uri: str) -> dict[str, Any]:
+    """
+    Returns SQLAlchemy engine options for the given database URI, read from
+    DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE, DB_POOL_PRE_PING and
+    DB_STATEMENT_TIMEOUT_MS.
+    """
+    url = make_url(database_uri)
+    backend = url.get_backend_name()
+    # In-memory SQLite uses a single shared connection; pool sizing does not apply
+    if backend == 'sqlite' and url.database in (None, '', ':memory:'):
+        return {}
+
+    options: dict[str, Any] = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', DEFAULT_POOL_SIZE)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', DEFAULT_MAX_OVERFLOW)),
+    }
+    if backend == 'sqlite':
+        # Local files cannot drop connections, so no liveness checks are needed
+        return options
+
+    options['pool_pre_ping'] = _env_flag('DB_POOL_PRE_PING', default=True)
+    options['pool_recycle'] = int(os.environ.get('DB_POOL_RECYCLE', DEFAULT_POOL_RECYCLE))
+    statement_timeout = os.environ.get('DB_STATEMENT_TIMEOUT_MS')
+    if statement_timeout and backend == 'postgresql':
+        options['connect_args'] = {'options': f'-c statement_timeout={int(statement_timeout)}'}
+    return options
+
+def get_binds(replica_uri: str | None) -> dict[str, Any]:
+    """
+    Returns SQLALCHEMY_BINDS registering the read-only replica, if configured.
+    """
+    if not replica_uri:
+        return {}
+    return {REPLICA_BIND_KEY: {'url': replica_uri, **get_engine_options(replica_uri)}}
+
+def get_read_bind_arguments() -> dict[str, Any]:
+    """
+    Returns `bind_arguments` that route a read-only statement to the replica
+    when one is configured, and to the primary otherwise.
+    """
+    engine = db.engines.get(REPLICA_BIND_KEY)
+    return {'bind': engine} if engine is not None else {}
+
+def configure_sqlite_engine(engine: Engine, pragmas: dict[str, str | int]) -> None:
+    """
+    Applies `pragmas` to every new connection the engine opens. Does nothing
+    for non-SQLite engines.
+    """
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return
+
+    @event.listens_for(engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f'PRAGMA {name}={value}')
+        finally:
+            cursor.close()
@@ -0,0 +1,33 @@
+import csv
+import io
+from typing import Iterable, Iterator, Sequence
+from models import GameRecord
+from utils.serialization import dumps_json
+
+# Media type of each export format
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+CSV_HEADER = ('id', 'title', 'description', 'publisherId', 'publisher', 'categoryId', 'category', 'starRating')
+
+def ndjson_chunks(batches: Iterable[Sequence[GameRecord]]) -> Iterator[bytes]:
+    """One JSON object per line, in the same shape as GET /api/games/<id>; one chunk per batch."""
+    for batch in batches:
+        yield b''.join(dumps_json(game.to_dict(), floats=[game.star_rating]) + b'\n' for game in batch)
+
+def csv_chunks(batches: Iterable[Sequence[GameRecord]]) -> Iterator[bytes]:
+    """A header row, then one row per game; one chunk per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+    for batch in batches:
+        for game in batch:
+            publisher_id, publisher = game.publisher or (None, None)
+            category_id, category = game.category or (None, None)
+            writer.writerow((game.id, game.title, game.description, publisher_id, publisher,
+                             category_id, category, game.star_rating))
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
@@ -0,0 +1,149 @@
+import math
+from typing import Any, Iterable, Mapping, NamedTuple
+from sqlalchemy import Connection, Engine, Insert, case, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from models import db, Category, Game, Publisher
+from models.base import BaseModel
+
+# Rows one bulk upsert request may carry
+MAX_BULK_ROWS = 5_000
+
+# Rows sent to the database per executemany batch within the one transaction
+UPSERT_BATCH_SIZE = 1_000
+
+MAX_STAR_RATING = 5.0
+
+# Columns a bulk upsert overwrites when the title already exists; the rating
+# only changes if the row carries one (see get_upsert_stmt)
+_UPSERT_COLUMNS = ('description', 'category_id', 'publisher_id')
+
+class GameInput(NamedTuple):
+    """A validated game write, naming its category and publisher."""
+    title: str
+    description: str
+    category: str
+    publisher: str
+    star_rating: float | None
+
+class ResolvedGames(NamedTuple):
+    rows: list[dict[str, Any]]
+    errors: list[dict[str, Any]]
+
+def parse_game_input(data: Any) -> GameInput:
+    """
+    Validates one game from a request body: `title`, `description`,
+    `category` and `publisher` (names) and an optional `starRating`, using
+    the same rules as the model validators.
+
+    Raises ValueError describing the first problem found.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Game must be a JSON object")
+
+    title = data.get('title')
+    description = data.get('description')
+    BaseModel.validate_string_length('Game title', title, min_length=2)
+    BaseModel.validate_string_length('Description', description, min_length=10)
+    category = data.get('category')
+    publisher = data.get('publisher')
+    BaseModel.validate_string_length('Category name', category, min_length=2)
+    BaseModel.validate_string_length('Publisher name', publisher, min_length=2)
+
+    star_rating = data.get('starRating')
+    if star_rating is not None:
+        if isinstance(star_rating, bool) or not isinstance(star_rating, (int, float)):
+            raise ValueError("starRating must be a number")
+        if not (math.isfinite(star_rating) and 0 <= star_rating <= MAX_STAR_RATING):
+            raise ValueError(f"starRating must be between 0 and {MAX_STAR_RATING:g}")
+        star_rating = float(star_rating)
+
+    return GameInput(title, description, category, publisher, star_rating)
+
+def get_entity_ids(model: type[Category] | type[Publisher], names: Iterable[str]) -> dict[str, int]:
+    """Ids of the named categories or publishers that exist, in one query."""
+    names = set(names)
+    if not names:
+        return {}
+    return dict(db.session.execute(select(model.name, model.id).where(model.name.in_(names))).all())
+
+def resolve_game_inputs(games: Mapping[int, GameInput]) -> ResolvedGames:
+    """
+    Turns validated inputs, keyed by their index in the request, into
+    `games` rows, resolving every category and publisher name with one query
+    per table. Inputs naming an unknown category or publisher are reported in
+    `errors` by their index.
+    """
+    categories = get_entity_ids(Category, (game.category for game in games.values()))
+    publishers = get_entity_ids(Publisher, (game.publisher for game in games.values()))
+
+    rows: list[dict[str, Any]] = []
+    errors: list[dict[str, Any]] = []
+    for index, game in games.items():
+        if game.category not in categories:
+            errors.append({'index': index, 'error': f"Unknown category: {game.category}"})
+        elif game.publisher not in publishers:
+            errors.append({'index': index, 'error': f"Unknown publisher: {game.publisher}"})
+        else:
+            rows.append({
+                'title': game.title,
+                'description': game.description,
+                'category_id': categories[game.category],
+                'publisher_id': publishers[game.publisher],
+                'star_rating': game.star_rating,
+            })
+    return ResolvedGames(rows, errors)
+
+def get_rating_values(star_rating: float | None) -> dict[str, Any]:
+    """
+    Column values that set a game's rating explicitly. Its rating votes keep
+    their count but are rescaled to average `star_rating`, so the next rating
+    flush carries on from it instead of overwriting it. None clears the votes
+    too, leaving the game unrated.
+    """
+    if star_rating is None:
+        return {'star_rating': None, 'rating_sum': 0.0, 'rating_count': 0}
+    return {'star_rating': star_rating, 'rating_sum': Game.rating_count * star_rating}
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE, and their insert constructs
+_UPSERT_INSERTS = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+
+def upsert_supported(bind: Connection | Engine) -> bool:
+    """Bulk upserts need INSERT ... ON CONFLICT DO UPDATE (SQLite or PostgreSQL)."""
+    return bind.dialect.name in _UPSERT_INSERTS
+
+def get_upsert_stmt() -> Insert:
+    """
+    INSERT of games rows that updates the existing game instead when the
+    title is already taken (ON CONFLICT on ux_games_title). An existing
+    game keeps its rating unless the row has one, which rescales its votes
+    as get_rating_values does. Check upsert_supported first.
+    """
+    stmt = _UPSERT_INSERTS[db.session.get_bind().dialect.name](Game)
+    star_rating = stmt.excluded.star_rating
+    return stmt.on_conflict_do_update(
+        index_elements=[Game.title],
+        set_={
+            **{column: stmt.excluded[column] for column in _UPSERT_COLUMNS},
+            'star_rating': func.coalesce(star_rating, Game.star_rating),
+            'rating_sum': case((star_rating.is_(None), Game.rating_sum), else_=Game.rating_count * star_rating),
+            # Updated games get a new version, so ETags held by clients go stale
+            'version': Game.version + 1,
+        },
+    )
+
+def upsert_games(rows: list[dict[str, Any]]) -> dict[str, int]:
+    """
+    Inserts or updates (by title) every row in the current transaction, in
+    executemany batches. Returns how many games were created and updated.
+    The caller commits.
+    """
+    titles = [row['title'] for row in rows]
+    existing: set[str] = set()
+    for start in range(0, len(titles), UPSERT_BATCH_SIZE):
+        batch = titles[start:start + UPSERT_BATCH_SIZE]
+        existing.update(db.session.scalars(select(Game.title).where(Game.title.in_(batch))))
+
+    stmt = get_upsert_stmt()
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        db.session.execute(stmt, rows[start:start + UPSERT_BATCH_SIZE])
+    return {'created': len(rows) - len(existing), 'updated': len(existing)}
@@ -0,0 +1,22 @@
+# Range of a database INTEGER (signed 64-bit), which primary keys are on
+# every backend; drivers refuse to bind anything outside it
+MIN_INTEGER = -2**63
+MAX_INTEGER = 2**63 - 1
+
+def in_integer_range(value: int) -> bool:
+    return MIN_INTEGER <= value <= MAX_INTEGER
+
+def parse_id(value: str, name: str = 'id') -> int:
+    """
+    Reads a database id from request text.
+
+    Raises ValueError naming the offending value if it is not an integer or
+    does not fit a database INTEGER.
+    """
+    try:
+        id = int(value)
+    except ValueError:
+        raise ValueError(f"Invalid {name}: {value}") from None
+    if not in_integer_range(id):
+        raise ValueError(f"Invalid {name}: {value}")
+    return id
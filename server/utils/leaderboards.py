@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import ColumnElement, Select
+from models import Game, get_game_rows_stmt
+
+LEADERBOARDS = ('top-rated', 'trending')
+DEFAULT_LEADERBOARD_SIZE = 10
+MAX_LEADERBOARD_SIZE = 100
+
+# A vote counts twice as much in trending scores as one cast a half-life
+# earlier. Scores only ever grow, by 2**(time since the epoch / half-life)
+# per vote, yet rank like exponentially decayed vote counts without
+# rewriting every row as time passes. Floats overflow after about 1,000
+# half-lives (roughly 19 years), long before which the epoch can move.
+TRENDING_HALF_LIFE = timedelta(days=7)
+TRENDING_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+def trending_weight(now: datetime | None = None) -> float:
+    """What one vote cast at `now` adds to its game's trending score."""
+    now = now or datetime.now(timezone.utc)
+    return 2.0 ** ((now - TRENDING_EPOCH) / TRENDING_HALF_LIFE)
+
+def _score(board: str) -> tuple[ColumnElement[float], ColumnElement[bool]]:
+    if board == 'trending':
+        return Game.trending_score, Game.trending_score > 0
+    return Game.star_rating, Game.star_rating.is_not(None)
+
+def get_leaderboard_stmt(board: str, limit: int, category_id: int | None = None) -> Select:
+    """
+    The `limit` best games on a leaderboard, overall or in one category. The
+    score indexes (per category: category_id first) keep every board sorted
+    as games are written, so this reads `limit` index entries rather than
+    sorting the catalog.
+    """
+    score, has_score = _score(board)
+    stmt = get_game_rows_stmt().where(has_score)
+    if category_id is not None:
+        stmt = stmt.where(Game.category_id == category_id)
+    return stmt.order_by(score.desc(), Game.id.desc()).limit(limit)
@@ -0,0 +1,110 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateColumn, CreateTable
+from models import db
+
+def create_missing_columns() -> list[str]:
+    """
+    Adds every column declared on the models that an existing table lacks.
+
+    `db.create_all()` never alters existing tables, so databases created
+    before a column was declared need this step. Columns added this way must
+    be nullable or have a server default. Safe to run repeatedly. Returns the
+    added columns as `table.column`.
+    """
+    inspector = inspect(db.engine)
+    added = []
+    with db.engine.begin() as connection:
+        preparer = connection.dialect.identifier_preparer
+        for table in db.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    definition = CreateColumn(column).compile(dialect=connection.dialect)
+                    connection.execute(text(f'ALTER TABLE {preparer.format_table(table)} ADD COLUMN {definition}'))
+                    added.append(f'{table.name}.{column.name}')
+    return added
+
+def create_missing_indexes() -> list[str]:
+    """
+    Creates every index declared on the models that the database lacks.
+
+    `db.create_all()` only creates indexes together with new tables, so
+    databases created before an index was declared need this step. Safe to
+    run repeatedly. Returns the names of the indexes created.
+    """
+    inspector = inspect(db.engine)
+    created = []
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            if index.name not in existing:
+                index.create(bind=db.engine)
+                created.append(index.name)
+    return created
+
+# Indexes earlier releases declared that are now redundant, per table
+OBSOLETE_INDEXES: dict[str, tuple[str, ...]] = {
+    # Duplicated ux_games_title, whose entries already end with the rowid
+    'games': ('ix_games_title_id',),
+}
+
+def drop_obsolete_indexes() -> list[str]:
+    """
+    Drops the OBSOLETE_INDEXES an existing database still has, so writes
+    stop maintaining them. Safe to run repeatedly. Returns the names of the
+    indexes dropped.
+    """
+    inspector = inspect(db.engine)
+    dropped = []
+    with db.engine.begin() as connection:
+        preparer = connection.dialect.identifier_preparer
+        for table_name, index_names in OBSOLETE_INDEXES.items():
+            if not inspector.has_table(table_name):
+                continue
+            existing = {index['name'] for index in inspector.get_indexes(table_name)}
+            for index_name in index_names:
+                if index_name in existing:
+                    connection.execute(text(f'DROP INDEX {preparer.quote(index_name)}'))
+                    dropped.append(index_name)
+    return dropped
+
+def rebuild_autoincrement_tables() -> list[str]:
+    """
+    Rebuilds the SQLite tables declared with `sqlite_autoincrement` that an
+    existing database created without AUTOINCREMENT, copying their rows.
+
+    Without it SQLite gives the id of a deleted last row to the next
+    insert. SQLite cannot add AUTOINCREMENT in place, so the table is
+    recreated, filled and renamed in one transaction. Its indexes and
+    triggers go with the old table: run create_missing_indexes and
+    create_search_index afterwards. Safe to run repeatedly; does nothing on
+    other databases. Returns the names of the tables rebuilt.
+    """
+    if db.engine.dialect.name != 'sqlite':
+        return []
+    rebuilt = []
+    with db.engine.begin() as connection:
+        preparer = connection.dialect.identifier_preparer
+        for table in db.metadata.sorted_tables:
+            if not table.dialect_options['sqlite']['autoincrement']:
+                continue
+            create_sql = connection.execute(
+                text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"), {'name': table.name}
+            ).scalar()
+            if create_sql is None or 'AUTOINCREMENT' in create_sql.upper():
+                continue
+
+            name = preparer.format_table(table)
+            rebuild_name = preparer.quote(f'{table.name}_rebuild')
+            create = str(CreateTable(table).compile(dialect=connection.dialect)).strip()
+            connection.exec_driver_sql(create.replace(f'CREATE TABLE {name} ', f'CREATE TABLE {rebuild_name} ', 1))
+            columns = ', '.join(preparer.quote(column.name) for column in table.columns)
+            connection.exec_driver_sql(f'INSERT INTO {rebuild_name} ({columns}) SELECT {columns} FROM {name}')
+            connection.exec_driver_sql(f'DROP TABLE {name}')
+            connection.exec_driver_sql(f'ALTER TABLE {rebuild_name} RENAME TO {name}')
+            rebuilt.append(table.name)
+    return rebuilt
@@ -0,0 +1,30 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+def encode_cursor(values: list[Any]) -> str:
+    """
+    Encodes the sort-key values of the last row on a page into an opaque,
+    URL-safe cursor string.
+    """
+    payload = json.dumps(values, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: str, length: int) -> list[Any]:
+    """
+    Decodes a cursor produced by `encode_cursor`.
+
+    Raises ValueError if the cursor is malformed or does not hold exactly
+    `length` values.
+    """
+    padded = cursor + '=' * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+    if not isinstance(values, list) or len(values) != length:
+        raise ValueError("Invalid cursor")
+
+    return values
@@ -0,0 +1,214 @@
+import atexit
+import math
+import threading
+import time
+from typing import Any
+from flask import Flask, current_app
+from sqlalchemy import Update, bindparam, update
+from models import DEFER_CATALOG_BUMP, db, Game, bump_catalog_version
+from utils.leaderboards import trending_weight
+
+_EXTENSION_KEY = 'rating_queue'
+
+# Votes pending before the flush thread is woken early
+DEFAULT_MAX_PENDING = 1_000
+
+# Seconds a vote may wait before it is written
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+# Least seconds between the catalog version bumps flushes cause. Every bump
+# drops the response cache, cached counts and catalog ETags and rebuilds the
+# snapshot and similarity index, so under steady voting cached reads may
+# show ratings up to this old
+DEFAULT_BUMP_INTERVAL = 10.0
+
+MIN_VOTE = 1.0
+MAX_VOTE = 5.0
+
+def get_rating_flush_stmt() -> Update:
+    """
+    Adds a batch of per-game vote totals to `rating_sum` and `rating_count`
+    and recomputes `star_rating` as their running average, for executemany
+    with `game_id`, `vote_sum`, `vote_count` and `trending_weight`
+    parameters. Bumps the row version, since the game's representation
+    changes. The catalog version is left to the queue, which coalesces the
+    bumps of many flushes.
+    """
+    table = Game.__table__
+    vote_sum = bindparam('vote_sum')
+    vote_count = bindparam('vote_count')
+    return (
+        update(table)
+        .where(table.c.id == bindparam('game_id'))
+        .values(
+            rating_sum=table.c.rating_sum + vote_sum,
+            rating_count=table.c.rating_count + vote_count,
+            star_rating=(table.c.rating_sum + vote_sum) / (table.c.rating_count + vote_count),
+            trending_score=table.c.trending_score + vote_count * bindparam('trending_weight'),
+            version=table.c.version + 1,
+        )
+        .execution_options(**{DEFER_CATALOG_BUMP: True})
+    )
+
+class RatingQueue:
+    """
+    Write-behind buffer for rating votes. Votes are folded into a running
+    (sum, count) per game in memory and written by a background thread in
+    one transaction per flush, every `flush_interval` seconds or as soon as
+    `max_pending` votes are waiting, so each hot game costs one UPDATE per
+    flush rather than one per vote. `stop()` writes whatever is left.
+
+    Flushes bump the catalog version at most once every `bump_interval`
+    seconds: a flush soon after the last bump leaves it pending, and the
+    thread makes it once the interval has passed.
+    """
+
+    def __init__(self, app: Flask, max_pending: int = DEFAULT_MAX_PENDING,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 bump_interval: float = DEFAULT_BUMP_INTERVAL) -> None:
+        self.app = app
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self.bump_interval = bump_interval
+        self._bump_pending = False
+        self._last_bump = -math.inf
+        self._pending: dict[int, list[float]] = {}
+        self._pending_votes = 0
+        self._lock = threading.Lock()
+        # Serializes flushes, so a batch that failed is re-queued before the next is taken
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+        self._stats = {'submitted': 0, 'flushed': 0, 'flushes': 0, 'bumps': 0, 'errors': 0}
+
+    def submit(self, game_id: int, rating: float) -> None:
+        """Queues one vote; it is written within `flush_interval` seconds."""
+        with self._lock:
+            totals = self._pending.get(game_id)
+            if totals is None:
+                self._pending[game_id] = [rating, 1]
+            else:
+                totals[0] += rating
+                totals[1] += 1
+            self._pending_votes += 1
+            self._stats['submitted'] += 1
+            full = self._pending_votes >= self.max_pending
+            if self._thread is None and not self._stopping:
+                self._start()
+        if full:
+            self._wake.set()
+
+    def pending(self, game_id: int) -> tuple[float, int]:
+        """The (sum, count) of this game's votes not yet written."""
+        with self._lock:
+            vote_sum, vote_count = self._pending.get(game_id, (0.0, 0))
+            return vote_sum, int(vote_count)
+
+    def flush(self) -> int:
+        """Writes every pending vote in one transaction. Returns how many were written."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                votes, self._pending_votes = self._pending_votes, 0
+            if not batch:
+                return 0
+
+            try:
+                weight = trending_weight()
+                with self.app.app_context():
+                    db.session.execute(get_rating_flush_stmt(), [
+                        {'game_id': game_id, 'vote_sum': vote_sum, 'vote_count': vote_count, 'trending_weight': weight}
+                        for game_id, (vote_sum, vote_count) in batch.items()
+                    ])
+                    db.session.commit()
+            except Exception:
+                self.app.logger.exception("Writing %d rating votes failed; they stay queued", votes)
+                self._requeue(batch, votes)
+                with self._lock:
+                    self._stats['errors'] += 1
+                raise
+
+            with self._lock:
+                self._stats['flushed'] += votes
+                self._stats['flushes'] += 1
+            self._bump_pending = True
+            self._bump_catalog()
+            return votes
+
+    def _bump_catalog(self, force: bool = False) -> None:
+        # Called with self._flush_lock held
+        if not self._bump_pending or (not force and time.monotonic() - self._last_bump < self.bump_interval):
+            return
+        try:
+            with self.app.app_context():
+                bump_catalog_version()
+        except OSError:
+            # The votes are written; the bump is retried on the next round
+            self.app.logger.exception("Bumping the catalog version after rating votes failed")
+            return
+        self._bump_pending = False
+        self._last_bump = time.monotonic()
+        with self._lock:
+            self._stats['bumps'] += 1
+
+    def stop(self) -> None:
+        """Stops the flush thread and writes the remaining votes."""
+        with self._lock:
+            self._stopping = True
+            thread = self._thread
+        if thread is not None:
+            self._wake.set()
+            thread.join()
+        self.flush()
+        with self._flush_lock:
+            self._bump_catalog(force=True)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {**self._stats, 'pending': self._pending_votes}
+
+    def _requeue(self, batch: dict[int, list[float]], votes: int) -> None:
+        with self._lock:
+            for game_id, (vote_sum, vote_count) in batch.items():
+                totals = self._pending.setdefault(game_id, [0.0, 0])
+                totals[0] += vote_sum
+                totals[1] += vote_count
+            self._pending_votes += votes
+
+    def _start(self) -> None:
+        # Called with self._lock held, on the first vote
+        self._thread = threading.Thread(target=self._run, name='rating-queue', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._stopping:
+                break
+            try:
+                self.flush()
+            except Exception:
+                pass  # logged by flush; the votes are retried on the next round
+            with self._flush_lock:
+                self._bump_catalog()
+
+def init_rating_queue(app: Flask) -> RatingQueue:
+    """Creates the app's rating queue from its config. Its thread starts with the first vote."""
+    queue = RatingQueue(
+        app,
+        max_pending=app.config.get('RATING_QUEUE_MAX_PENDING', DEFAULT_MAX_PENDING),
+        flush_interval=app.config.get('RATING_QUEUE_FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL),
+        bump_interval=app.config.get('RATING_QUEUE_BUMP_INTERVAL', DEFAULT_BUMP_INTERVAL),
+    )
+    app.extensions[_EXTENSION_KEY] = queue
+    return queue
+
+def get_rating_queue() -> RatingQueue:
+    """Returns the current app's rating queue, created from its config on first use."""
+    queue = current_app.extensions.get(_EXTENSION_KEY)
+    if queue is None:
+        queue = init_rating_queue(current_app._get_current_object())
+    return queue
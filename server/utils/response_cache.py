@@ -0,0 +1,170 @@
+import json
+import threading
+from functools import wraps
+from typing import Any, Callable, NamedTuple
+from urllib.parse import urlencode
+from flask import Flask, Response, current_app, make_response, request
+from models import catalog_changed, get_catalog_version, get_catalog_version_ttl, use_shared_catalog_version
+from utils.compression import compress_response, negotiate_encoding
+from utils.cache_backends import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ENTRIES,
+    CacheBackend,
+    MemoryBackend,
+    create_cache_backend,
+)
+
+DEFAULT_TTL_SECONDS = 300.0
+
+_EXTENSION_KEY = 'response_cache'
+
+class CachedResponse(NamedTuple):
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+
+    def encode(self) -> bytes:
+        # JSON head line, then the raw body; never pickle data read back from
+        # a store other processes can write to
+        head = json.dumps([self.status, self.headers], separators=(',', ':')).encode('utf-8')
+        return head + b'\n' + self.body
+
+    @classmethod
+    def decode(cls, data: bytes) -> 'CachedResponse':
+        head, body = data.split(b'\n', 1)
+        status, headers = json.loads(head)
+        return cls(status, [tuple(header) for header in headers], body)
+
+class ResponseCache:
+    """
+    Serialized responses stored in a cache backend with a time-to-live, plus
+    this worker's hit/miss counters. Backend failures are counted and treated
+    as misses, so an unavailable cache server only costs the cache.
+    """
+
+    def __init__(self, backend: CacheBackend | None = None, ttl: float = DEFAULT_TTL_SECONDS) -> None:
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def record_error(self) -> None:
+        """Counts a backend failure that happened outside get and set."""
+        self._count('errors')
+
+    def get(self, key: str) -> CachedResponse | None:
+        try:
+            data = self.backend.get(key)
+        except OSError:
+            self._count('errors')
+            data = None
+        if data is None:
+            self._count('misses')
+            return None
+        self._count('hits')
+        return CachedResponse.decode(data)
+
+    def set(self, key: str, value: CachedResponse, ttl: float | None = None) -> None:
+        """Stores `value` for the cache's TTL, or for `ttl` seconds if that is shorter."""
+        try:
+            self.backend.set(key, value.encode(), self.ttl if ttl is None else min(ttl, self.ttl))
+        except OSError:
+            self._count('errors')
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            counters = {'hits': self.hits, 'misses': self.misses, 'errors': self.errors}
+        try:
+            backend_stats = self.backend.stats()
+        except OSError:
+            backend_stats = {}
+        return {'backend': type(self.backend).__name__, **counters, **backend_stats}
+
+def init_response_cache(app: Flask) -> ResponseCache:
+    """
+    Creates the app's response cache from its config. With a shared backend
+    the catalog version lives in the same store, so a write in any worker
+    moves every worker onto new cache keys.
+    """
+    config = app.config
+    backend = create_cache_backend(
+        config.get('CACHE_URL', 'memory://'),
+        max_entries=config.get('RESPONSE_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES),
+        max_bytes=config.get('RESPONSE_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES),
+    )
+    cache = ResponseCache(backend, ttl=config.get('RESPONSE_CACHE_TTL', DEFAULT_TTL_SECONDS))
+    app.extensions[_EXTENSION_KEY] = cache
+    if backend.shared:
+        use_shared_catalog_version(app, backend)
+    return cache
+
+def get_response_cache() -> ResponseCache:
+    """Returns the current app's response cache, created from its config on first use."""
+    cache = current_app.extensions.get(_EXTENSION_KEY)
+    if cache is None:
+        cache = init_response_cache(current_app._get_current_object())
+    return cache
+
+@catalog_changed.connect
+def _clear_on_catalog_change(app: Flask, **extra: Any) -> None:
+    # Entries for older versions are unreachable either way; dropping them
+    # frees memory now. Shared backends let them expire instead, since other
+    # workers' writes never reach this receiver.
+    cache = app.extensions.get(_EXTENSION_KEY)
+    if cache is not None and not cache.backend.shared:
+        cache.clear()
+
+def _cache_key(encoding: str | None) -> str:
+    query = urlencode(sorted(request.args.items(multi=True)))
+    return f'response:{get_catalog_version()}:{encoding or "identity"}:{request.path}?{query}'
+
+def cached_response(view: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Serves successful responses of a catalog GET endpoint from the response
+    cache, keyed by catalog version, content coding, path and query
+    arguments. Any committed write to games, categories or publishers moves
+    on to new keys. A per-process catalog version misses other workers'
+    writes, so entries keyed by one live at most `CATALOG_VERSION_TTL`
+    seconds. While a shared catalog version cannot be read, requests bypass
+    the cache.
+
+    Each coding is stored as sent: a body is compressed once, when its entry
+    is filled, rather than on every hit.
+    """
+    @wraps(view)
+    def wrapper(*args: Any, **kwargs: Any) -> Response:
+        if not current_app.config.get('RESPONSE_CACHE_ENABLED', True):
+            return make_response(view(*args, **kwargs))
+
+        cache = get_response_cache()
+        encoding = negotiate_encoding()
+        try:
+            key = _cache_key(encoding)
+        except OSError:
+            # The shared catalog version is unreachable, so no key is known
+            # to be current: bypass the cache for this request
+            cache.record_error()
+            return compress_response(make_response(view(*args, **kwargs)), encoding)
+        cached = cache.get(key)
+        if cached is not None:
+            response = current_app.response_class(cached.body, status=cached.status, headers=cached.headers)
+            response.headers['X-Cache'] = 'HIT'
+            return response
+
+        response = compress_response(make_response(view(*args, **kwargs)), encoding)
+        if response.status_code == 200 and not response.is_streamed:
+            cache.set(key, CachedResponse(response.status_code, list(response.headers.items()), response.get_data()),
+                      ttl=get_catalog_version_ttl())
+        response.headers['X-Cache'] = 'MISS'
+        return response
+
+    return wrapper
@@ -0,0 +1,33 @@
+import html
+import re
+
+# Longest free-text query accepted, in words; the rest are ignored
+MAX_SEARCH_TERMS = 8
+# Tokens of context around the first match in a description snippet
+SNIPPET_TOKENS = 16
+
+# Control characters FTS5 wraps around matched terms. They cannot occur in
+# escaped text, so the markup can be added after HTML-escaping the result.
+HIGHLIGHT_START = '\x02'
+HIGHLIGHT_END = '\x03'
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+def build_match_query(query: str) -> str:
+    """
+    Turns free text into an FTS5 query in which every word must match, as a
+    prefix (`pipe` finds "Pipeline"). Words are quoted, so FTS5 operators and
+    syntax characters in user input are matched literally.
+
+    Raises ValueError if the text holds no words.
+    """
+    words = _WORD_PATTERN.findall(query)[:MAX_SEARCH_TERMS]
+    if not words:
+        raise ValueError("Search query must contain at least one word")
+    return ' '.join(f'"{word}"*' for word in words)
+
+def render_highlight(text: str | None) -> str | None:
+    """HTML-escapes FTS5 output and marks the matched terms with <mark>."""
+    if text is None:
+        return None
+    return html.escape(text).replace(HIGHLIGHT_START, '<mark>').replace(HIGHLIGHT_END, '</mark>')
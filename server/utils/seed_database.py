@@ -1,110 +1,123 @@
+import argparse
 import csv
 import os
 import random
-from flask import Flask
-from sqlalchemy import select
-from models import db, Category, Game, Publisher
-from utils.database import get_connection_string
-
-def create_app():
-    """Create and configure Flask app for database operations"""
-    app = Flask(__name__)
-
-    # Configure and initialize the database
-    app.config['SQLALCHEMY_DATABASE_URI'] = get_connection_string()
-    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-    db.init_app(app)
-    
-    # Create tables
-    with app.app_context():
-        db.create_all()
-    
-    return app
+from itertools import islice
+from typing import Iterator
+from sqlalchemy import insert, select
+from models import db, Category, Game, Publisher, create_search_index
+from models.base import BaseModel
+from utils.migrations import (
+    create_missing_columns, create_missing_indexes, drop_obsolete_indexes, rebuild_autoincrement_tables,
+)
+
+DEFAULT_CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'seed_data', 'games.csv')
+
+# Rows read, validated and inserted per batch (and per commit)
+DEFAULT_CHUNK_SIZE = 5_000
+
+def _read_chunks(csv_path: str, chunk_size: int) -> Iterator[list[dict[str, str]]]:
+    """Stream the CSV as lists of at most `chunk_size` rows"""
+    with open(csv_path, mode='r', encoding='utf-8', newline='') as csv_file:
+        csv_reader = csv.DictReader(csv_file)
+        while chunk := list(islice(csv_reader, chunk_size)):
+            yield chunk
+
+def _insert_missing(model: type[Category] | type[Publisher], names: set[str], known: dict[str, int], description: str) -> int:
+    """Insert the names not yet in `known` and record their new ids. Returns the number inserted."""
+    missing = sorted(names - known.keys())
+    if not missing:
+        return 0
+
+    rows = [{'name': name, 'description': description.format(name=name)} for name in missing]
+    for name in missing:
+        BaseModel.validate_string_length(f'{model.__name__} name', name, min_length=2)
+    result = db.session.execute(insert(model).returning(model.name, model.id), rows)
+    known.update({name: id for name, id in result})
+    return len(missing)
+
+def import_games(csv_path: str = DEFAULT_CSV_PATH, chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict[str, int]:
+    """Bulk-import games, categories and publishers from a CSV file.
+
+    Existing categories, publishers and game titles are loaded with one query
+    each up front; the CSV is then streamed in chunks and each chunk is
+    written with executemany INSERTs. Rows whose title already exists are
+    skipped, so the import is idempotent. Must be called within an app context.
+    """
+    categories: dict[str, int] = dict(db.session.execute(select(Category.name, Category.id)).all())
+    publishers: dict[str, int] = dict(db.session.execute(select(Publisher.name, Publisher.id)).all())
+    existing_titles: set[str] = set(db.session.scalars(select(Game.title)))
+
+    stats = {'games_created': 0, 'games_skipped': 0, 'categories_created': 0, 'publishers_created': 0}
+    for chunk in _read_chunks(csv_path, chunk_size):
+        stats['categories_created'] += _insert_missing(
+            Category, {row['Category'] for row in chunk}, categories,
+            "Collection of {name} games available for crowdfunding",
+        )
+        stats['publishers_created'] += _insert_missing(
+            Publisher, {row['Publisher'] for row in chunk}, publishers,
+            "{name} is a game publisher seeking funding for exciting new titles",
+        )
+
+        games = []
+        for row in chunk:
+            title = row['Title']
+            if title in existing_titles:
+                stats['games_skipped'] += 1
+                continue
+            existing_titles.add(title)
+
+            # Bulk inserts bypass the model validators, so apply the same rules here
+            BaseModel.validate_string_length('Game title', title, min_length=2)
+            BaseModel.validate_string_length('Description', row['Description'], min_length=10)
+
+            games.append({
+                'title': title,
+                'description': row['Description'] + " Support this game through our crowdfunding platform!",
+                'category_id': categories[row['Category']],
+                'publisher_id': publishers[row['Publisher']],
+                # Random star rating between 3.0 and 5.0 (one decimal place)
+                'star_rating': round(random.uniform(3.0, 5.0), 1),
+            })
+
+        if games:
+            db.session.execute(insert(Game), games)
+            stats['games_created'] += len(games)
+        db.session.commit()
+
+    print(f"Created {stats['games_created']} games, {stats['categories_created']} categories, "
+          f"{stats['publishers_created']} publishers (skipped {stats['games_skipped']} existing games)")
+    return stats
+
+def init_database(csv_path: str = DEFAULT_CSV_PATH, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """Create missing tables and seed the catalog in the current app context"""
+    # Only the primary; a read replica receives the schema through replication
+    db.create_all(bind_key=None)
+    for column_name in create_missing_columns():
+        print(f"Added column {column_name}")
+    for table_name in rebuild_autoincrement_tables():
+        print(f"Rebuilt table {table_name} so deleted ids are never reused")
+    for index_name in create_missing_indexes():
+        print(f"Created index {index_name}")
+    for index_name in drop_obsolete_indexes():
+        print(f"Dropped index {index_name}")
+    with db.engine.begin() as connection:
+        if create_search_index(connection):
+            print("Created full-text search index")
+    import_games(csv_path, chunk_size)
+
+def seed_database(csv_path: str = DEFAULT_CSV_PATH, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """Run init_database in the full application, with its schema upgrades, pragmas and cache setup"""
+    # Imported here: app imports this module for its init-db command
+    from app import create_app
 
-def create_games():
-    """Create games, categories and publishers from CSV data for crowd funding platform"""
     app = create_app()
-    
     with app.app_context():
-        # Track which categories and publishers have been created
-        categories = {}  # name -> category object
-        publishers = {}  # name -> publisher object
-        
-        # Read the CSV file
-        csv_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 
-                              'seed_data', 'games.csv')
-        
-        games_created = 0
-        games_skipped = 0
-        categories_created = 0
-        publishers_created = 0
-        with open(csv_path, mode='r', encoding='utf-8') as csv_file:
-            csv_reader = csv.DictReader(csv_file)
-            
-            for row in csv_reader:
-                # Process category — query DB first for idempotency
-                category_name = row['Category']
-                if category_name not in categories:
-                    category = db.session.scalars(
-                        select(Category).filter_by(name=category_name)
-                    ).first()
-                    if not category:
-                        category_description = f"Collection of {category_name} games available for crowdfunding"
-                        category = Category(
-                            name=category_name,
-                            description=category_description
-                        )
-                        db.session.add(category)
-                        db.session.flush()  # Get ID without committing
-                        categories_created += 1
-                    categories[category_name] = category
-                
-                # Process publisher — query DB first for idempotency
-                publisher_name = row['Publisher']
-                if publisher_name not in publishers:
-                    publisher = db.session.scalars(
-                        select(Publisher).filter_by(name=publisher_name)
-                    ).first()
-                    if not publisher:
-                        publisher_description = f"{publisher_name} is a game publisher seeking funding for exciting new titles"
-                        publisher = Publisher(
-                            name=publisher_name,
-                            description=publisher_description
-                        )
-                        db.session.add(publisher)
-                        db.session.flush()  # Get ID without committing
-                        publishers_created += 1
-                    publishers[publisher_name] = publisher
-                
-                # Check if game already exists by title before creating
-                existing_game = db.session.scalars(
-                    select(Game).filter_by(title=row['Title'])
-                ).first()
-                if existing_game:
-                    games_skipped += 1
-                    continue
-                
-                # Generate random star rating between 3.0 and 5.0 (one decimal place)
-                star_rating = round(random.uniform(3.0, 5.0), 1)
-                
-                # Create the game with enhanced description for crowdfunding context
-                game = Game(
-                    title=row['Title'],
-                    description=row['Description'] + " Support this game through our crowdfunding platform!",
-                    category_id=categories[category_name].id,
-                    publisher_id=publishers[publisher_name].id,
-                    star_rating=star_rating,
-                )
-                db.session.add(game)
-                games_created += 1
-            
-            # Commit all changes at once
-            db.session.commit()
-            
-        print(f"Created {games_created} games, {categories_created} categories, {publishers_created} publishers (skipped {games_skipped} existing games)")
-
-def seed_database():
-    create_games()
+        init_database(csv_path, chunk_size)
 
 if __name__ == '__main__':
-    seed_database()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Import games from a CSV file (Title, Category, Publisher, Description).")
+    parser.add_argument('--csv', dest='csv_path', default=DEFAULT_CSV_PATH, help="CSV file to import (defaults to the bundled seed data)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="rows inserted per batch")
+    args = parser.parse_args()
+    seed_database(args.csv_path, args.chunk_size)
@@ -0,0 +1,72 @@
+import json
+import math
+from typing import Any, Iterable
+from flask import Response, current_app, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder produces the same bytes
+    orjson = None
+
+# Python writes floats outside this range in exponent form ('1e-05', '1e+16')
+# and orjson does not, so payloads holding them are encoded with the stdlib
+_PLAIN_FLOAT_RANGE = (1e-4, 1e16)
+
+if orjson is not None:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+def _is_plain_float(value: float) -> bool:
+    return value == 0 or (math.isfinite(value) and _PLAIN_FLOAT_RANGE[0] <= abs(value) < _PLAIN_FLOAT_RANGE[1])
+
+def _floats_match_stdlib(value: Any) -> bool:
+    if isinstance(value, float):
+        return _is_plain_float(value)
+    if isinstance(value, dict):
+        return all(_floats_match_stdlib(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return all(_floats_match_stdlib(item) for item in value)
+    return True
+
+def dumps_json(obj: Any, floats: Iterable[float | None] | None = None) -> bytes:
+    """
+    Encodes `obj` to the exact bytes `jsonify` writes with the default
+    provider (sorted keys, compact separators, ASCII-only), using orjson when
+    it is installed and its output is guaranteed to match.
+
+    Callers that know every float in `obj` (e.g. the star ratings of a page
+    of games) can pass them as `floats` to skip walking the whole payload.
+    """
+    if floats is not None:
+        plain_floats = all(value is None or _is_plain_float(value) for value in floats)
+    else:
+        plain_floats = orjson is not None and _floats_match_stdlib(obj)
+    if orjson is not None and plain_floats:
+        try:
+            # Types Flask's provider converts itself (dates, dataclasses, str
+            # subclasses) are passed through, so orjson raises on them
+            body = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            body = None
+        # orjson writes UTF-8 rather than \u escapes
+        if body is not None and body.isascii():
+            return body
+    return json.dumps(
+        obj, default=DefaultJSONProvider.default, ensure_ascii=True, sort_keys=True, separators=(',', ':')
+    ).encode('ascii')
+
+def _uses_default_encoding() -> bool:
+    provider = current_app.json
+    compact = provider.compact if provider.compact is not None else not current_app.debug
+    return type(provider) is DefaultJSONProvider and provider.sort_keys and provider.ensure_ascii and compact
+
+def json_response(obj: Any, floats: Iterable[float | None] | None = None) -> Response:
+    """Drop-in replacement for `jsonify(obj)` that encodes with `dumps_json`."""
+    if not _uses_default_encoding():
+        return jsonify(obj)
+    return current_app.response_class(dumps_json(obj, floats) + b'\n', mimetype=current_app.json.mimetype)
@@ -0,0 +1,241 @@
+import math
+import re
+import threading
+import time
+from flask import current_app
+from sqlalchemy import select
+from models import db, Game, catalog_view_expired, get_catalog_version
+
+try:
+    import numpy as np
+except ImportError:  # optional; /api/games/<id>/similar returns 501 without it
+    np = None
+
+_EXTENSION_KEY = 'similarity_index'
+_BUILD_LOCK_KEY = 'similarity_index_build_lock'
+
+DEFAULT_SIMILAR_GAMES = 6
+MAX_SIMILAR_GAMES = 50
+
+# How much each signal contributes to a similarity score (they sum to 1)
+TEXT_WEIGHT = 0.5
+CATEGORY_WEIGHT = 0.25
+PUBLISHER_WEIGHT = 0.1
+RATING_WEIGHT = 0.15
+
+MAX_STAR_RATING = 5.0
+
+# Descriptions read per query when changed games are re-tokenized
+_DESCRIPTION_BATCH_SIZE = 1_000
+
+_TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+_STOP_WORDS = frozenset(
+    'a an and are as at be but by for from has have in into is it its of on or '
+    'that the their them then they this to was were will with you your'.split()
+)
+
+def similarity_supported() -> bool:
+    """Similar games are scored with NumPy."""
+    return np is not None
+
+def _tokenize(text: str, vocabulary: dict[str, int]) -> tuple['np.ndarray', 'np.ndarray']:
+    """A description's term ids and sublinear term frequencies, adding new terms to `vocabulary`."""
+    counts: dict[int, int] = {}
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        if len(token) > 1 and token not in _STOP_WORDS:
+            term_id = vocabulary.setdefault(token, len(vocabulary))
+            counts[term_id] = counts.get(term_id, 0) + 1
+    term_ids = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+    term_freqs = np.fromiter((1.0 + math.log(count) for count in counts.values()), dtype=np.float64, count=len(counts))
+    return term_ids, term_freqs
+
+def _ranges(starts: 'np.ndarray', lengths: 'np.ndarray') -> 'np.ndarray':
+    """The indices of every range [start, start + length), concatenated, without a Python loop."""
+    offsets = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+    return offsets + np.arange(lengths.sum())
+
+class SimilarityIndex:
+    """
+    Every game as a row of an L2-normalized TF-IDF matrix over its
+    description, plus its category, publisher and rating as arrays, for one
+    catalog version. The matrix is stored sparse both by game (CSR) and by
+    term (CSC), so scoring one game against the catalog only touches the
+    postings of its own terms, in a few NumPy operations.
+
+    Rows are in no particular order; `order` sorts them by game id.
+    """
+
+    def __init__(self, version: int | None, columns: 'np.ndarray', row_lengths: 'np.ndarray',
+                 term_ids: 'np.ndarray', term_freqs: 'np.ndarray', vocabulary: dict[str, int]) -> None:
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.ids = columns[:, 0].astype(np.int64)
+        self.versions = columns[:, 1].astype(np.int64)
+        self.category_ids = columns[:, 2].astype(np.int64)
+        self.publisher_ids = columns[:, 3].astype(np.int64)
+        self.ratings = columns[:, 4]
+        self.order = np.argsort(self.ids)
+        self.sorted_ids = self.ids[self.order]
+        # Term frequencies before IDF, kept so the next build can reuse the
+        # rows of games that did not change
+        self.row_indptr = np.concatenate(([0], np.cumsum(row_lengths)))
+        self.term_ids = term_ids
+        self.term_freqs = term_freqs
+        self.vocabulary = vocabulary
+        self._build_weights(row_lengths)
+
+    @classmethod
+    def load(cls, version: int | None, previous: 'SimilarityIndex | None' = None) -> 'SimilarityIndex':
+        """
+        Reads the catalog's scoring columns in one query. Rows of games whose
+        row version is unchanged since `previous` are copied over as arrays;
+        only new and changed descriptions are read and tokenized.
+        """
+        rows = db.session.execute(
+            select(Game.id, Game.version, Game.category_id, Game.publisher_id, Game.star_rating).order_by(Game.id)
+        ).all()
+        # Unrated games (None) become NaN. Plain tuples convert far faster than Rows
+        columns = np.array([tuple(row) for row in rows], dtype=np.float64).reshape(-1, 5)
+        ids = columns[:, 0].astype(np.int64)
+        vocabulary = previous.vocabulary if previous is not None else {}
+
+        previous_rows = previous._rows_at(ids, columns[:, 1].astype(np.int64)) if previous is not None else np.full(len(ids), -1)
+        kept = previous_rows >= 0
+        if previous is not None:
+            kept_terms, kept_freqs, kept_lengths = previous._copy_rows(previous_rows[kept])
+        else:
+            kept_terms, kept_freqs, kept_lengths = np.zeros(0, np.int64), np.zeros(0), np.zeros(0, np.int64)
+
+        changed_ids = ids[~kept].tolist()
+        tokenized: dict[int, tuple['np.ndarray', 'np.ndarray']] = {}
+        for start in range(0, len(changed_ids), _DESCRIPTION_BATCH_SIZE):
+            batch = changed_ids[start:start + _DESCRIPTION_BATCH_SIZE]
+            for game_id, description in db.session.execute(select(Game.id, Game.description).where(Game.id.in_(batch))):
+                tokenized[game_id] = _tokenize(description or '', vocabulary)
+        # A game deleted between the two queries keeps an empty row until the next build
+        empty = (np.zeros(0, np.int64), np.zeros(0))
+        changed = [tokenized.get(game_id, empty) for game_id in changed_ids]
+
+        return cls(
+            version,
+            np.concatenate((columns[kept], columns[~kept])),
+            np.concatenate((kept_lengths, np.array([len(terms) for terms, _ in changed], dtype=np.int64))),
+            np.concatenate([kept_terms] + [terms for terms, _ in changed]),
+            np.concatenate([kept_freqs] + [freqs for _, freqs in changed]),
+            vocabulary,
+        )
+
+    def _rows_at(self, ids: 'np.ndarray', versions: 'np.ndarray') -> 'np.ndarray':
+        """The row of each game in this index if its version matches, else -1."""
+        if not len(self.sorted_ids):
+            return np.full(len(ids), -1)
+        positions = np.minimum(np.searchsorted(self.sorted_ids, ids), len(self.sorted_ids) - 1)
+        rows = self.order[positions]
+        return np.where((self.sorted_ids[positions] == ids) & (self.versions[rows] == versions), rows, -1)
+
+    def _copy_rows(self, rows: 'np.ndarray') -> tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+        """The term ids, term frequencies and lengths of the given rows, in that order."""
+        starts = self.row_indptr[rows]
+        lengths = self.row_indptr[rows + 1] - starts
+        entries = _ranges(starts, lengths)
+        return self.term_ids[entries], self.term_freqs[entries], lengths
+
+    def _build_weights(self, row_lengths: 'np.ndarray') -> None:
+        game_count = len(self.ids)
+        term_ids = self.term_ids
+        rows = np.repeat(np.arange(game_count), row_lengths)
+
+        # Smoothed IDF: terms in every description still count a little
+        term_count = len(self.vocabulary)
+        term_counts = np.bincount(term_ids, minlength=term_count)
+        idf = np.log((1.0 + game_count) / (1.0 + term_counts)) + 1.0
+        weights = self.term_freqs * idf[term_ids]
+        norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=game_count))
+        self.weights = weights / np.where(norms > 0, norms, 1.0)[rows]
+
+        # The same entries grouped by term: the postings list of each term
+        by_term = np.argsort(term_ids)
+        self.term_indptr = np.concatenate(([0], np.cumsum(term_counts)))
+        self.posting_rows = rows[by_term]
+        self.posting_weights = self.weights[by_term]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _position(self, game_id: int) -> int | None:
+        position = int(np.searchsorted(self.sorted_ids, game_id))
+        if position < len(self.sorted_ids) and self.sorted_ids[position] == game_id:
+            return int(self.order[position])
+        return None
+
+    def _text_scores(self, position: int) -> 'np.ndarray':
+        """Cosine similarity of one game's description to every game's."""
+        start, stop = self.row_indptr[position], self.row_indptr[position + 1]
+        query_terms, query_weights = self.term_ids[start:stop], self.weights[start:stop]
+        starts = self.term_indptr[query_terms]
+        lengths = self.term_indptr[query_terms + 1] - starts
+        postings = _ranges(starts, lengths)
+        return np.bincount(
+            self.posting_rows[postings],
+            weights=self.posting_weights[postings] * np.repeat(query_weights, lengths),
+            minlength=len(self.ids),
+        )
+
+    def similar(self, game_id: int, limit: int) -> list[tuple[int, float]] | None:
+        """
+        The `limit` games most similar to `game_id` as (id, score) pairs, best
+        first, or None if the game does not exist. Scores combine description
+        cosine similarity, a shared category or publisher and how close the
+        star ratings are, and range from 0 to 1.
+        """
+        position = self._position(game_id)
+        if position is None:
+            return None
+
+        scores = TEXT_WEIGHT * self._text_scores(position)
+        scores += CATEGORY_WEIGHT * (self.category_ids == self.category_ids[position])
+        scores += PUBLISHER_WEIGHT * (self.publisher_ids == self.publisher_ids[position])
+        # Unrated games (NaN) get no rating credit
+        rating_closeness = 1.0 - np.abs(self.ratings - self.ratings[position]) / MAX_STAR_RATING
+        scores += RATING_WEIGHT * np.nan_to_num(rating_closeness, nan=0.0)
+        scores[position] = -np.inf
+
+        limit = min(limit, len(self.ids) - 1)
+        if limit <= 0:
+            return []
+        best = np.argpartition(-scores, limit - 1)[:limit]
+        # Highest score first; ties go to the lower id
+        best = best[np.lexsort((self.ids[best], -scores[best]))]
+        return [(int(self.ids[i]), float(scores[i])) for i in best]
+
+def _is_current(index: SimilarityIndex | None, version: int | None) -> bool:
+    return index is not None and version in (index.version, None) and not catalog_view_expired(index.loaded_at)
+
+def get_similarity_index() -> SimilarityIndex:
+    """
+    Returns the similarity index for the current catalog version. After a
+    write the next request rebuilds it from the previous one, tokenizing
+    only the games that changed. A per-process catalog version misses other
+    workers' writes, so the index is then also rebuilt once it is
+    `CATALOG_VERSION_TTL` seconds old.
+    """
+    extensions = current_app.extensions
+    # Read the version before loading, so a write that lands mid-load leaves
+    # the new index already stale
+    try:
+        version = get_catalog_version()
+    except OSError:
+        # The shared catalog version is unreachable: keep serving the current
+        # index, or build one that the next readable version replaces
+        version = None
+    index: SimilarityIndex | None = extensions.get(_EXTENSION_KEY)
+    if _is_current(index, version):
+        return index
+
+    # One thread rebuilds; the others wait for it instead of loading in parallel
+    with extensions.setdefault(_BUILD_LOCK_KEY, threading.Lock()):
+        index = extensions.get(_EXTENSION_KEY)
+        if not _is_current(index, version):
+            index = SimilarityIndex.load(version, previous=index)
+            extensions[_EXTENSION_KEY] = index
+    return index